@@ -0,0 +1,66 @@
+"""
+Catalog cold start: disk snapshot vs full Gamma sync.
+
+Builds a synthetic catalog (default 20k markets), writes a snapshot, then
+measures time to the first answered search for a cold process that
+(a) restores the snapshot and (b) pages the catalog from a fake Gamma
+with a fixed per-page latency.
+
+Usage: python -m benchmarks.bench_catalog_snapshot [markets] [page_latency_ms]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fixtures import make_catalog
+from config import Config
+from core.catalog import MarketCatalog
+
+
+async def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 250) / 1000
+    events = make_catalog(n)
+    for event in events:
+        event['updatedAt'] = '2026-01-01T00:00:00Z'
+
+    async def fetch(url, params):
+        await asyncio.sleep(latency)
+        offset = params.get('offset', 0)
+        return events[offset:offset + params['limit']]
+
+    Config.CATALOG_SNAPSHOT_PATH = os.path.join(tempfile.mkdtemp(), 'catalog.snapshot')
+    print(f"📚 {len(events)} events • {Config.CATALOG_PAGE_SIZE}/page • {latency * 1000:.0f}ms/page\n")
+
+    # (b) Cold start without a snapshot: full sync, then first query
+    cold = MarketCatalog(fetch)
+    started = time.perf_counter()
+    await cold.full_sync()
+    hits = cold.search('warriors', 5)
+    full_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    await cold.save_snapshot()
+    save_seconds = time.perf_counter() - started
+    size = os.path.getsize(Config.CATALOG_SNAPSHOT_PATH)
+
+    # (a) Warm start: restore snapshot, then first query
+    warm = MarketCatalog(fetch)
+    started = time.perf_counter()
+    await warm.load_snapshot()
+    warm_hits = warm.search('warriors', 5)
+    snapshot_seconds = time.perf_counter() - started
+
+    assert [m['conditionId'] for m in warm_hits] == [m['conditionId'] for m in hits]
+    print(f"💾 Snapshot: {size / 1024 / 1024:.1f} MiB written in {save_seconds:.2f}s")
+    print(f"🧊 Full sync → first result:   {full_seconds:.2f}s")
+    print(f"🔥 Snapshot → first result:    {snapshot_seconds:.2f}s "
+          f"({full_seconds / snapshot_seconds:.1f}x faster, fresh={warm.is_fresh()})")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+"""
+JSON codec micro-benchmark.
+
+Times the decode paths the bot runs on every request against synthetic
+Gamma/CLOB payloads:
+  stdlib  - what resp.json() / json.loads did before (bytes → str → json)
+  codec   - core.json_codec.loads straight from bytes
+
+Usage: python -m benchmarks.bench_json_codec [events_per_page]
+"""
+
+import json
+import sys
+import timeit
+
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fixtures import make_events, make_markets, encode
+from core import json_codec
+
+
+def stdlib_resp_json(body: bytes):
+    return json.loads(body.decode('utf-8'))
+
+
+def payloads(n: int):
+    events = make_events(n)
+    markets = make_markets(n)
+    ws_tick = encode({
+        'type': 'price_update',
+        'asset_id': json.loads(events[0]['markets'][0]['clobTokenIds'])[0],
+        'price': '0.535',
+        'timestamp': 1760000000000
+    })
+    outcome_prices = [m['outcomePrices'] for e in events for m in e['markets']]
+
+    return [
+        (f"/events page ({n})", encode(events), 20),
+        (f"/markets page ({n})", encode(markets), 20),
+        ("WS price tick", ws_tick, 20000)
+    ], outcome_prices
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    cases, outcome_prices = payloads(n)
+
+    print(f"⚙️  Codec backend: {json_codec.BACKEND}\n")
+    print(f"{'payload':<22} {'size':>9} {'stdlib (µs)':>12} {'codec (µs)':>12} {'speedup':>8}")
+
+    for name, body, number in cases:
+        base = min(timeit.repeat(lambda: stdlib_resp_json(body), number=number, repeat=5)) / number
+        fast = min(timeit.repeat(lambda: json_codec.loads(body), number=number, repeat=5)) / number
+        print(f"{name:<22} {len(body):>9} {base * 1e6:>12.1f} {fast * 1e6:>12.1f} {base / fast:>7.1f}x")
+
+    def decode_prices(loads):
+        for s in outcome_prices:
+            loads(s)
+
+    number = 50
+    base = min(timeit.repeat(lambda: decode_prices(json.loads), number=number, repeat=5)) / number
+    fast = min(timeit.repeat(lambda: decode_prices(json_codec.loads), number=number, repeat=5)) / number
+    label = f"outcomePrices x{len(outcome_prices)}"
+    print(f"{label:<22} {'':>9} {base * 1e6:>12.1f} {fast * 1e6:>12.1f} {base / fast:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Streaming vs. whole-document decode of an /events page, through the client.
+
+Serves one page from a fake Gamma (chunked body, cold cache each run) and
+compares time-to-first-event, time to collect the first `take` events,
+body bytes actually sent, and peak traced memory for:
+  full   - _fetch_with_retry() decodes the whole page, then slice
+  stream - _stream_items(), stop after `take` (what discovery does)
+
+Usage: python -m benchmarks.bench_json_stream [events_per_page] [take]
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+from contextlib import aclosing
+from urllib.parse import urlsplit
+
+import httpx
+
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+from benchmarks.fixtures import make_events, encode
+from core.polymarket_client import PolymarketClient
+
+URL = f"{Config.POLYMARKET_GAMMA_URL}/events"
+CHUNK = 16 * 1024
+
+
+def make_client(body, sent):
+    async def handler(request):
+        async def chunks():
+            for i in range(0, len(body), CHUNK):
+                sent[0] += len(body[i:i + CHUNK])
+                await asyncio.sleep(0)  # Let the consumer run between chunks
+                yield body[i:i + CHUNK]
+        return httpx.Response(200, content=chunks())
+
+    client = PolymarketClient()
+    host = urlsplit(URL).netloc
+    client._http._clients[host] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def full(client, take):
+    start = time.perf_counter()
+    data = await client._fetch_with_retry(URL, params={"limit": 100})
+    return data[:take], time.perf_counter() - start
+
+
+async def stream(client, take):
+    out = []
+    first = None
+    start = time.perf_counter()
+    async with aclosing(client._stream_items(URL, params={"limit": 100})) as items:
+        async for item in items:
+            if first is None:
+                first = time.perf_counter() - start
+            out.append(item)
+            if len(out) >= take:
+                break
+    return out, first
+
+
+async def measure(fn, body, take, runs=5):
+    best_first = best_total = float('inf')
+    for _ in range(runs):
+        sent = [0]
+        client = make_client(body, sent)
+        start = time.perf_counter()
+        result, first = await fn(client, take)
+        best_total = min(best_total, time.perf_counter() - start)
+        best_first = min(best_first, first)
+        await client.close()
+
+    sent = [0]
+    client = make_client(body, sent)
+    tracemalloc.start()
+    await fn(client, take)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await client.close()
+
+    return len(result), best_first, best_total, sent[0], peak
+
+
+async def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    take = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+
+    body = encode(make_events(n))
+    print(f"📦 Page: {n} events, {len(body) / 1024:.0f} KiB, taking first {take}\n")
+    print(f"{'path':<8} {'items':>6} {'first (ms)':>11} {'total (ms)':>11} {'sent (KiB)':>11} {'peak (KiB)':>11}")
+
+    for name, fn in (('full', full), ('stream', stream)):
+        count, first, total, sent, peak = await measure(fn, body, take)
+        print(f"{name:<8} {count:>6} {first * 1000:>11.2f} {total * 1000:>11.2f} "
+              f"{sent / 1024:>11.0f} {peak / 1024:>11.0f}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+"""
+Market parsing throughput: unified MarketParser vs the old per-path code.
+
+Parses every market of a synthetic Gamma payload (default 2000 events)
+into SubMarkets: once cold, then repeatedly, as browsing does. Two
+payload shapes:
+markets with a `tokens` list, and plain Gamma /markets rows that only
+carry string-encoded outcomes/clobTokenIds/outcomePrices.
+
+Usage: python -m benchmarks.bench_market_parser [events] [rounds]
+"""
+
+import gc
+import json
+import sys
+import time
+
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fixtures import make_events
+from core import polymarket_client
+from core.market_parser import MarketParser
+from core.polymarket_client import PolymarketClient, SubMarket
+
+
+def legacy_sub_market(m):
+    """The copy-pasted parse from before (two next() scans + json.loads per market)."""
+    tokens = m.get('tokens', [])
+    yes_token = next((t for t in tokens if t.get('outcome', '').lower() == 'yes'), {})
+    no_token = next((t for t in tokens if t.get('outcome', '').lower() == 'no'), {})
+    yes_price = float(yes_token.get('price', 0.5))
+    no_price = float(no_token.get('price', 0.5))
+
+    outcome_prices = m.get('outcomePrices')
+    if outcome_prices and (yes_price == 0.5 or no_price == 0.5):
+        try:
+            prices = json.loads(outcome_prices) if isinstance(outcome_prices, str) else outcome_prices
+            if len(prices) >= 2:
+                yes_price = float(prices[0])
+                no_price = float(prices[1])
+        except Exception:
+            pass
+
+    return SubMarket(
+        condition_id=m.get('conditionId', m.get('id', '')),
+        question=m.get('question', ''),
+        yes_token_id=yes_token.get('token_id', ''),
+        no_token_id=no_token.get('token_id', ''),
+        yes_price=yes_price,
+        no_price=no_price,
+        group_item_title=m.get('groupItemTitle', '')
+    )
+
+
+def run(label, markets, rounds):
+    client = PolymarketClient()
+
+    def unified(m):
+        return client._build_sub_market(m, m.get('question', ''), m.get('groupItemTitle', ''))
+
+    results = {}
+    for name, parse in (('legacy', legacy_sub_market), ('unified', unified)):
+        polymarket_client.MARKET_PARSER = MarketParser()
+
+        started = time.perf_counter()
+        parsed = [parse(m) for m in markets]
+        cold = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(rounds):
+            parsed = [parse(m) for m in markets]
+        warm = (time.perf_counter() - started) / rounds
+        results[name] = (cold, warm, parsed)
+
+    print(f"📦 {label}")
+    for name, (cold, warm, parsed) in results.items():
+        missing = sum(1 for s in parsed if not s.yes_token_id and len(s.outcomes) <= 2)
+        multi = sum(1 for s in parsed if len(s.outcomes) > 2)
+        print(f"   {name:<8} first pass {len(markets) / cold:>9,.0f}/s • repeat {len(markets) / warm:>10,.0f}/s • "
+              f"{missing} without a YES token • {multi} multi-outcome")
+    print(f"   repeat speedup {results['legacy'][1] / results['unified'][1]:.1f}x\n")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    events = make_events(n)
+    markets = [m for e in events for m in e['markets']]
+    gc.freeze()  # Keep the fixture out of GC passes, like a long-lived catalog
+    print(f"📚 {len(markets)} markets × {rounds} rounds\n")
+
+    run("tokens list", markets, rounds)
+    stripped = [{k: v for k, v in m.items() if k != 'tokens'} for m in markets]
+    run("Gamma strings only", stripped, rounds)
+
+
+if __name__ == '__main__':
+    main()
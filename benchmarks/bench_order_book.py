@@ -0,0 +1,95 @@
+"""
+Local order book update throughput.
+
+Seeds books with N price levels per side (default 200), then applies
+random level changes (updates, inserts, removals) near the touch:
+(a) straight into OrderBookStore.delta,
+(b) as CLOB `price_change` messages through PriceWebSocketClient's
+    message handler (JSON decode + dispatch + book update + mid tick),
+and times depth-10 reads of a book, which is what the 📖 screen does.
+
+Usage: python -m benchmarks.bench_order_book [levels] [updates]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core import json_codec
+from core.order_book import OrderBookStore
+from core.ws_client import PriceWebSocketClient
+
+TOKENS = [f"tok{i}" for i in range(20)]
+
+
+def seed(store, levels):
+    ticks = [round(i / 1000, 3) for i in range(1, 1000)]
+    for token_id in TOKENS:
+        bids = [{'price': str(p), 'size': '100'} for p in ticks[499 - levels:499]]
+        asks = [{'price': str(p), 'size': '100'} for p in ticks[500:500 + levels]]
+        store.snapshot(token_id, bids, asks)
+
+
+def make_changes(n, levels, rng):
+    """(token, side, price, size): bids stay below 0.5, asks above, 10% removals."""
+    changes = []
+    for _ in range(n):
+        side = rng.choice(('BUY', 'SELL'))
+        offset = rng.randint(1, levels + 20) / 1000
+        price = round(0.5 - offset, 3) if side == 'BUY' else round(0.5 + offset, 3)
+        size = 0 if rng.random() < 0.1 else rng.randint(1, 500)
+        changes.append((rng.choice(TOKENS), side, price, size))
+    return changes
+
+
+async def main():
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    rng = random.Random(7)
+    changes = make_changes(n, levels, rng)
+    print(f"📖 {len(TOKENS)} books • {levels} levels/side • {n} updates\n")
+
+    # (a) Direct book updates
+    store = OrderBookStore()
+    seed(store, levels)
+    started = time.perf_counter()
+    for token_id, side, price, size in changes:
+        store.delta(token_id, ((side, price, size),))
+    seconds = time.perf_counter() - started
+    print(f"⚡ OrderBookStore.delta:     {n / seconds:>12,.0f} updates/s")
+
+    # (b) Full WebSocket message path
+    client = PriceWebSocketClient()
+    seed(client.books, levels)
+    messages = [
+        json_codec.dumps({
+            'event_type': 'price_change',
+            'asset_id': token_id,
+            'changes': [{'side': side, 'price': str(price), 'size': str(size)}],
+            'timestamp': '1700000000000'
+        })
+        for token_id, side, price, size in changes
+    ]
+    started = time.perf_counter()
+    for message in messages:
+        await client._handle_message(message)
+    seconds = time.perf_counter() - started
+    print(f"📡 price_change messages:    {n / seconds:>12,.0f} updates/s")
+
+    # Depth reads
+    reads = 100_000
+    started = time.perf_counter()
+    for i in range(reads):
+        store.levels(TOKENS[i % len(TOKENS)], 10)
+    seconds = time.perf_counter() - started
+    print(f"🔎 levels(depth=10):         {seconds / reads * 1e6:>12.2f} µs/read")
+
+    stats = store.get_stats()
+    print(f"\n{stats['synced']}/{stats['books']} books in sync • {stats['desyncs']} desyncs")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
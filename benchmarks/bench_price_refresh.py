@@ -0,0 +1,121 @@
+"""
+Price refresh wall time: batched get_quotes vs the old serial loop.
+
+Refreshes N tokens (default 50) against a fake CLOB with a fixed
+per-request latency, through the client's real HTTP pool, rate limiter
+and breakers:
+(a) the old refresh_prices - get_price() per token, one after another,
+(b) get_quotes via the bulk POST /books + /last-trades-prices,
+(c) get_quotes when the bulk endpoints are unavailable - the first
+    refresh pays for the failed POSTs, later ones skip straight to the
+    per-token GET /book fan-out.
+
+Usage: python -m benchmarks.bench_price_refresh [tokens] [latency_ms]
+"""
+
+import asyncio
+import os
+import sys
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+from core import json_codec
+from core.polymarket_client import PolymarketClient
+
+
+def fake_book(token_id):
+    mid = (int(token_id[-3:]) % 90 + 5) / 100
+    return {
+        'asset_id': token_id,
+        'bids': [{'price': f"{mid - 0.01:.2f}", 'size': '100'}, {'price': f"{mid - 0.02:.2f}", 'size': '250'}],
+        'asks': [{'price': f"{mid + 0.02:.2f}", 'size': '300'}, {'price': f"{mid + 0.01:.2f}", 'size': '120'}],
+        'last_trade_price': '0.42',
+    }
+
+
+def fake_clob(latency, requests, bulk=True):
+    async def handler(request):
+        await asyncio.sleep(latency)
+        path = request.url.path
+        requests[path] += 1
+
+        if request.method == 'POST':
+            if not bulk:
+                return httpx.Response(404)
+            ids = [row['token_id'] for row in json_codec.loads(request.content)]
+            if path == '/books':
+                return httpx.Response(200, json=[fake_book(t) for t in ids])
+            return httpx.Response(200, json=[{'token_id': t, 'price': '0.42', 'side': 'BUY'} for t in ids])
+
+        token_id = request.url.params['token_id']
+        book = fake_book(token_id)
+        if path == '/book':
+            return httpx.Response(200, json=book)
+        if path == '/last-trade-price':
+            return httpx.Response(200, json={'price': '0.42', 'side': 'BUY'})
+        if path == '/price':
+            return httpx.Response(200, json={'price': book['asks'][1]['price']})
+        if path == '/midpoint':
+            return httpx.Response(200, json={'mid': book['bids'][0]['price']})
+        return httpx.Response(404)
+
+    return handler
+
+
+def make_client(latency, requests, bulk=True):
+    client = PolymarketClient()
+    host = urlsplit(Config.POLYMARKET_CLOB_URL).netloc
+    client._http._clients[host] = httpx.AsyncClient(transport=httpx.MockTransport(fake_clob(latency, requests, bulk)))
+    return client
+
+
+async def legacy_refresh(client, token_ids):
+    """refresh_prices as it was: one hedged get_price per token, in sequence."""
+    prices = {}
+    for token_id in token_ids:
+        price = await client.get_price(token_id, refresh_from_clob=True)
+        if price > 0:
+            prices[token_id] = price
+    return prices
+
+
+async def timed(label, refresh, token_ids, requests):
+    requests.clear()
+    started = time.perf_counter()
+    result = await refresh(token_ids)
+    seconds = time.perf_counter() - started
+    print(f"{label:<34} {seconds * 1000:8.0f}ms  {sum(requests.values()):4d} requests  {len(result)} priced")
+    return seconds
+
+
+async def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 80) / 1000
+    token_ids = [f"{7100000000 + i * 37:d}" for i in range(n)]
+    print(f"💹 {n} tokens • {latency * 1000:.0f}ms/request • CLOB limit {Config.RATE_LIMIT_CLOB_RPS:.0f} req/s\n")
+
+    requests = Counter()
+    client = make_client(latency, requests)
+    serial = await timed("Serial get_price (before)", lambda ids: legacy_refresh(client, ids), token_ids, requests)
+    await client.close()
+
+    client = make_client(latency, requests)
+    batched = await timed("Bulk get_quotes", client.get_quotes, token_ids, requests)
+    await client.close()
+
+    client = make_client(latency, requests, bulk=False)
+    await timed("No bulk API, first refresh", client.get_quotes, token_ids, requests)
+    await asyncio.sleep(Config.RATE_LIMIT_BURST / Config.RATE_LIMIT_CLOB_RPS)  # Refreshes are periodic: let the bucket refill
+    fallback = await timed("No bulk API, later refreshes", client.get_quotes, token_ids, requests)
+    await client.close()
+
+    print(f"\n⚡ Bulk: {serial / batched:.1f}x faster • per-token fallback: {serial / fallback:.1f}x faster")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
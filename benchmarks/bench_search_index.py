@@ -0,0 +1,98 @@
+"""
+Local search index: build time, query latency and memory.
+
+Builds a SearchIndex over a synthetic catalog (default 50k markets) and
+times exact, multi-term, prefix and typo queries, compared with the
+linear all-terms scan the catalog used before.
+
+Usage: python -m benchmarks.bench_search_index [markets]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fixtures import make_catalog
+from core.search_index import SearchIndex
+
+
+def linear_search(docs, query, limit=10):
+    terms = query.lower().split()
+    hits = [d for d in docs if all(t in d[1] for t in terms)]
+    hits.sort(key=lambda d: d[2], reverse=True)
+    return [d[0] for d in hits[:limit]]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    events = make_catalog(n)
+    markets = [(m, e) for e in events for m in e['markets']]
+    print(f"📚 Catalog: {len(events)} events, {len(markets)} markets\n")
+
+    def build():
+        index = SearchIndex()
+        for m, e in markets:
+            index.add(m['conditionId'], (m['question'], m['groupItemTitle'], e['title']),
+                      m['description'], float(m['volume']))
+        index.search('warm up')  # sorts the vocabulary
+        return index
+
+    started = time.perf_counter()
+    index = build()
+    build_seconds = time.perf_counter() - started
+
+    # Memory in a separate pass - tracemalloc slows allocation-heavy code a lot
+    tracemalloc.start()
+    traced = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del traced
+
+    stats = index.get_stats()
+    print(f"🔨 Build: {build_seconds:.2f}s • {stats['terms']} terms • {stats['postings']} postings • "
+          f"{size / 1024 / 1024:.1f} MiB\n")
+
+    docs = [
+        (m['conditionId'], f"{m['question']} {m['groupItemTitle']} {e['title']} {m['description']}".lower(),
+         float(m['volume']))
+        for m, e in markets
+    ]
+    sample = markets[len(markets) // 3][0]['question'].split()
+    name = next(w for w in sample if w[:1].isupper() and len(w) > 4).strip('?:')
+
+    queries = [
+        ('exact', name.lower()),
+        ('two terms', f"{name.lower()} win"),
+        ('prefix', name.lower()[:4]),
+        ('typo', name.lower()[:-2] + name.lower()[-1] + name.lower()[-2]),
+        ('team', 'lakers'),
+        ('common', 'points')
+    ]
+
+    print(f"{'query':<10} {'text':<18} {'index (µs)':>11} {'scan (µs)':>11} {'hits':>5}")
+    for label, q in queries:
+        runs = 200
+        started = time.perf_counter()
+        for _ in range(runs):
+            hits = index.search(q, 10)
+        per_query = (time.perf_counter() - started) / runs
+
+        started = time.perf_counter()
+        linear_search(docs, q)
+        scan = time.perf_counter() - started
+
+        print(f"{label:<10} {q:<18} {per_query * 1e6:>11.0f} {scan * 1e6:>11.0f} {len(hits):>5}")
+
+    started = time.perf_counter()
+    for m, e in markets[:1000]:
+        index.remove(m['conditionId'])
+    for m, e in markets[:1000]:
+        index.add(m['conditionId'], (m['question'], m['groupItemTitle'], e['title']),
+                  m['description'], float(m['volume']))
+    print(f"\n♻️  Re-index 1000 markets: {(time.perf_counter() - started) * 1000:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Per-session memory of parsed events: plain vs slotted dataclasses.
+
+Simulates `users` sessions, each holding its own freshly decoded list of
+`per_user` events drawn from a catalog of `events` (as user_data['events']
+does after browsing), and measures retained memory with the old plain
+dataclasses and the current slotted/interned/packed ones.
+
+Note: fixture descriptions repeat one filler paragraph, so they compress
+far better than real Gamma text.
+
+Usage: python -m benchmarks.bench_session_memory [events] [users] [per_user]
+"""
+
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fixtures import make_events
+from core.polymarket_client import Event, SubMarket
+
+
+# The pre-slots definitions, for comparison
+@dataclass
+class PlainSubMarket:
+    condition_id: str
+    question: str
+    yes_token_id: str
+    no_token_id: str
+    yes_price: float
+    no_price: float
+    group_item_title: str = ""
+
+
+@dataclass
+class PlainEvent:
+    event_id: str
+    title: str
+    description: str
+    sport: str
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    markets: List[PlainSubMarket] = field(default_factory=list)
+
+
+def to_event(item, event_cls, sub_cls):
+    subs = []
+    for m in item['markets']:
+        tokens = m['tokens']
+        subs.append(sub_cls(
+            condition_id=m['conditionId'],
+            question=m['question'],
+            yes_token_id=tokens[0]['token_id'],
+            no_token_id=tokens[-1]['token_id'],
+            yes_price=tokens[0]['price'],
+            no_price=tokens[-1]['price'],
+            group_item_title=m['groupItemTitle']
+        ))
+    if event_cls is PlainEvent:
+        return PlainEvent(
+            event_id=item['id'],
+            title=item['title'],
+            description=item['description'],
+            sport=item['tags'][0]['slug'],
+            start_date=item['startDate'],
+            end_date=item['endDate'],
+            markets=subs
+        )
+    return event_cls(
+        event_id=item['id'],
+        title=item['title'],
+        sport=item['tags'][0]['slug'],
+        start_date=item['startDate'],
+        end_date=item['endDate'],
+        markets=tuple(subs),
+        _description=item['description']
+    )
+
+
+def measure(label, payloads, event_cls, sub_cls, users):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    # Each session decodes its own response, like separate Gamma/catalog fetches
+    sessions = [
+        [to_event(item, event_cls, sub_cls) for item in json.loads(payload)]
+        for payload in payloads
+    ]
+    seconds = time.perf_counter() - started
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    objects = sum(len(s) for s in sessions)
+    print(f"{label:<8} {size / 1024 / 1024:8.1f} MiB total • {size / users / 1024:7.1f} KiB/user • "
+          f"{size / objects:6.0f} B/event • build {seconds:.1f}s (traced)")
+    del sessions
+    return size
+
+
+def main():
+    n_events = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    users = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    per_user = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+    catalog = make_events(n_events)
+    rng = random.Random(3)
+    payloads = []
+    for _ in range(users):
+        start = rng.randrange(0, max(1, n_events - per_user))
+        payloads.append(json.dumps(catalog[start:start + per_user]).encode())
+    del catalog
+
+    print(f"👥 {users} sessions × {per_user} events from a {n_events}-event catalog\n")
+    plain = measure('plain', payloads, PlainEvent, PlainSubMarket, users)
+    slotted = measure('slotted', payloads, Event, SubMarket, users)
+    print(f"\n💾 {plain / slotted:.1f}x less session memory")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Sport keyword matching: compiled matcher vs substring scan.
+
+Classifies every market of a synthetic catalog (default 20k markets)
+with the old per-keyword `kw in text` loop and with SportMatcher, and
+lists texts the substring scan flags that the word-boundary matcher
+does not ('heat' in 'wheat', 'ipl' in 'triple').
+
+Usage: python -m benchmarks.bench_sport_matcher [markets]
+"""
+
+import sys
+import time
+
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fixtures import make_catalog
+from core.polymarket_client import SPORT_KEYWORDS, ALL_SPORT_KEYWORDS, SPORT_MATCHER
+
+# Non-sports questions that contain keywords inside other words
+DECOYS = [
+    "Will wheat futures close above $6 in March?",
+    "Will the triple witching day move the S&P 500?",
+    "Will the heatwave break records in Europe?",
+    "Will Nasdaq hit a new all-time high?",
+    "Will the Celtic tiger economy grow 3%?",
+    "Will the sinner's prayer trend on TikTok?",
+]
+
+
+def substring_detect(text):
+    lowered = text.lower()
+    for sport, keywords in SPORT_KEYWORDS.items():
+        if any(kw in lowered for kw in keywords):
+            return sport
+    return ''
+
+
+def substring_any(text):
+    lowered = text.lower()
+    return any(kw in lowered for kw in ALL_SPORT_KEYWORDS)
+
+
+def timed(fn, texts, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = [fn(t) for t in texts]
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    texts = [f"{m['question']} {m['description']}" for e in make_catalog(n) for m in e['markets']]
+    texts += DECOYS * max(1, len(texts) // 100)
+    print(f"📚 {len(texts)} texts, {len(ALL_SPORT_KEYWORDS)} keywords\n")
+
+    for label, old, new in (
+        ('any sport', substring_any, SPORT_MATCHER.matches),
+        ('detect', substring_detect, SPORT_MATCHER.detect),
+    ):
+        old_s, old_r = timed(old, texts)
+        new_s, new_r = timed(new, texts)
+        diff = sum(1 for a, b in zip(old_r, new_r) if a != b)
+        print(f"🔎 {label:<10} substring {old_s * 1e6 / len(texts):6.1f}µs/text • "
+              f"matcher {new_s * 1e6 / len(texts):6.1f}µs/text • "
+              f"{old_s / new_s:4.1f}x • {diff} differ")
+
+    print("\n🚫 Substring false positives:")
+    for text in DECOYS:
+        print(f"   {text!r}: substring={substring_detect(text) or '-'} matcher={SPORT_MATCHER.detect(text) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
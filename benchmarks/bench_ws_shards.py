@@ -0,0 +1,128 @@
+"""
+WebSocket pool throughput: 1 vs N shards against a local fake CLOB feed.
+
+A fake server (separate process) streams `price_update` events for the
+tokens each connection subscribed, in frames of 50 events. The client
+follows T tokens (default 2000) and counts the events it processes.
+Every shard count runs twice:
+- capped: each connection gets at most per_conn_rate events/s (default
+  10,000), like an upstream that limits every socket,
+- uncapped: the server sends as fast as it can, so the client's own
+  processing is the limit.
+Sharding only raises the capped number. All shards share one event loop,
+so it does not raise the uncapped one.
+
+Usage: python -m benchmarks.bench_ws_shards [tokens] [per_conn_rate] [seconds]
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+from core import json_codec
+from core.ws_client import PriceWebSocketClient
+
+PORT = 8799
+EVENTS_PER_FRAME = 50
+
+
+def serve(rate: float):
+    import websockets
+
+    async def handler(ws):
+        assets = []
+        frames = []
+        pace = EVENTS_PER_FRAME / rate if rate else 0
+
+        async def stream():
+            i = 0
+            while True:
+                if frames:
+                    await ws.send(frames[i % len(frames)])
+                    i += 1
+                if pace:
+                    await asyncio.sleep(pace)
+                elif i % 20 == 0:
+                    await asyncio.sleep(0)
+
+        sender = asyncio.ensure_future(stream())
+        try:
+            async for message in ws:
+                assets.extend(json_codec.loads(message).get('assets', []))
+                # Pre-encoded frames cycling through this connection's tokens
+                frames[:] = [
+                    json_codec.dumps([
+                        {'type': 'price_update', 'asset_id': assets[(f * EVENTS_PER_FRAME + e) % len(assets)],
+                         'price': f"0.{(f + e) % 90 + 10}"}
+                        for e in range(EVENTS_PER_FRAME)
+                    ])
+                    for f in range(max(1, len(assets) // EVENTS_PER_FRAME))
+                ]
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            sender.cancel()
+
+    async def main():
+        async with websockets.serve(handler, '127.0.0.1', PORT, max_queue=None):
+            await asyncio.Future()
+
+    asyncio.run(main())
+
+
+async def measure(shards: int, tokens, seconds: float) -> float:
+    client = PriceWebSocketClient(shards=shards)
+    client.WS_URL = f"ws://127.0.0.1:{PORT}"
+    await client.subscribe_many(tokens)
+    task = asyncio.ensure_future(client.connect())
+
+    # Warm up until every shard is connected and streaming
+    while not client.is_connected:
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(0.5)
+
+    before = sum(shard.messages for shard in client._shards)
+    started = time.perf_counter()
+    await asyncio.sleep(seconds)
+    frames = sum(shard.messages for shard in client._shards) - before
+    elapsed = time.perf_counter() - started
+
+    await client.disconnect()
+    task.cancel()
+    return frames * EVENTS_PER_FRAME / elapsed
+
+
+async def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 3
+    tokens = [f"{8100000000 + i * 53:d}" for i in range(n)]
+    Config.WS_SUBSCRIBE_DEBOUNCE = 0
+
+    print(f"📡 {n} tokens • {seconds:.0f}s per run\n")
+    results = {}
+    for cap in dict.fromkeys((rate, 0)):
+        server = multiprocessing.Process(target=serve, args=(cap,), daemon=True)
+        server.start()
+        await asyncio.sleep(1)
+        try:
+            results[cap] = [await measure(shards, tokens, seconds) for shards in (1, 2, 4)]
+        finally:
+            server.terminate()
+            server.join()
+
+    labels = [f"capped {cap:,.0f}/conn" if cap else "uncapped" for cap in results]
+    print(f"{'':<10}" + "".join(f"{label:>32}" for label in labels))
+    for i, shards in enumerate((1, 2, 4)):
+        cells = "".join(
+            f"{runs[i]:>16,.0f} events/s ({runs[i] / runs[0]:.1f}x)" for runs in results.values()
+        )
+        print(f"{shards} shard(s)" + cells)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,157 @@
+"""
+Synthetic Gamma-shaped payloads for benchmarks.
+
+Mirrors the fields the client reads from /events and /markets: nested
+markets, string-encoded outcomes/outcomePrices/clobTokenIds, tokens and
+long free-text descriptions. Deterministic for a given seed.
+"""
+
+import json
+import random
+from typing import Dict, List
+
+
+TEAMS = {
+    'cricket': ['India', 'Australia', 'England', 'Pakistan', 'Mumbai Indians', 'Chennai Super Kings'],
+    'football': ['Arsenal', 'Chelsea', 'Real Madrid', 'Barcelona', 'Bayern Munich', 'Inter Milan'],
+    'nba': ['Lakers', 'Celtics', 'Warriors', 'Bucks', 'Nuggets', 'Knicks'],
+    'tennis': ['Djokovic', 'Alcaraz', 'Sinner', 'Medvedev', 'Swiatek', 'Sabalenka'],
+    'ufc': ['Jones', 'Aspinall', 'Makhachev', 'Topuria', 'Pereira', 'Edwards'],
+    'politics': ['Senate', 'House', 'Governor', 'Mayor', 'Parliament', 'Referendum']
+}
+
+LEAGUES = {
+    'cricket': 'IPL T20',
+    'football': 'Premier League',
+    'nba': 'NBA',
+    'tennis': 'ATP Masters',
+    'ufc': 'UFC Fight Night',
+    'politics': 'Election'
+}
+
+FILLER = (
+    "This market will resolve according to the official result published by "
+    "the governing body. If the match is postponed or cancelled, the market "
+    "resolves 50-50. Extra time and super overs count where applicable. "
+)
+
+
+def _token_id(rng: random.Random) -> str:
+    return str(rng.getrandbits(250))
+
+
+def make_market(rng: random.Random, question: str, outcomes: List[str] = None) -> Dict:
+    outcomes = outcomes or ['Yes', 'No']
+    token_ids = [_token_id(rng) for _ in outcomes]
+    raw = [rng.random() for _ in outcomes]
+    prices = [f"{p / sum(raw):.3f}" for p in raw]
+
+    return {
+        'id': str(rng.randint(100000, 999999)),
+        'conditionId': '0x' + '%064x' % rng.getrandbits(256),
+        'question': question,
+        'groupItemTitle': question.split('?')[0][-40:],
+        'description': FILLER * rng.randint(2, 6),
+        'outcomes': json.dumps(outcomes),
+        'outcomePrices': json.dumps(prices),
+        'clobTokenIds': json.dumps(token_ids),
+        'tokens': [
+            {'token_id': t, 'outcome': o, 'price': float(p)}
+            for t, o, p in zip(token_ids, outcomes, prices)
+        ],
+        'volume': f"{rng.uniform(100, 5_000_000):.2f}",
+        'active': True,
+        'closed': False,
+        'endDate': '2026-12-31T00:00:00Z'
+    }
+
+
+def make_event(rng: random.Random, idx: int) -> Dict:
+    sport = rng.choice(list(TEAMS))
+    home, away = rng.sample(TEAMS[sport], 2)
+    title = f"{LEAGUES[sport]}: {home} vs {away}"
+    questions = [
+        f"Will {home} win?",
+        f"Will {away} win?",
+        f"Will the match go over the total? ({home} vs {away})",
+        f"Top scorer: {home} vs {away}?"
+    ][:rng.randint(1, 4)]
+
+    markets = [make_market(rng, q) for q in questions]
+    if rng.random() < 0.2:
+        markets.append(make_market(rng, f"Winner of {title}?", [home, 'Draw', away]))
+
+    return {
+        'id': str(100000 + idx),
+        'slug': f"{home}-vs-{away}-{idx}".lower().replace(' ', '-'),
+        'title': title,
+        'description': FILLER * rng.randint(3, 10),
+        'startDate': '2026-10-01T00:00:00Z',
+        'endDate': '2026-12-31T00:00:00Z',
+        'volume': rng.uniform(1000, 10_000_000),
+        'tags': [{'slug': sport}],
+        'series': [{'id': str(list(TEAMS).index(sport) + 1), 'title': LEAGUES[sport]}],
+        'updatedAt': f"2026-10-01T{idx // 3600 % 24:02d}:{idx // 60 % 60:02d}:{idx % 60:02d}Z",
+        'markets': markets
+    }
+
+
+def make_events(n: int, seed: int = 42) -> List[Dict]:
+    rng = random.Random(seed)
+    return [make_event(rng, i) for i in range(n)]
+
+
+def make_markets(n: int, seed: int = 42) -> List[Dict]:
+    """Flat /markets-style list (markets carry their event's sport in the question)."""
+    markets = []
+    for event in make_events((n + 1) // 2, seed):
+        for m in event['markets']:
+            m = dict(m, question=f"{event['title']} - {m['question']}")
+            markets.append(m)
+    return markets[:n]
+
+
+def encode(payload) -> bytes:
+    return json.dumps(payload).encode()
+
+
+def chunked(body: bytes, size: int = 16 * 1024):
+    """Split a body the way a socket read loop would hand it over."""
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+_SYLLABLES = ['ka', 'lo', 'mi', 'ra', 'to', 'ne', 'vi', 'su', 'de', 'an', 'jo', 'ri', 'ba', 'ze', 'qu', 'el']
+
+
+def _name(rng: random.Random) -> str:
+    return ''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+
+
+def make_catalog(n_markets: int, seed: int = 7) -> List[Dict]:
+    """
+    Events with ~n_markets markets total and a realistic-sized vocabulary
+    (synthetic player/team names), for search and classification benchmarks.
+    """
+    rng = random.Random(seed)
+    players = [_name(rng) for _ in range(max(100, n_markets // 5))]
+    events = []
+    total = 0
+    idx = 0
+
+    while total < n_markets:
+        event = make_event(rng, idx)
+        home, away = rng.sample(players, 2)
+        for m in event['markets']:
+            m['question'] = rng.choice([
+                f"Will {home} score over {rng.randint(10, 40)}.5 points vs {away}?",
+                f"{home} vs {away}: {m['question']}",
+                f"Will {home} beat {away} in {event['title']}?",
+                m['question']
+            ])
+            m['description'] = f"{home} and {away}. " + m['description']
+        events.append(event)
+        total += len(event['markets'])
+        idx += 1
+
+    return events
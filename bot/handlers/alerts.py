@@ -13,6 +13,23 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from core.alerts import get_alert_manager, AlertType
 from core.polymarket_client import get_polymarket_client
+from core.market_parser import is_yes_no
+
+
+async def _yes_token(update: Update, market) -> str:
+    """
+    The YES token an alert on `market` watches, or '' after telling the
+    user why there is none (markets with named outcomes have no YES side).
+    """
+    if is_yes_no(market.outcomes) and market.yes_token_id:
+        return market.yes_token_id
+    names = " / ".join(o.name for o in market.outcomes[:8]) or "none"
+    await update.message.reply_text(
+        f"❌ Alerts need a Yes/No market.\n\n"
+        f"📊 {market.question[:50]}\n"
+        f"Outcomes: {names}"
+    )
+    return ''
 
 
 async def alerts_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -106,13 +123,16 @@ async def alert_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     market = markets[0]
+    token_id = await _yes_token(update, market)
+    if not token_id:
+        return
     current_price = market.yes_price
     side = "above" if trigger_price > current_price else "below"
     
     manager = get_alert_manager()
     alert_id = await manager.add_alert(
         user_id=user_id,
-        token_id=market.yes_token_id,
+        token_id=token_id,
         market_question=market.question,
         alert_type=AlertType.PRICE_ALERT,
         trigger_price=trigger_price,
@@ -160,11 +180,14 @@ async def stoploss_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     market = markets[0]
+    token_id = await _yes_token(update, market)
+    if not token_id:
+        return
     
     manager = get_alert_manager()
     await manager.add_stop_loss(
         user_id=user_id,
-        token_id=market.yes_token_id,
+        token_id=token_id,
         market_question=market.question,
         stop_price=stop_price
     )
@@ -208,11 +231,14 @@ async def takeprofit_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return
     
     market = markets[0]
+    token_id = await _yes_token(update, market)
+    if not token_id:
+        return
     
     manager = get_alert_manager()
     await manager.add_take_profit(
         user_id=user_id,
-        token_id=market.yes_token_id,
+        token_id=token_id,
         market_question=market.question,
         target_price=target_price
     )
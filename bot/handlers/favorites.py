@@ -14,7 +14,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from core.polymarket_client import get_polymarket_client
 from core.favorites_db import get_favorites_db
-from bot.keyboards.inline import favorites_keyboard, outcome_keyboard
+from core.market_parser import is_yes_no
+from bot.keyboards.inline import favorites_keyboard, outcome_keyboard, outcome_prices_text
 
 
 async def favorites_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -79,7 +80,16 @@ async def fav_add_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     label = market.question[:50] if market else "Unknown"
-    token_id = market.yes_token_id if outcome == 'YES' else market.no_token_id
+    
+    # The selected outcome's own token; YES/NO only for plain Yes/No markets
+    if outcome.upper() in ('YES', 'NO') and is_yes_no(market.outcomes):
+        token_id = market.yes_token_id if outcome.upper() == 'YES' else market.no_token_id
+    else:
+        token_id = next((o.token_id for o in market.outcomes if o.name == outcome), '')
+    
+    if not token_id:
+        await query.answer("⚠️ Pick an outcome first, then add it to favorites", show_alert=True)
+        return
     
     db = await get_favorites_db()
     success = await db.add_favorite(
@@ -119,9 +129,8 @@ async def fav_view_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     context.user_data['selected_market'] = market
-    
-    yes_prob = market.yes_price * 100
-    no_prob = market.no_price * 100
+    context.user_data['selected_sub_market'] = market.to_sub_market()
+    context.user_data['selected_event'] = None
     
     text = f"""
 ⭐ <b>Favorite Market</b>
@@ -129,8 +138,7 @@ async def fav_view_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 📋 <b>{market.question}</b>
 
 💹 <b>Prices:</b>
-   ✅ YES: {yes_prob:.0f}¢
-   ❌ NO: {no_prob:.0f}¢
+{outcome_prices_text(market)}
 
 📈 <b>Volume:</b> ${market.volume:,.0f}
 
@@ -140,7 +148,7 @@ async def fav_view_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await query.edit_message_text(
         text,
         parse_mode='HTML',
-        reply_markup=outcome_keyboard()
+        reply_markup=outcome_keyboard(market.outcomes)
     )
 
 
@@ -23,6 +23,12 @@ from bot.keyboards.inline import (
 CUSTOM_SELL_PERCENT = 0
 
 
+async def _live_price(pos: Position) -> float:
+    """Position price for sell confirmation: fresh WebSocket tick, else REST, else last known."""
+    live = await get_polymarket_client().get_price(pos.token_id) if pos.token_id else 0.0
+    return live if live > 0 else pos.current_price
+
+
 async def positions_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /positions command - show all active positions."""
     client = get_polymarket_client()
@@ -152,8 +158,9 @@ async def sell_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await query.edit_message_text("⚠️ Position not found")
         return
     
-    sell_value = pos.value * (percent / 100)
+    price = await _live_price(pos)
     sell_shares = pos.size * (percent / 100)
+    sell_value = sell_shares * price
     
     context.user_data['sell_percent'] = percent
     
@@ -166,7 +173,7 @@ async def sell_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 💯 <b>Selling:</b> {percent}%
 📦 <b>Shares:</b> {sell_shares:.2f}
 💵 <b>Est. Value:</b> ${sell_value:.2f}
-📍 <b>Current Price:</b> ${pos.current_price:.4f}
+📍 <b>Current Price:</b> ${price:.4f}
 
 <i>This is a market order (instant execution)</i>
 """
@@ -243,8 +250,9 @@ async def custom_sell_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
             await update.message.reply_text("⚠️ Position not found. Use /positions again.")
             return ConversationHandler.END
         
-        sell_value = pos.value * (percent / 100)
+        price = await _live_price(pos)
         sell_shares = pos.size * (percent / 100)
+        sell_value = sell_shares * price
         
         context.user_data['sell_percent'] = percent
         
@@ -13,7 +13,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from config import Config
 from core.polymarket_client import get_polymarket_client
-from bot.keyboards.inline import search_results_keyboard, outcome_keyboard, search_prompt_keyboard
+from core.pagination import get_pager_registry
+from bot.keyboards.inline import (
+    search_results_keyboard, outcome_keyboard, outcome_prices_text, search_prompt_keyboard
+)
 
 
 # Conversation states
@@ -49,6 +52,7 @@ async def search_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
     
+    await get_pager_registry().close(update.effective_user.id, 'markets')
     context.user_data['markets'] = markets
     context.user_data['search_query'] = query
     
@@ -108,6 +112,7 @@ async def search_text_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return ConversationHandler.END
     
+    await get_pager_registry().close(update.effective_user.id, 'markets')
     context.user_data['markets'] = markets
     context.user_data['search_query'] = query
     
@@ -150,9 +155,8 @@ async def info_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     market = markets[0]
     context.user_data['selected_market'] = market
-    
-    yes_prob = market.yes_price * 100
-    no_prob = market.no_price * 100
+    context.user_data['selected_sub_market'] = market.to_sub_market()
+    context.user_data['selected_event'] = None
     
     text = f"""
 📊 <b>Market Details</b>
@@ -160,8 +164,7 @@ async def info_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 📋 <b>{market.question}</b>
 
 💹 <b>Prices:</b>
-   ✅ YES: {yes_prob:.0f}¢
-   ❌ NO: {no_prob:.0f}¢
+{outcome_prices_text(market)}
 
 📈 <b>Volume:</b> ${market.volume:,.0f}
 🏷️ <b>Category:</b> {market.category}
@@ -172,7 +175,7 @@ async def info_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text(
         text,
         parse_mode='HTML',
-        reply_markup=outcome_keyboard()
+        reply_markup=outcome_keyboard(market.outcomes)
     )
 
 
@@ -192,6 +195,7 @@ async def hot_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     # Sort by volume
     markets.sort(key=lambda m: m.volume, reverse=True)
+    await get_pager_registry().close(update.effective_user.id, 'markets')
     context.user_data['markets'] = markets
     
     text = "🔥 <b>Trending Markets</b>\n\n"
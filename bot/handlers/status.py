@@ -0,0 +1,143 @@
+"""
+Status Handlers
+
+Handles /status - transport health for operators (circuit breakers,
+cache, request coalescing, sport classification, rate limits, price
+sources, WebSocket price feed and local order books).
+"""
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from config import Config
+from core.polymarket_client import get_polymarket_client
+
+
+BREAKER_EMOJIS = {
+    'closed': '🟢',
+    'half_open': '🟡',
+    'open': '🔴'
+}
+
+
+def format_status(stats: dict) -> str:
+    """Render get_transport_stats() as an HTML message."""
+    lines = ["🩺 <b>API Status</b>", "", "<b>Circuit Breakers:</b>"]
+    
+    breakers = stats.get('breakers', {})
+    if not breakers:
+        lines.append("• No calls yet")
+    for name, b in breakers.items():
+        emoji = BREAKER_EMOJIS.get(b['state'], '⚪')
+        line = f"{emoji} <code>{name}</code> - {b['state'].replace('_', '-')}"
+        if 'retry_in' in b:
+            line += f" (retry in {b['retry_in']:.0f}s)"
+        if b['trips']:
+            line += f" • trips {b['trips']}, rejected {b['rejected']}"
+        lines.append(line)
+    
+    cache = stats.get('cache', {})
+    flights = stats.get('singleflight', {})
+    lines += [
+        "",
+        "<b>Cache:</b> "
+        f"{cache.get('entries', 0)} entries • "
+        f"{cache.get('hits', 0)} hits / {cache.get('stale_hits', 0)} stale / {cache.get('misses', 0)} misses",
+        "<b>Coalesced:</b> "
+        f"{flights.get('deduplicated', 0)} of {flights.get('calls', 0)} calls"
+    ]
+    
+    classification = stats.get('classification', {})
+    if classification.get('hits', 0) + classification.get('misses', 0):
+        lines.append(
+            f"<b>Classification:</b> {classification['hit_ratio']:.0%} hit rate • "
+            f"{classification['entries']} cached • {classification['evictions']} evicted"
+        )
+    
+    catalog = stats.get('catalog', {})
+    if catalog.get('ready'):
+        freshness = "🟢 fresh" if catalog['fresh'] else "🟡 stale"
+        lines.append(
+            f"<b>Catalog:</b> {catalog['events']} events • {catalog['markets']} markets • "
+            f"{freshness} ({catalog['age']:.0f}s old)"
+        )
+    elif catalog:
+        lines.append("<b>Catalog:</b> ⏳ syncing")
+    
+    feed = stats.get('price_feed', {})
+    if feed.get('running'):
+        shards = len(feed['shards'])
+        if feed['connected']:
+            state = '🟢 connected'
+        elif feed['connected_shards']:
+            state = '🟡 partly connected'
+        else:
+            state = '🔴 reconnecting'
+        if shards > 1:
+            state += f" ({feed['connected_shards']}/{shards} shards)"
+        line = (
+            f"<b>Price Feed:</b> {state} • "
+            f"{feed['subscribed']} tokens • {feed['hit_ratio']:.0%} WS hit rate "
+            f"({feed['hits']} hits / {feed['stale']} stale / {feed['misses']} misses)"
+        )
+        if feed['tick_age_p50_ms'] is not None:
+            line += f" • tick age p50 {feed['tick_age_p50_ms']:.0f}ms / p95 {feed['tick_age_p95_ms']:.0f}ms"
+        if feed['feed_lag_p50_ms'] is not None:
+            line += f" • feed lag p50 {feed['feed_lag_p50_ms']:.0f}ms"
+        lines.append(line)
+        subs = stats.get('subscriptions', {})
+        if subs.get('tokens'):
+            lines.append(
+                f"<b>Following:</b> {subs['held']} tokens for {subs['holders']} holders • "
+                f"{subs['idle']} idle • {subs['subscribes']} subscribed / {subs['unsubscribes']} dropped"
+            )
+        for name, c in feed.get('consumers', {}).items():
+            lines.append(
+                f"• <code>{name}</code> queue {c['depth']} (max {c['max_depth']}) • "
+                f"{c['delivered']} delivered • {c['coalesced']} coalesced • {c['dropped']} dropped • "
+                f"{c['errors']} errors"
+            )
+        books = feed.get('books', {})
+        if books.get('books'):
+            lines.append(
+                f"<b>Order Books:</b> {books['synced']}/{books['books']} in sync • "
+                f"{books['deltas']} deltas • {books['dropped']} dropped • {books['desyncs']} resyncs"
+            )
+    
+    limits = stats.get('rate_limits', {})
+    if limits:
+        lines += ["", "<b>Rate Limits:</b>"]
+        for host, b in limits.items():
+            line = f"• <code>{host}</code> {b['rate']} req/s • throttled {b['throttled']}"
+            if b['blocked_for']:
+                line += f" • paused {b['blocked_for']:.1f}s"
+            lines.append(line)
+    
+    prices = stats.get('price_sources', {})
+    if prices.get('sources'):
+        lines += ["", f"<b>Price Sources:</b> ({prices['hedges']} hedges)"]
+        for name, s in prices['sources'].items():
+            lines.append(f"• {name}: p50 {s['p50_ms']}ms • p95 {s['p95_ms']}ms • wins {s['wins']}")
+    
+    startup = stats.get('startup', {})
+    if startup:
+        lines += ["", "<b>Startup:</b> " + " • ".join(
+            f"{name.replace('_', ' ')} {secs:.2f}s" for name, secs in startup.items()
+        )]
+    
+    return "\n".join(lines)
+
+
+async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /status command - show API health to the operator."""
+    if Config.TELEGRAM_CHAT_ID and str(update.effective_chat.id) != str(Config.TELEGRAM_CHAT_ID):
+        return
+    
+    client = get_polymarket_client()
+    text = format_status(client.get_transport_stats())
+    
+    await update.message.reply_text(text, parse_mode='HTML')
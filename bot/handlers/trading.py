@@ -5,6 +5,8 @@ Handles /buy command with EVENT-based sports navigation.
 Shows: Sport → Events (matches) → Sub-Markets (toss, top scorer, etc.) → Yes/No
 """
 
+from typing import Optional
+
 from telegram import Update
 from telegram.ext import ContextTypes, ConversationHandler
 
@@ -14,10 +16,14 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from config import Config
 from core.polymarket_client import get_polymarket_client
+from core.pagination import Pager, get_pager_registry
+from core.market_parser import is_yes_no
+from core.subscriptions import get_subscription_manager
 from bot.keyboards.inline import (
     category_keyboard, sports_keyboard, leagues_keyboard, events_keyboard,
     sub_markets_keyboard, outcome_keyboard, amount_keyboard,
-    buy_confirm_keyboard, markets_keyboard
+    buy_confirm_keyboard, markets_keyboard, outcome_prices_text,
+    EVENTS_PER_PAGE, MARKETS_PER_PAGE
 )
 
 
@@ -25,6 +31,65 @@ from bot.keyboards.inline import (
 CUSTOM_AMOUNT = 0
 
 
+async def _open_pager(update: Update, context: ContextTypes.DEFAULT_TYPE, key: str, fetch, page_size: int) -> Pager:
+    """
+    Load the first page of a listing into user_data and prefetch the next.
+    
+    user_data[key] is the pager's growing item list, so index-based
+    callbacks (evt_N, mkt_N) keep working as more pages load. The pager
+    itself is kept in the pager registry, which closes the user's
+    previous pager for this listing.
+    """
+    pager = await get_pager_registry().open(update.effective_user.id, key, Pager(fetch, page_size))
+    await pager.page(0)
+    pager.prefetch(0)
+    context.user_data[key] = pager.items
+    context.user_data[f'{key}_page'] = 0
+    return pager
+
+
+async def _live_price(context: ContextTypes.DEFAULT_TYPE) -> float:
+    """
+    Current price of the selected token for confirmation screens: a fresh
+    WebSocket tick, else REST. Keeps the listed price if neither answers.
+    """
+    price = context.user_data.get('selected_price', 0.5)
+    token_id = context.user_data.get('selected_token_id')
+    if token_id:
+        live = await get_polymarket_client().get_price(token_id)
+        if live > 0:
+            price = context.user_data['selected_price'] = live
+    return price
+
+
+async def _follow_view(update: Update, sub_markets) -> None:
+    """
+    Point this user's price-feed interest at the sub-markets on screen.
+    Replaces the user's previous view; expires after WS_VIEW_TTL.
+    """
+    if not Config.WS_PRICES_ENABLED:
+        return
+    tokens = set()
+    for sub in sub_markets:
+        tokens.update(o.token_id for o in sub.outcomes)
+        tokens.update((sub.yes_token_id, sub.no_token_id))
+    await get_subscription_manager().hold(('view', update.effective_user.id), tokens, ttl=Config.WS_VIEW_TTL)
+
+
+async def _turn_page(update: Update, context: ContextTypes.DEFAULT_TYPE, key: str, page: int) -> Optional[Pager]:
+    """Load a page of a stored listing and prefetch the one after it."""
+    pager = get_pager_registry().get(update.effective_user.id, key)
+    context.user_data[f'{key}_page'] = page
+    
+    # Ignore a pager left over from an earlier listing (e.g. /search replaced it)
+    if pager is not None and pager.items is not context.user_data.get(key):
+        pager = None
+    if pager is not None:
+        await pager.page(page)
+        pager.prefetch(page)
+    return pager
+
+
 async def buy_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /buy command - start buy flow."""
     text = """
@@ -70,8 +135,12 @@ Choose a sport to see available matches:
         # For non-sports, search directly
         client = get_polymarket_client()
         cat_query = 'entertainment' if category == 'ent' else category
-        markets = await client.search_markets(cat_query, limit=15)
-        context.user_data['markets'] = markets
+        pager = await _open_pager(
+            update, context, 'markets',
+            lambda cursor, limit: client.search_markets_page(cat_query, limit, cursor),
+            MARKETS_PER_PAGE
+        )
+        markets = pager.items
         
         if not markets:
             await query.edit_message_text(
@@ -83,7 +152,7 @@ Choose a sport to see available matches:
         text = f"""
 📊 <b>{category.title()} Markets</b>
 
-Found {len(markets)} markets:
+Found {pager.total_label} markets:
 """
         await query.edit_message_text(
             text,
@@ -123,20 +192,25 @@ Found {len(leagues)} leagues/tournaments:
         )
     else:
         # No leagues found (e.g., UFC uses tags) — fall back to all events
-        events = await client.get_sports_events(sport=sport, limit=15)
-        context.user_data['events'] = events
+        pager = await _open_pager(
+            update, context, 'events',
+            lambda cursor, limit: client.get_sports_events_page(sport, limit, cursor),
+            EVENTS_PER_PAGE
+        )
+        events = pager.items
         
         if not events:
-            await query.edit_message_text(
-                f"📭 No active {sport.upper()} events found.\n\nTry /search {sport}",
-                reply_markup=sports_keyboard()
-            )
+            if client.is_degraded('gamma'):
+                text = "⚠️ Polymarket API is temporarily unavailable.\n\nPlease try again shortly."
+            else:
+                text = f"📭 No active {sport.upper()} events found.\n\nTry /search {sport}"
+            await query.edit_message_text(text, reply_markup=sports_keyboard())
             return
         
         text = f"""
 {sport_emoji} <b>{sport.upper()} Events</b>
 
-Found {len(events)} active matches/events:
+Found {pager.total_label} active matches/events:
 
 <i>Tap an event to see betting options</i>
 """
@@ -161,7 +235,7 @@ async def league_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     if league_key == 'all':
         # "All Events" — fetch without league filter
-        events = await client.get_sports_events(sport=sport, limit=15)
+        fetch = lambda cursor, limit: client.get_sports_events_page(sport, limit, cursor)
         league_name = f"All {sport.upper()}"
     else:
         # Fetch events for specific league
@@ -174,18 +248,19 @@ async def league_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         
         league = leagues[idx]
         league_name = league.name
-        events = await client.get_events_by_league(
-            series_id=league.series_id,
-            sport=sport,
-            limit=15
-        )
+        fetch = lambda cursor, limit: client.get_events_by_league_page(league.series_id, sport, limit, cursor)
     
-    context.user_data['events'] = events
+    pager = await _open_pager(update, context, 'events', fetch, EVENTS_PER_PAGE)
+    events = pager.items
     context.user_data['selected_league_name'] = league_name
     
     if not events:
+        if client.is_degraded('gamma'):
+            text = "⚠️ Polymarket API is temporarily unavailable.\n\nPlease try again shortly."
+        else:
+            text = f"📭 No active events in <b>{league_name}</b>.\n\nTry another league or /search {sport}"
         await query.edit_message_text(
-            f"📭 No active events in <b>{league_name}</b>.\n\nTry another league or /search {sport}",
+            text,
             parse_mode='HTML',
             reply_markup=leagues_keyboard(context.user_data.get('leagues', []), sport)
         )
@@ -194,7 +269,7 @@ async def league_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     text = f"""
 {sport_emoji} <b>{league_name}</b>
 
-Found {len(events)} active matches:
+Found {pager.total_label} active matches:
 
 <i>Tap an event to see betting options</i>
 """
@@ -212,14 +287,16 @@ async def events_page_callback(update: Update, context: ContextTypes.DEFAULT_TYP
     await query.answer()
     
     page = int(query.data.split('_')[1])  # evp_1 -> 1
+    pager = await _turn_page(update, context, 'events', page)
     events = context.user_data.get('events', [])
     sport = context.user_data.get('sport', 'sports')
     sport_emoji = Config.get_sport_emoji(sport)
+    total = pager.total_label if pager else len(events)
     
     text = f"""
 {sport_emoji} <b>{sport.upper()} Events</b>
 
-Found {len(events)} active matches (Page {page + 1}):
+Found {total} active matches (Page {page + 1}):
 """
     
     await query.edit_message_text(
@@ -255,6 +332,8 @@ async def event_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
     
+    await _follow_view(update, sub_markets)
+    
     text = f"""
 📊 <b>{event.title}</b>
 
@@ -295,10 +374,7 @@ async def sub_market_callback(update: Update, context: ContextTypes.DEFAULT_TYPE
     sub = sub_markets[sub_idx]
     context.user_data['selected_sub_market'] = sub
     context.user_data['selected_market'] = sub  # Legacy compatibility
-    
-    # Calculate implied probabilities
-    yes_prob = sub.yes_price * 100
-    no_prob = sub.no_price * 100
+    await _follow_view(update, [sub])
     
     text = f"""
 📊 <b>Market Details</b>
@@ -307,8 +383,7 @@ async def sub_market_callback(update: Update, context: ContextTypes.DEFAULT_TYPE
 🎯 <b>{sub.group_item_title or sub.question}</b>
 
 💹 <b>Prices:</b>
-   ✅ YES: {yes_prob:.0f}¢ (${sub.yes_price:.2f})
-   ❌ NO: {no_prob:.0f}¢ (${sub.no_price:.2f})
+{outcome_prices_text(sub)}
 
 <b>Select your position:</b>
 """
@@ -316,7 +391,7 @@ async def sub_market_callback(update: Update, context: ContextTypes.DEFAULT_TYPE
     await query.edit_message_text(
         text,
         parse_mode='HTML',
-        reply_markup=outcome_keyboard()
+        reply_markup=outcome_keyboard(sub.outcomes)
     )
 
 
@@ -326,6 +401,7 @@ async def back_events_callback(update: Update, context: ContextTypes.DEFAULT_TYP
     await query.answer()
     
     events = context.user_data.get('events', [])
+    page = context.user_data.get('events_page', 0)
     sport = context.user_data.get('sport', 'sports')
     sport_emoji = Config.get_sport_emoji(sport)
     
@@ -338,7 +414,7 @@ Found {len(events)} active matches:
     await query.edit_message_text(
         text,
         parse_mode='HTML',
-        reply_markup=events_keyboard(events)
+        reply_markup=events_keyboard(events, page=page)
     )
 
 
@@ -368,11 +444,11 @@ async def back_sub_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def outcome_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Handle outcome selection (Yes/No) - show amount options."""
+    """Handle outcome selection (Yes/No or outcome index) - show amount options."""
     query = update.callback_query
     await query.answer()
     
-    outcome = query.data.split('_')[1].upper()  # out_yes -> YES
+    outcome = query.data.split('_')[1].upper()  # out_yes -> YES, out_2 -> 2
     
     sub = context.user_data.get('selected_sub_market')
     if not sub:
@@ -380,13 +456,28 @@ async def outcome_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     # Get the correct token and price
-    if outcome == 'YES':
+    if outcome.isdigit():
+        idx = int(outcome)
+        if idx >= len(sub.outcomes):
+            await query.edit_message_text("⚠️ Outcome not found. Start over with /buy")
+            return
+        token_id = sub.outcomes[idx].token_id
+        price = sub.outcomes[idx].price
+        outcome = sub.outcomes[idx].name
+    elif not is_yes_no(sub.outcomes):
+        token_id = ''  # Stale YES/NO button for a market with named outcomes
+        price = 0
+    elif outcome == 'YES':
         token_id = sub.yes_token_id
         price = sub.yes_price
     else:
         token_id = sub.no_token_id
         price = sub.no_price
     
+    if not token_id:
+        await query.edit_message_text("⚠️ This outcome isn't tradeable. Start over with /buy")
+        return
+    
     context.user_data['selected_token_id'] = token_id
     context.user_data['selected_outcome'] = outcome
     context.user_data['selected_price'] = price
@@ -423,9 +514,6 @@ async def back_out_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await buy_command(update, context)
         return
     
-    yes_prob = sub.yes_price * 100
-    no_prob = sub.no_price * 100
-    
     event_title = event.title if event else sub.question
     
     text = f"""
@@ -435,8 +523,7 @@ async def back_out_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 🎯 <b>{sub.group_item_title or sub.question}</b>
 
 💹 <b>Prices:</b>
-   ✅ YES: {yes_prob:.0f}¢
-   ❌ NO: {no_prob:.0f}¢
+{outcome_prices_text(sub)}
 
 <b>Select your position:</b>
 """
@@ -444,7 +531,7 @@ async def back_out_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await query.edit_message_text(
         text,
         parse_mode='HTML',
-        reply_markup=outcome_keyboard()
+        reply_markup=outcome_keyboard(sub.outcomes)
     )
 
 
@@ -471,12 +558,13 @@ async def show_buy_confirmation(query, context, amount: float):
     sub = context.user_data.get('selected_sub_market')
     event = context.user_data.get('selected_event')
     outcome = context.user_data.get('selected_outcome', 'YES')
-    price = context.user_data.get('selected_price', 0.5)
     
     if not sub:
         await query.edit_message_text("⚠️ Market not found. Start over with /buy")
         return
     
+    price = await _live_price(context)
+    
     est_shares = amount / price if price > 0 else 0
     
     context.user_data['buy_amount'] = amount
@@ -578,23 +666,12 @@ async def market_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     market = markets[idx]
     
     # Convert to sub-market for compatibility
-    from core.polymarket_client import SubMarket
-    sub = SubMarket(
-        condition_id=market.condition_id,
-        question=market.question,
-        yes_token_id=market.yes_token_id,
-        no_token_id=market.no_token_id,
-        yes_price=market.yes_price,
-        no_price=market.no_price,
-        group_item_title=''
-    )
+    sub = market.to_sub_market()
     
     context.user_data['selected_sub_market'] = sub
     context.user_data['selected_market'] = market
     context.user_data['selected_event'] = None  # No parent event
-    
-    yes_prob = market.yes_price * 100
-    no_prob = market.no_price * 100
+    await _follow_view(update, [sub])
     
     text = f"""
 📊 <b>Market Details</b>
@@ -602,8 +679,7 @@ async def market_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 📋 <b>{market.question}</b>
 
 💹 <b>Prices:</b>
-   ✅ YES: {yes_prob:.0f}¢ (${market.yes_price:.2f})
-   ❌ NO: {no_prob:.0f}¢ (${market.no_price:.2f})
+{outcome_prices_text(sub)}
 
 📈 <b>Volume:</b> ${market.volume:,.0f}
 
@@ -613,16 +689,17 @@ async def market_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await query.edit_message_text(
         text,
         parse_mode='HTML',
-        reply_markup=outcome_keyboard()
+        reply_markup=outcome_keyboard(sub.outcomes)
     )
 
 
 async def page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Handle legacy pagination."""
+    """Handle markets pagination."""
     query = update.callback_query
     await query.answer()
     
-    page = int(query.data.split('_')[1])
+    page = int(query.data.split('_')[1])  # pg_1 -> 1
+    await _turn_page(update, context, 'markets', page)
     markets = context.user_data.get('markets', [])
     
     text = f"📊 <b>Markets</b>\n\nPage {page + 1}:"
@@ -651,12 +728,13 @@ async def custom_amount_input(update: Update, context: ContextTypes.DEFAULT_TYPE
         sub = context.user_data.get('selected_sub_market')
         event = context.user_data.get('selected_event')
         outcome = context.user_data.get('selected_outcome', 'YES')
-        price = context.user_data.get('selected_price', 0.5)
         
         if not token_id:
             await update.message.reply_text("⚠️ Session expired. Use /buy to start over.")
             return ConversationHandler.END
         
+        price = await _live_price(context)
+        
         est_shares = amount / price if price > 0 else 0
         
         context.user_data['buy_amount'] = amount
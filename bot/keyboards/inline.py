@@ -8,6 +8,13 @@ Supports events with sub-markets for sports betting.
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from typing import List, Any
 
+from core.market_parser import is_yes_no
+
+
+# Rows per page for the paginated lists (evp_ / pg_ callbacks)
+EVENTS_PER_PAGE = 5
+MARKETS_PER_PAGE = 8
+
 
 def main_menu_keyboard() -> InlineKeyboardMarkup:
     """Main menu buttons."""
@@ -133,9 +140,11 @@ def events_keyboard(events: List[Any], page: int = 0) -> InlineKeyboardMarkup:
     """
     Events list keyboard (matches/games).
     Shows events with number of sub-markets available.
+    `events` may be a Pager's loaded prefix - Next shows while it holds
+    anything past this page.
     """
     buttons = []
-    per_page = 5
+    per_page = EVENTS_PER_PAGE
     start = page * per_page
     end = start + per_page
     page_events = events[start:end]
@@ -191,16 +200,39 @@ def sub_markets_keyboard(sub_markets: List[Any], event_idx: int) -> InlineKeyboa
     return InlineKeyboardMarkup(buttons)
 
 
-def outcome_keyboard() -> InlineKeyboardMarkup:
-    """Yes/No outcome selection."""
-    return InlineKeyboardMarkup([
-        [
+def outcome_prices_text(market: Any) -> str:
+    """
+    Price lines matching outcome_keyboard: YES/NO, or every outcome of a
+    market whose outcomes have their own names.
+    """
+    if not is_yes_no(market.outcomes):
+        return "\n".join(f"   🎯 {o.name}: {o.price * 100:.0f}¢ (${o.price:.2f})" for o in market.outcomes[:8])
+    return (
+        f"   ✅ YES: {market.yes_price * 100:.0f}¢ (${market.yes_price:.2f})\n"
+        f"   ❌ NO: {market.no_price * 100:.0f}¢ (${market.no_price:.2f})"
+    )
+
+
+def outcome_keyboard(outcomes: List[Any] = ()) -> InlineKeyboardMarkup:
+    """
+    Outcome selection: Yes/No, or one button per outcome whenever the
+    outcomes aren't literally Yes/No (e.g., Lakers / Celtics, Home /
+    Draw / Away), so a named side is never bought through a YES button.
+    """
+    if not is_yes_no(outcomes):
+        buttons = [
+            [InlineKeyboardButton(f"🎯 {o.name[:30]} ({o.price * 100:.0f}%)", callback_data=f"out_{idx}")]
+            for idx, o in enumerate(outcomes[:8])
+        ]
+    else:
+        buttons = [[
             InlineKeyboardButton("✅ YES", callback_data="out_yes"),
             InlineKeyboardButton("❌ NO", callback_data="out_no")
-        ],
-        [InlineKeyboardButton("⭐ Add Favorite", callback_data="fav_add")],
-        [InlineKeyboardButton("🔙 Back", callback_data="back_sub")]
-    ])
+        ]]
+    
+    buttons.append([InlineKeyboardButton("⭐ Add Favorite", callback_data="fav_add")])
+    buttons.append([InlineKeyboardButton("🔙 Back", callback_data="back_sub")])
+    return InlineKeyboardMarkup(buttons)
 
 
 def amount_keyboard() -> InlineKeyboardMarkup:
@@ -255,7 +287,25 @@ def search_results_keyboard(markets: List[Any]) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(buttons)
 
 
-# Keep legacy markets_keyboard for backward compatibility
 def markets_keyboard(markets: List[Any], page: int = 0) -> InlineKeyboardMarkup:
-    """Legacy markets keyboard for non-event markets."""
-    return search_results_keyboard(markets)
+    """Paginated markets list for non-event markets (category browsing)."""
+    buttons = []
+    start = page * MARKETS_PER_PAGE
+    end = start + MARKETS_PER_PAGE
+    
+    for idx, market in enumerate(markets[start:end]):
+        title = market.question[:40] + "..." if len(market.question) > 40 else market.question
+        buttons.append([InlineKeyboardButton(f"📊 {title}", callback_data=f"mkt_{start + idx}")])
+    
+    # Pagination
+    nav_buttons = []
+    if page > 0:
+        nav_buttons.append(InlineKeyboardButton("⬅️ Prev", callback_data=f"pg_{page - 1}"))
+    if end < len(markets):
+        nav_buttons.append(InlineKeyboardButton("Next ➡️", callback_data=f"pg_{page + 1}"))
+    
+    if nav_buttons:
+        buttons.append(nav_buttons)
+    
+    buttons.append([InlineKeyboardButton("🔙 Categories", callback_data="buy")])
+    return InlineKeyboardMarkup(buttons)
@@ -7,6 +7,7 @@ Supports event-based sports navigation with sub-markets.
 
 import asyncio
 import logging
+import time
 from telegram import Update
 from telegram.ext import (
     Application, 
@@ -22,8 +23,14 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import Config
-from core.polymarket_client import get_polymarket_client, init_polymarket_client
+from core.polymarket_client import (
+    get_polymarket_client, init_polymarket_client, close_polymarket_client
+)
 from core.favorites_db import get_favorites_db
+from core.pagination import get_pager_registry
+from core.ws_client import get_ws_client, start_price_monitor
+from core.subscriptions import get_subscription_manager
+from core.alerts import get_alert_manager
 from bot.keyboards.inline import main_menu_keyboard
 
 # Import handlers
@@ -55,6 +62,7 @@ from bot.handlers.alerts import (
     alerts_command, alert_command, stoploss_command, takeprofit_command,
     delete_alert_callback, alerts_callback
 )
+from bot.handlers.status import status_command
 
 
 # Logging
@@ -117,6 +125,7 @@ async def help_command(update: Update, context):
 
 <b>Settings:</b>
 /start - Main menu
+/status - API health
 /help - This help
 
 <b>Tips:</b>
@@ -133,6 +142,9 @@ async def menu_callback(update: Update, context):
     query = update.callback_query
     await query.answer()
     
+    # Leaving the listings: stop their background page loads
+    await get_pager_registry().close(update.effective_user.id)
+    
     mode = "📝 Paper Trading" if Config.is_paper_mode() else "💱 LIVE Trading"
     
     text = f"""
@@ -174,11 +186,65 @@ def main():
     
     # Initialize async components on startup
     async def post_init(application):
-        """Initialize async components like loading paper positions."""
-        await init_polymarket_client()
-        print("✅ Polymarket client initialized with persisted positions")
+        """
+        Initialize async components like loading paper positions.
+        
+        Connection pre-warming, live client init, the market catalog
+        sync and the WebSocket price feed run in the background so the bot
+        starts accepting updates immediately. The catalog snapshot, if
+        any, is restored first.
+        """
+        started = time.perf_counter()
+        client = await init_polymarket_client()
+        print(f"✅ Polymarket client initialized with persisted positions ({time.perf_counter() - started:.2f}s)")
+        
+        async def prewarm():
+            timings = await client.prewarm()
+            summary = ", ".join(f"{name} {secs:.2f}s" for name, secs in timings.items())
+            print(f"🔥 Pre-warmed connections: {summary or 'none'}")
+        
+        application.create_task(prewarm())
+        
+        # Restore the catalog before polling starts so the first /buy is served locally
+        started = time.perf_counter()
+        if await client.catalog.load_snapshot():
+            client.startup_timings['catalog_snapshot'] = time.perf_counter() - started
+        client.catalog.start()
+        
+        if Config.WS_PRICES_ENABLED:
+            application.bot_data['price_monitor'] = application.create_task(
+                start_price_monitor(application.bot)
+            )
+            
+            # Follow tokens behind positions, alerts and favorites
+            async def position_tokens():
+                return [p.token_id for p in await client.get_positions()]
+            
+            async def alert_tokens():
+                return [a.token_id for a in await get_alert_manager().get_alerts(active_only=True)]
+            
+            async def favorite_tokens():
+                return await (await get_favorites_db()).get_all_token_ids()
+            
+            subscriptions = get_subscription_manager()
+            subscriptions.add_source('positions', position_tokens)
+            subscriptions.add_source('alerts', alert_tokens)
+            subscriptions.add_source('favorites', favorite_tokens)
+            subscriptions.start()
+    
+    async def post_shutdown(application):
+        """Stop the price feed and release pooled HTTP connections."""
+        monitor = application.bot_data.pop('price_monitor', None)
+        if monitor is not None:
+            await get_subscription_manager().stop()
+            await get_ws_client().disconnect()
+            monitor.cancel()
+        
+        await close_polymarket_client()
+        print("🔌 Polymarket client connections closed")
     
     app.post_init = post_init
+    app.post_shutdown = post_shutdown
     
     # ═══════════════════════════════════════════════════════════════════
     # COMMAND HANDLERS
@@ -197,6 +263,7 @@ def main():
     app.add_handler(CommandHandler("alert", alert_command))
     app.add_handler(CommandHandler("stoploss", stoploss_command))
     app.add_handler(CommandHandler("takeprofit", takeprofit_command))
+    app.add_handler(CommandHandler("status", status_command))
     
     # ═══════════════════════════════════════════════════════════════════
     # CONVERSATION HANDLERS (must be BEFORE regular callback handlers)
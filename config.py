@@ -32,7 +32,66 @@ class Config:
     POLYMARKET_CLOB_URL = os.getenv('POLYMARKET_CLOB_URL', 'https://clob.polymarket.com')
     POLYMARKET_GAMMA_URL = os.getenv('POLYMARKET_GAMMA_URL', 'https://gamma-api.polymarket.com')
     POLYGON_CHAIN_ID = int(os.getenv('POLYGON_CHAIN_ID', '137'))
-    
+
+    # ═══════════════════════════════════════════════════════════════════
+    # HTTP TRANSPORT
+    # ═══════════════════════════════════════════════════════════════════
+    HTTP_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', '30'))
+    HTTP_MAX_CONNECTIONS = int(os.getenv('HTTP_MAX_CONNECTIONS', '20'))
+    HTTP_MAX_KEEPALIVE = int(os.getenv('HTTP_MAX_KEEPALIVE', '10'))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv('HTTP_KEEPALIVE_EXPIRY', '60'))
+    HTTP2_ENABLED = os.getenv('HTTP2_ENABLED', 'false').lower() == 'true'  # Needs httpx[http2]
+    JSON_BACKEND = os.getenv('JSON_BACKEND', 'auto').lower()  # 'auto' (orjson if installed) or 'json'
+
+    # ═══════════════════════════════════════════════════════════════════
+    # RATE LIMITING (per-host token bucket, AIMD)
+    # ═══════════════════════════════════════════════════════════════════
+    RATE_LIMIT_GAMMA_RPS = float(os.getenv('RATE_LIMIT_GAMMA_RPS', '10'))
+    RATE_LIMIT_CLOB_RPS = float(os.getenv('RATE_LIMIT_CLOB_RPS', '20'))
+    RATE_LIMIT_BURST = float(os.getenv('RATE_LIMIT_BURST', '10'))
+    RATE_LIMIT_MIN_RPS = float(os.getenv('RATE_LIMIT_MIN_RPS', '0.5'))
+    RATE_LIMIT_MAX_MULTIPLIER = float(os.getenv('RATE_LIMIT_MAX_MULTIPLIER', '2'))
+    RATE_LIMIT_INCREASE = float(os.getenv('RATE_LIMIT_INCREASE', '0.1'))  # req/s added per success
+    RATE_LIMIT_DECREASE = float(os.getenv('RATE_LIMIT_DECREASE', '0.5'))  # rate multiplier on 429
+    RATE_LIMIT_TRADING_RESERVE = float(os.getenv('RATE_LIMIT_TRADING_RESERVE', '2'))
+    DISCOVERY_CONCURRENCY = int(os.getenv('DISCOVERY_CONCURRENCY', '4'))  # Parallel tag_slug/_q fetches per browse
+    PAGINATION_BATCH_SIZE = int(os.getenv('PAGINATION_BATCH_SIZE', '20'))  # Events/markets fetched per cursor step
+
+    # ═══════════════════════════════════════════════════════════════════
+    # CIRCUIT BREAKERS (per endpoint family)
+    # ═══════════════════════════════════════════════════════════════════
+    BREAKER_FAILURE_THRESHOLD = int(os.getenv('BREAKER_FAILURE_THRESHOLD', '5'))
+    BREAKER_RECOVERY_TIMEOUT = float(os.getenv('BREAKER_RECOVERY_TIMEOUT', '30'))
+    BREAKER_HALF_OPEN_MAX_CALLS = int(os.getenv('BREAKER_HALF_OPEN_MAX_CALLS', '1'))
+
+    # ═══════════════════════════════════════════════════════════════════
+    # RESPONSE CACHE (Gamma discovery endpoints)
+    # ═══════════════════════════════════════════════════════════════════
+    CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '512'))
+    CACHE_STALE_TTL = float(os.getenv('CACHE_STALE_TTL', '300'))  # Serve stale while refreshing
+    CACHE_TTLS = {
+        '/sports': float(os.getenv('CACHE_TTL_SPORTS', '600')),
+        '/tags': float(os.getenv('CACHE_TTL_TAGS', '3600')),
+        '/events': float(os.getenv('CACHE_TTL_EVENTS', '60')),
+        '/markets': float(os.getenv('CACHE_TTL_MARKETS', '60'))
+    }
+    CLASSIFICATION_CACHE_SIZE = int(os.getenv('CLASSIFICATION_CACHE_SIZE', '20000'))  # Memoized sport classifications
+    MARKET_PARSE_CACHE_SIZE = int(os.getenv('MARKET_PARSE_CACHE_SIZE', '50000'))  # Decoded outcomes/outcomePrices strings
+
+    # ═══════════════════════════════════════════════════════════════════
+    # MARKET CATALOG (in-memory copy of active events/markets)
+    # ═══════════════════════════════════════════════════════════════════
+    CATALOG_ENABLED = os.getenv('CATALOG_ENABLED', 'true').lower() == 'true'
+    CATALOG_SYNC_INTERVAL = float(os.getenv('CATALOG_SYNC_INTERVAL', '60'))  # Incremental sync
+    CATALOG_FULL_SYNC_INTERVAL = float(os.getenv('CATALOG_FULL_SYNC_INTERVAL', '1800'))
+    CATALOG_MAX_AGE = float(os.getenv('CATALOG_MAX_AGE', '300'))  # Older than this → ask Gamma
+    CATALOG_PAGE_SIZE = int(os.getenv('CATALOG_PAGE_SIZE', '200'))
+    CATALOG_INCREMENTAL_MAX_PAGES = int(os.getenv('CATALOG_INCREMENTAL_MAX_PAGES', '5'))
+    CATALOG_SNAPSHOT_ENABLED = os.getenv('CATALOG_SNAPSHOT_ENABLED', 'true').lower() == 'true'
+    CATALOG_SNAPSHOT_INTERVAL = float(os.getenv('CATALOG_SNAPSHOT_INTERVAL', '300'))  # Seconds between disk snapshots
+    CATALOG_SNAPSHOT_PATH = os.getenv('CATALOG_SNAPSHOT_PATH', '')  # Default: catalog.snapshot next to DATABASE_PATH
+    SEARCH_VOLUME_WEIGHT = float(os.getenv('SEARCH_VOLUME_WEIGHT', '0.15'))  # Relevance x (1 + w*log10(1+volume))
+
     # ═══════════════════════════════════════════════════════════════════
     # TRADING SETTINGS
     # ═══════════════════════════════════════════════════════════════════
@@ -40,6 +99,31 @@ class Config:
     DEFAULT_SLIPPAGE = float(os.getenv('DEFAULT_SLIPPAGE', '2.0'))
     MAX_TRADE_USD = float(os.getenv('MAX_TRADE_USD', '100'))
     MIN_TRADE_USD = float(os.getenv('MIN_TRADE_USD', '5'))
+
+    # Price reads: race SDK/REST sources, hedging after the p95 latency
+    PRICE_HEDGING = os.getenv('PRICE_HEDGING', 'true').lower() == 'true'
+    PRICE_DEADLINE = float(os.getenv('PRICE_DEADLINE', '5'))  # Overall budget in seconds
+    PRICE_HEDGE_DEFAULT_DELAY = float(os.getenv('PRICE_HEDGE_DEFAULT_DELAY', '0.3'))
+    PRICE_HEDGE_MIN_DELAY = float(os.getenv('PRICE_HEDGE_MIN_DELAY', '0.05'))
+    PRICE_HEDGE_MAX_DELAY = float(os.getenv('PRICE_HEDGE_MAX_DELAY', '1.5'))
+
+    # Batch price refresh: tokens per bulk CLOB request, per-token fallback fan-out
+    PRICE_BATCH_SIZE = int(os.getenv('PRICE_BATCH_SIZE', '50'))
+    PRICE_CONCURRENCY = int(os.getenv('PRICE_CONCURRENCY', '8'))
+    PRICE_BULK_RETRY = float(os.getenv('PRICE_BULK_RETRY', '300'))  # Seconds to skip bulk endpoints after they fail
+
+    # WebSocket price feed: get_price serves ticks newer than WS_PRICE_MAX_AGE seconds, else REST
+    WS_PRICES_ENABLED = os.getenv('WS_PRICES_ENABLED', 'true').lower() == 'true'
+    WS_PRICE_MAX_AGE = float(os.getenv('WS_PRICE_MAX_AGE', '10'))
+    WS_SUBSCRIBE_DEBOUNCE = float(os.getenv('WS_SUBSCRIBE_DEBOUNCE', '0.05'))  # Seconds to collect (un)subscribes
+    WS_SUBSCRIBE_CHUNK = int(os.getenv('WS_SUBSCRIBE_CHUNK', '500'))  # Assets per subscribe frame
+    WS_CALLBACK_QUEUE_SIZE = int(os.getenv('WS_CALLBACK_QUEUE_SIZE', '1000'))  # Pending tokens per price callback
+    WS_SHARDS = int(os.getenv('WS_SHARDS', '1'))  # Connections, tokens consistently hashed across them; helps only with per-connection server limits
+    # Followed tokens: positions/alerts/favorites re-read every WS_SUBSCRIPTION_REFRESH seconds,
+    # on-screen tokens held for WS_VIEW_TTL, unsubscribed WS_UNSUBSCRIBE_GRACE after the last holder
+    WS_SUBSCRIPTION_REFRESH = float(os.getenv('WS_SUBSCRIPTION_REFRESH', '60'))
+    WS_VIEW_TTL = float(os.getenv('WS_VIEW_TTL', '600'))
+    WS_UNSUBSCRIBE_GRACE = float(os.getenv('WS_UNSUBSCRIBE_GRACE', '120'))
     
     # ═══════════════════════════════════════════════════════════════════
     # FEATURES
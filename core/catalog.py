@@ -0,0 +1,424 @@
+"""
+Market Catalog
+
+In-memory copy of every active Gamma event and market, kept in sync by a
+background task: a full page-through at startup and on a long interval,
+plus short incremental syncs of recently updated events in between.
+Discovery calls answer from it while it is fresh instead of hitting Gamma.
+The catalog is snapshotted to disk periodically and restored at boot, so
+a restart only needs an incremental sync to catch up.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+from core import json_codec
+from core.search_index import SearchIndex
+from core.catalog_snapshot import snapshot_path, read_snapshot, write_snapshot
+
+
+def _is_open(item: Dict) -> bool:
+    return item.get('active', True) and not item.get('closed', False)
+
+
+def market_token_ids(market: Dict) -> List[str]:
+    """Token ids of a raw Gamma market (tokens list or clobTokenIds string)."""
+    ids = [t.get('token_id') for t in market.get('tokens') or [] if t.get('token_id')]
+    if ids:
+        return ids
+
+    raw = market.get('clobTokenIds')
+    if isinstance(raw, str):
+        try:
+            raw = json_codec.loads(raw)
+        except ValueError:
+            return []
+    return [str(t) for t in raw or []]
+
+
+class CatalogIndex:
+    """
+    Lookup tables over raw Gamma event/market dicts.
+
+    Keys: event id, condition id (and numeric market id), series id and
+    token id, plus a full-text search index over open markets. Raw dicts
+    are shared with callers - treat them as read-only.
+    """
+
+    def __init__(self):
+        self.events: Dict[str, Dict] = {}
+        self.markets: Dict[str, Dict] = {}            # condition_id -> market
+        self.market_ids: Dict[str, str] = {}         # numeric market id -> condition_id
+        self.market_event: Dict[str, str] = {}       # condition_id -> event id
+        self.series: Dict[str, Dict[str, None]] = {}  # series id -> ordered event ids
+        self.tokens: Dict[str, str] = {}             # token id -> condition_id
+        self.search = SearchIndex()
+
+    def add_event(self, event: Dict):
+        event_id = str(event.get('id', ''))
+        if not event_id:
+            return
+        if event_id in self.events:
+            self.remove_event(event_id)
+
+        self.events[event_id] = event
+
+        for series in event.get('series') or []:
+            series_id = str(series.get('id', ''))
+            if series_id:
+                self.series.setdefault(series_id, {})[event_id] = None
+
+        for market in event.get('markets') or []:
+            if not _is_open(market):
+                continue
+            condition_id = market.get('conditionId') or str(market.get('id', ''))
+            if not condition_id:
+                continue
+
+            self.markets[condition_id] = market
+            self.market_event[condition_id] = event_id
+            if market.get('id'):
+                self.market_ids[str(market['id'])] = condition_id
+            for token_id in market_token_ids(market):
+                self.tokens[token_id] = condition_id
+
+            try:
+                volume = float(market.get('volume') or 0)
+            except (TypeError, ValueError):
+                volume = 0.0
+            self.search.add(
+                condition_id,
+                (market.get('question'), market.get('groupItemTitle'), event.get('title')),
+                market.get('description') or '',
+                volume
+            )
+
+    def remove_event(self, event_id: str):
+        event = self.events.pop(event_id, None)
+        if event is None:
+            return
+
+        for series in event.get('series') or []:
+            members = self.series.get(str(series.get('id', '')))
+            if members is not None:
+                members.pop(event_id, None)
+
+        for market in event.get('markets') or []:
+            condition_id = market.get('conditionId') or str(market.get('id', ''))
+            if self.market_event.get(condition_id) != event_id:
+                continue
+            self.markets.pop(condition_id, None)
+            self.market_event.pop(condition_id, None)
+            self.market_ids.pop(str(market.get('id', '')), None)
+            self.search.remove(condition_id)
+            for token_id in market_token_ids(market):
+                if self.tokens.get(token_id) == condition_id:
+                    del self.tokens[token_id]
+
+
+class MarketCatalog:
+    """
+    Background-synced catalog of active events and markets.
+
+    `fetch(url, params)` must return a decoded JSON list (or None). It is
+    the client's uncached fetch, so syncs still pass through the rate
+    limiter and circuit breakers but don't flood the response cache.
+    """
+
+    def __init__(self, fetch: Callable[[str, Dict], Awaitable[Optional[List[Dict]]]]):
+        self._fetch = fetch
+        self._index = CatalogIndex()
+        self._task: Optional[asyncio.Task] = None
+        self._high_water = ''  # Latest updatedAt seen
+
+        self.synced_at = 0.0
+        self.full_synced_at = 0.0
+        self.full_syncs = 0
+        self.incremental_syncs = 0
+        self.failures = 0
+        self.last_sync_seconds = 0.0
+
+        self.snapshot_loaded = False
+        self.snapshot_load_seconds = 0.0
+        self.snapshot_saved_at = 0.0
+        self.snapshot_bytes = 0
+
+    # ═══════════════════════════════════════════════════════════════════
+    # FRESHNESS
+    # ═══════════════════════════════════════════════════════════════════
+
+    @property
+    def ready(self) -> bool:
+        return self.full_syncs > 0 or self.snapshot_loaded
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.synced_at if self.ready else float('inf')
+
+    def is_fresh(self) -> bool:
+        """True if lookups may be answered from memory."""
+        return Config.CATALOG_ENABLED and self.ready and self.age <= Config.CATALOG_MAX_AGE
+
+    # ═══════════════════════════════════════════════════════════════════
+    # LOOKUPS
+    # ═══════════════════════════════════════════════════════════════════
+
+    def event(self, event_id: str) -> Optional[Dict]:
+        return self._index.events.get(str(event_id))
+
+    def market(self, market_id: str) -> Optional[Dict]:
+        """Look up a market by condition id or numeric Gamma id."""
+        index = self._index
+        market = index.markets.get(market_id)
+        if market is None and market_id in index.market_ids:
+            market = index.markets.get(index.market_ids[market_id])
+        return market
+
+    def market_for_token(self, token_id: str) -> Optional[Dict]:
+        condition_id = self._index.tokens.get(token_id)
+        return self._index.markets.get(condition_id) if condition_id else None
+
+    def event_for_market(self, condition_id: str) -> Optional[Dict]:
+        event_id = self._index.market_event.get(condition_id)
+        return self._index.events.get(event_id) if event_id else None
+
+    def events_for_series(self, series_id: str) -> List[Dict]:
+        index = self._index
+        return [index.events[e] for e in index.series.get(str(series_id), ()) if e in index.events]
+
+    def iter_events(self) -> Iterator[Dict]:
+        return iter(list(self._index.events.values()))
+
+    def iter_markets(self) -> Iterator[Dict]:
+        return iter(list(self._index.markets.values()))
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """Best matching open markets (prefix + typo tolerant, volume weighted)."""
+        index = self._index
+        return [index.markets[k] for k in index.search.search(query, limit) if k in index.markets]
+
+    # ═══════════════════════════════════════════════════════════════════
+    # SYNC
+    # ═══════════════════════════════════════════════════════════════════
+
+    async def full_sync(self) -> bool:
+        """Page through every active event and swap in a fresh index."""
+        started = time.perf_counter()
+        index = CatalogIndex()
+        high_water = ''
+        page_size = Config.CATALOG_PAGE_SIZE
+        offset = 0
+
+        while True:
+            page = await self._fetch(
+                f"{Config.POLYMARKET_GAMMA_URL}/events",
+                {"active": True, "closed": False, "limit": page_size, "offset": offset}
+            )
+            if page is None:
+                self.failures += 1
+                print(f"⚠️ Catalog sync failed at offset {offset}")
+                return False
+
+            for event in page:
+                index.add_event(event)
+                high_water = max(high_water, event.get('updatedAt') or '')
+
+            if len(page) < page_size:
+                break
+            offset += page_size
+
+        self._index = index
+        self._high_water = high_water
+        self.synced_at = self.full_synced_at = time.monotonic()
+        self.full_syncs += 1
+        self.last_sync_seconds = time.perf_counter() - started
+
+        print(f"📚 Catalog synced: {len(index.events)} events, "
+              f"{len(index.markets)} markets in {self.last_sync_seconds:.1f}s")
+        return True
+
+    async def incremental_sync(self) -> bool:
+        """
+        Apply events updated since the last sync, newest first.
+
+        The high-water mark only advances once the read reaches it (or the
+        end of the list). If CATALOG_INCREMENTAL_MAX_PAGES runs out first,
+        the updates in between are unknown, so a full sync runs instead.
+        """
+        started = time.perf_counter()
+        page_size = Config.CATALOG_PAGE_SIZE
+        high_water = self._high_water
+        changed = 0
+        complete = False
+
+        for page_no in range(Config.CATALOG_INCREMENTAL_MAX_PAGES):
+            page = await self._fetch(
+                f"{Config.POLYMARKET_GAMMA_URL}/events",
+                {"order": "updatedAt", "ascending": False, "limit": page_size, "offset": page_no * page_size}
+            )
+            if page is None:
+                self.failures += 1
+                return False
+
+            caught_up = False
+            for event in page:
+                updated = event.get('updatedAt') or ''
+                if updated and updated <= self._high_water:
+                    caught_up = True
+                    break
+
+                high_water = max(high_water, updated)
+                changed += 1
+                if _is_open(event):
+                    self._index.add_event(event)
+                else:
+                    self._index.remove_event(str(event.get('id', '')))
+
+            if caught_up or len(page) < page_size:
+                complete = True
+                break
+
+        if not complete:
+            print(f"📚 Catalog: more than {Config.CATALOG_INCREMENTAL_MAX_PAGES} pages of updates - full sync")
+            return await self.full_sync()
+
+        self._high_water = high_water
+        self.synced_at = time.monotonic()
+        self.incremental_syncs += 1
+        self.last_sync_seconds = time.perf_counter() - started
+        if changed:
+            print(f"📚 Catalog: {changed} events updated")
+        return True
+
+    async def _run(self):
+        while True:
+            try:
+                if not self.ready or time.monotonic() - self.full_synced_at >= Config.CATALOG_FULL_SYNC_INTERVAL:
+                    await self.full_sync()
+                else:
+                    await self.incremental_sync()
+
+                if time.monotonic() - self.snapshot_saved_at >= Config.CATALOG_SNAPSHOT_INTERVAL:
+                    await self.save_snapshot()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                print(f"⚠️ Catalog sync error: {e}")
+
+            await asyncio.sleep(Config.CATALOG_SYNC_INTERVAL)
+
+    # ═══════════════════════════════════════════════════════════════════
+    # SNAPSHOT
+    # ═══════════════════════════════════════════════════════════════════
+
+    async def load_snapshot(self) -> bool:
+        """
+        Restore the index from the on-disk snapshot before the first sync.
+
+        The next sync is then incremental (from the snapshot's high-water
+        mark) unless the snapshot is older than CATALOG_FULL_SYNC_INTERVAL.
+        """
+        if not (Config.CATALOG_ENABLED and Config.CATALOG_SNAPSHOT_ENABLED) or self.ready:
+            return False
+
+        started = time.perf_counter()
+        path = snapshot_path()
+
+        def build():
+            snapshot = read_snapshot(path)
+            if snapshot is None:
+                return None
+            header, events = snapshot
+            if time.time() - header.get('full_synced_at', 0) > Config.CATALOG_FULL_SYNC_INTERVAL:
+                print("📚 Catalog snapshot too old - waiting for a full sync")
+                return None
+
+            index = CatalogIndex()
+            for event in events:
+                index.add_event(event)
+            return header, index
+
+        result = await asyncio.to_thread(build)
+        if result is None:
+            return False
+
+        header, index = result
+        now, wall = time.monotonic(), time.time()
+        self._index = index
+        self._high_water = header.get('high_water', '')
+        self.synced_at = now - (wall - header.get('synced_at', 0))
+        self.full_synced_at = now - (wall - header.get('full_synced_at', 0))
+        self.snapshot_loaded = True
+        self.snapshot_saved_at = now
+        self.snapshot_load_seconds = time.perf_counter() - started
+
+        print(f"📚 Catalog restored from snapshot: {len(index.events)} events, {len(index.markets)} markets "
+              f"in {self.snapshot_load_seconds:.2f}s ({self.age:.0f}s old)")
+        return True
+
+    async def save_snapshot(self) -> bool:
+        """Write the current index to disk (events only - lookups are rebuilt on load)."""
+        if not (Config.CATALOG_ENABLED and Config.CATALOG_SNAPSHOT_ENABLED) or not self.ready:
+            return False
+
+        now, wall = time.monotonic(), time.time()
+        events = list(self._index.events.values())
+        header = {
+            'high_water': self._high_water,
+            'synced_at': wall - (now - self.synced_at),
+            'full_synced_at': wall - (now - self.full_synced_at)
+        }
+
+        try:
+            self.snapshot_bytes = await asyncio.to_thread(write_snapshot, snapshot_path(), events, header)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️ Catalog snapshot write failed: {e}")
+            return False
+
+        self.snapshot_saved_at = time.monotonic()
+        return True
+
+    def start(self) -> Optional[asyncio.Task]:
+        """Start background syncing (idempotent)."""
+        if Config.CATALOG_ENABLED and self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+        return self._task
+
+    async def stop(self):
+        """Stop syncing and snapshot the catalog for the next start."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+            await self.save_snapshot()
+
+    def get_stats(self) -> Dict[str, Any]:
+        index = self._index
+        return {
+            'ready': self.ready,
+            'fresh': self.is_fresh(),
+            'age': round(self.age, 1) if self.ready else None,
+            'events': len(index.events),
+            'markets': len(index.markets),
+            'series': len(index.series),
+            'tokens': len(index.tokens),
+            'search': index.search.get_stats(),
+            'full_syncs': self.full_syncs,
+            'incremental_syncs': self.incremental_syncs,
+            'failures': self.failures,
+            'last_sync_seconds': round(self.last_sync_seconds, 2),
+            'snapshot': {
+                'loaded': self.snapshot_loaded,
+                'load_seconds': round(self.snapshot_load_seconds, 2),
+                'bytes': self.snapshot_bytes
+            }
+        }
@@ -0,0 +1,79 @@
+"""
+Catalog Snapshot
+
+On-disk copy of the market catalog so a restart can serve discovery
+before the first Gamma sync finishes. The file is a magic line, a JSON
+header line and one JSON array of raw events. It is written atomically
+(temp file + rename) and read through mmap, so the decoder parses
+straight from the page cache without an extra read() copy.
+"""
+
+import mmap
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+from core import json_codec
+
+
+MAGIC = b'POLYCAT1\n'
+
+
+def snapshot_path() -> str:
+    """CATALOG_SNAPSHOT_PATH, or catalog.snapshot next to DATABASE_PATH."""
+    if Config.CATALOG_SNAPSHOT_PATH:
+        return Config.CATALOG_SNAPSHOT_PATH
+    return os.path.join(os.path.dirname(Config.DATABASE_PATH), 'catalog.snapshot')
+
+
+def write_snapshot(path: str, events: List[Dict], header: Dict[str, Any]) -> int:
+    """Write events and header atomically. Returns the file size in bytes."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    header = dict(header, saved_at=time.time(), events=len(events))
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC)
+        f.write(json_codec.dumps(header).encode())
+        f.write(b'\n')
+        f.write(json_codec.dumps(events).encode())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return os.path.getsize(path)
+
+
+def read_snapshot(path: str) -> Optional[Tuple[Dict[str, Any], List[Dict]]]:
+    """(header, events) from a snapshot file, or None if missing or unreadable."""
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= len(MAGIC):
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:len(MAGIC)] != MAGIC:
+                    print(f"⚠️ Catalog snapshot {path} has an unknown format - ignoring")
+                    return None
+                body = mm.find(b'\n', len(MAGIC)) + 1
+                if body <= 0:
+                    return None
+
+                view = memoryview(mm)
+                try:
+                    header = json_codec.loads(view[len(MAGIC):body - 1])
+                    events = json_codec.loads(view[body:])
+                finally:
+                    view.release()
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Catalog snapshot unreadable: {e}")
+        return None
+
+    if not isinstance(header, dict) or not isinstance(events, list):
+        return None
+    return header, events
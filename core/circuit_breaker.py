@@ -0,0 +1,151 @@
+"""
+Circuit Breakers
+
+Per-endpoint-family breakers for Gamma and CLOB calls. When an upstream
+keeps failing, calls fail fast (or fall back to cached data) instead of
+tying up handler coroutines in the retry ladder.
+"""
+
+import time
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+
+
+# Breaker states
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+def endpoint_family(url: str) -> str:
+    """Group a URL into an endpoint family, e.g. 'gamma /events' or 'clob /price'."""
+    if url.startswith(Config.POLYMARKET_CLOB_URL):
+        upstream = 'clob'
+    elif url.startswith(Config.POLYMARKET_GAMMA_URL):
+        upstream = 'gamma'
+    else:
+        upstream = urlsplit(url).netloc
+
+    root = '/' + urlsplit(url).path.lstrip('/').split('/', 1)[0]
+    return f"{upstream} {root}"
+
+
+class CircuitBreaker:
+    """
+    Closed → Open after `failure_threshold` consecutive failures.
+    Open → Half-open after `recovery_timeout` seconds.
+    Half-open lets `half_open_max_calls` probes through: a success closes
+    the breaker, a failure re-opens it.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.failure_threshold = Config.BREAKER_FAILURE_THRESHOLD
+        self.recovery_timeout = Config.BREAKER_RECOVERY_TIMEOUT
+        self.half_open_max_calls = Config.BREAKER_HALF_OPEN_MAX_CALLS
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_at = 0.0
+
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: str):
+        if state == self._state:
+            return
+        self._state = state
+        self._probes = 0
+
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+            self.trips += 1
+            print(f"🔴 Circuit OPEN for {self.name} (retry in {self.recovery_timeout:.0f}s)")
+        elif state == HALF_OPEN:
+            print(f"🟡 Circuit HALF-OPEN for {self.name} - probing")
+        else:
+            self._failures = 0
+            print(f"🟢 Circuit CLOSED for {self.name}")
+
+    def allow(self) -> bool:
+        """Whether a call may go through right now."""
+        state = self.state
+
+        if state == CLOSED:
+            return True
+
+        if state == HALF_OPEN:
+            now = time.monotonic()
+            # A probe that never reported back shouldn't wedge the breaker
+            if self._probes >= self.half_open_max_calls and now - self._probe_at >= self.recovery_timeout:
+                self._probes = 0
+            if self._probes < self.half_open_max_calls:
+                self._probes += 1
+                self._probe_at = now
+                return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self._failures = 0
+        if self._state != CLOSED:
+            self._transition(CLOSED)
+
+    def record_failure(self):
+        if self._state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+
+        self._failures += 1
+        if self._state == CLOSED and self._failures >= self.failure_threshold:
+            self._transition(OPEN)
+
+    def get_stats(self) -> Dict[str, Any]:
+        state = self.state
+        stats = {
+            'state': state,
+            'failures': self._failures,
+            'trips': self.trips,
+            'rejected': self.rejected
+        }
+        if state == OPEN:
+            stats['retry_in'] = round(self.recovery_timeout - (time.monotonic() - self._opened_at), 1)
+        return stats
+
+
+class BreakerRegistry:
+    """One breaker per endpoint family, created on first use."""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        family = endpoint_family(url)
+        breaker = self._breakers.get(family)
+        if breaker is None:
+            breaker = self._breakers[family] = CircuitBreaker(family)
+        return breaker
+
+    def is_degraded(self, upstream: str) -> bool:
+        """True if any breaker for an upstream ('gamma' or 'clob') is not closed."""
+        return any(
+            b.state != CLOSED for name, b in self._breakers.items()
+            if name.startswith(f"{upstream} ")
+        )
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: b.get_stats() for name, b in sorted(self._breakers.items())}
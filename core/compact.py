@@ -0,0 +1,39 @@
+"""
+Compact Model Helpers
+
+Shared by the slotted client dataclasses (Event, Market, SubMarket,
+Position): identifier interning and lazily decoded long text. Sessions
+keep lists of these objects in user_data, so a few hundred bytes per
+object adds up across users.
+"""
+
+import sys
+import zlib
+from typing import Union
+
+# Shorter texts aren't worth the zlib header and call overhead
+PACK_MIN_LENGTH = 160
+
+PackedText = Union[str, bytes]
+
+
+def intern_id(value):
+    """
+    Intern an identifier or short title so every session shares one string.
+    Interned strings are still freed once nothing references them.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def pack_text(text: PackedText) -> PackedText:
+    """Compress long text; short (or already packed) text is kept as-is."""
+    if type(text) is bytes:
+        return text
+    if not text or len(text) < PACK_MIN_LENGTH:
+        return text or ''
+    packed = zlib.compress(text.encode(), 1)
+    return packed if len(packed) < len(text) else text
+
+
+def unpack_text(packed: PackedText) -> str:
+    return zlib.decompress(packed).decode() if type(packed) is bytes else packed
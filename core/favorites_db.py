@@ -123,6 +123,16 @@ class FavoritesDB:
         
         return favorites
     
+    async def get_all_token_ids(self) -> List[str]:
+        """Distinct token IDs favorited by any user."""
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                async with db.execute('SELECT DISTINCT token_id FROM favorites') as cursor:
+                    return [row[0] async for row in cursor if row[0]]
+        except Exception as e:
+            print(f"⚠️ Get favorite tokens error: {e}")
+            return []
+    
     async def is_favorite(self, user_id: str, market_id: str) -> bool:
         """Check if a market is favorited."""
         try:
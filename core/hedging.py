@@ -0,0 +1,166 @@
+"""
+Hedged Requests
+
+Races redundant sources for latency-critical reads: start the preferred
+source, and if it hasn't answered within its recent p95 latency, start
+the next one too. First valid answer wins; the rest are cancelled.
+Losing, failing and timed-out sources are timed too, so a source that is
+often slow sees its p95 (and hedge delay) rise.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+
+
+class LatencyTracker:
+    """Rolling latency samples per source, used to derive hedge delays."""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self.wins: Dict[str, int] = {}
+        self.hedges = 0
+
+    def record(self, source: str, seconds: float):
+        samples = self._samples.get(source)
+        if samples is None:
+            samples = self._samples[source] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def record_censored(self, source: str, seconds: float):
+        """
+        Record a call cancelled after `seconds` without answering. That is
+        only a lower bound on its latency, so it is kept only when it
+        would not pull the source's p95 down.
+        """
+        p95 = self.percentile(source, 95)
+        if p95 is None or seconds >= p95:
+            self.record(source, seconds)
+
+    def percentile(self, source: str, pct: float) -> Optional[float]:
+        """Latency percentile (0-100) for a source, or None without samples."""
+        samples = self._samples.get(source)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        idx = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+        return ordered[idx]
+
+    def hedge_delay(self, source: str) -> float:
+        """How long to wait on a source before racing the next one."""
+        p95 = self.percentile(source, 95)
+        if p95 is None:
+            return Config.PRICE_HEDGE_DEFAULT_DELAY
+        return min(Config.PRICE_HEDGE_MAX_DELAY, max(Config.PRICE_HEDGE_MIN_DELAY, p95))
+
+    def get_stats(self) -> Dict[str, Any]:
+        sources = {}
+        for source, samples in self._samples.items():
+            sources[source] = {
+                'samples': len(samples),
+                'p50_ms': round((self.percentile(source, 50) or 0) * 1000, 1),
+                'p95_ms': round((self.percentile(source, 95) or 0) * 1000, 1),
+                'wins': self.wins.get(source, 0)
+            }
+        return {'hedges': self.hedges, 'sources': sources}
+
+
+async def hedged_race(
+    sources: List[Tuple[str, Callable[[], Awaitable[Any]]]],
+    is_valid: Callable[[Any], bool],
+    tracker: LatencyTracker,
+    deadline: float,
+    hedge: bool = True
+) -> Tuple[Optional[str], Any]:
+    """
+    Race sources in preference order and return the first valid answer.
+
+    A source that fails or returns an invalid answer immediately starts the
+    next one. With hedge=True the next source is also started once the
+    current one exceeds its hedge delay. Every unfinished source's task is
+    cancelled when a winner is found or the deadline passes; sources must
+    not shield their work if cancelling is to stop it (a call running in
+    a worker thread keeps running, and its answer is discarded).
+
+    Every source is timed: winners and failures by their full latency,
+    cancelled sources by a censored sample (see record_censored).
+
+    Args:
+        sources: (name, coroutine factory) pairs, most preferred first
+        is_valid: Predicate for an acceptable result
+        tracker: Latency tracker used for hedge delays and recording
+        deadline: Overall budget in seconds
+        hedge: If False, fall back sequentially (only on failure)
+
+    Returns:
+        (source name, result), or (None, None) if nothing valid in time
+    """
+    if not sources:
+        return None, None
+
+    loop = asyncio.get_running_loop()
+    end = loop.time() + deadline
+    pending: Dict[asyncio.Task, Tuple[str, float]] = {}
+    next_idx = 0
+    next_hedge_at = None
+
+    def launch():
+        nonlocal next_idx, next_hedge_at
+        name, factory = sources[next_idx]
+        next_idx += 1
+        started = loop.time()
+        pending[asyncio.ensure_future(factory())] = (name, started)
+        next_hedge_at = started + tracker.hedge_delay(name) if hedge else None
+
+    launch()
+    try:
+        while pending:
+            now = loop.time()
+            if now >= end:
+                break
+
+            timeout = end - now
+            can_hedge = next_idx < len(sources) and next_hedge_at is not None
+            if can_hedge:
+                timeout = min(timeout, max(0.0, next_hedge_at - now))
+
+            done, _ = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if not done:
+                if can_hedge and loop.time() >= next_hedge_at:
+                    tracker.hedges += 1
+                    launch()
+                continue
+
+            failed = False
+            for task in done:
+                name, started = pending.pop(task)
+                tracker.record(name, loop.time() - started)
+                try:
+                    result = task.result()
+                except Exception:
+                    failed = True
+                    continue
+
+                if is_valid(result):
+                    tracker.wins[name] = tracker.wins.get(name, 0) + 1
+                    return name, result
+                failed = True
+
+            if failed and next_idx < len(sources):
+                launch()
+    finally:
+        now = loop.time()
+        for task, (name, started) in pending.items():
+            tracker.record_censored(name, now - started)
+            task.cancel()
+
+    return None, None
@@ -0,0 +1,88 @@
+"""
+HTTP Connection Pool
+
+Long-lived, keep-alive httpx transports - one per upstream host (Gamma, CLOB).
+Avoids a fresh TCP+TLS handshake on every request.
+"""
+
+from typing import Dict
+from urllib.parse import urlsplit
+
+import httpx
+
+try:
+    import h2  # noqa: F401 - only needed for HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+
+
+class HTTPPool:
+    """
+    Pooled async HTTP clients keyed by host.
+
+    Each host gets its own httpx.AsyncClient so Gamma and CLOB
+    connection limits don't starve each other.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._http2 = Config.HTTP2_ENABLED and HTTP2_AVAILABLE
+
+        if Config.HTTP2_ENABLED and not HTTP2_AVAILABLE:
+            print("⚠️ HTTP2_ENABLED set but h2 not installed - run: pip install httpx[http2]")
+
+    def _make_client(self) -> httpx.AsyncClient:
+        """Create a pooled client with configured limits."""
+        limits = httpx.Limits(
+            max_connections=Config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=Config.HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY
+        )
+        return httpx.AsyncClient(
+            timeout=Config.HTTP_TIMEOUT,
+            limits=limits,
+            http2=self._http2
+        )
+
+    def get(self, url: str) -> httpx.AsyncClient:
+        """Get the pooled client for the host of a URL."""
+        host = urlsplit(url).netloc
+        client = self._clients.get(host)
+
+        if client is None or client.is_closed:
+            client = self._make_client()
+            self._clients[host] = client
+
+        return client
+
+    async def prewarm(self, url: str, timeout: float = 10) -> bool:
+        """
+        Open a keep-alive connection to a URL's host (DNS, TCP, TLS) by
+        sending one cheap GET. The response status is irrelevant.
+        """
+        try:
+            await self.get(url).get(url, timeout=timeout)
+            return True
+        except Exception as e:
+            print(f"⚠️ Prewarm failed for {urlsplit(url).netloc}: {type(e).__name__}")
+            return False
+
+    @property
+    def hosts(self) -> list:
+        """Hosts with an open pooled client."""
+        return [host for host, client in self._clients.items() if not client.is_closed]
+
+    async def close(self):
+        """Close all pooled clients."""
+        for client in self._clients.values():
+            try:
+                await client.aclose()
+            except Exception as e:
+                print(f"⚠️ HTTP pool close error: {e}")
+        self._clients.clear()
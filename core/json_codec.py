@@ -0,0 +1,51 @@
+"""
+JSON Codec
+
+Single place for JSON encode/decode across the HTTP client and the
+WebSocket feed. Uses orjson when it is installed (and not disabled via
+JSON_BACKEND=json), otherwise the stdlib. Decoders accept bytes directly
+so response bodies skip the bytes → str round-trip.
+"""
+
+import json
+from typing import Any, Union
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Both backends raise a subclass of this (orjson.JSONDecodeError included)
+JSONDecodeError = json.JSONDecodeError
+
+
+if ORJSON_AVAILABLE and Config.JSON_BACKEND != 'json':
+    BACKEND = 'orjson'
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Encode to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+
+else:
+    BACKEND = 'json'
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode JSON from bytes or str."""
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+    def dumps(obj: Any) -> str:
+        """Encode to a compact JSON string."""
+        return json.dumps(obj, separators=(',', ':'))
@@ -0,0 +1,190 @@
+"""
+Streaming JSON Arrays
+
+Incrementally decodes the elements of a top-level JSON array as bytes
+arrive, so callers can act on the first items of a large /events or
+/markets page without materialising the whole document, and stop reading
+as soon as they have enough.
+"""
+
+import asyncio
+import codecs
+import json
+import re
+from typing import Any, AsyncIterator, Iterable, List, Optional
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DELIMITERS = ' \t\n\r,]'
+
+
+class JSONArraySplitter:
+    """
+    Push-style decoder for a top-level JSON array.
+
+    feed() takes raw body chunks and returns the elements completed so
+    far, already decoded. Elements are decoded by the C scanner behind
+    json.JSONDecoder.raw_decode; only the unfinished tail of the current
+    element stays buffered between chunks. A partial element is retried
+    once the buffer has doubled, so huge elements split across many small
+    chunks don't cost quadratic time.
+    """
+
+    def __init__(self):
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._scan = json.JSONDecoder().raw_decode
+        self._buf = ''
+        self._started = False
+        self._need_comma = False
+        self._retry_at = 0
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        if self.done:
+            return []
+        self._buf += self._utf8.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        """Flush at end of stream; raises ValueError if the array is incomplete."""
+        items = [] if self.done else self._drain(final=True)
+        if not self.done:
+            raise ValueError("Truncated JSON array")
+        return items
+
+    def _drain(self, final: bool) -> List[Any]:
+        buf = self._buf
+        end = len(buf)
+        pos = _WHITESPACE.match(buf, 0).end()
+        items = []
+
+        if not self._started and pos < end:
+            if buf[pos] != '[':
+                raise ValueError("Expected a JSON array")
+            self._started = True
+            pos += 1
+
+        while self._started:
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos >= end:
+                break
+
+            c = buf[pos]
+            if c == ']':
+                self.done = True
+                pos += 1
+                break
+            if self._need_comma:
+                if c != ',':
+                    raise ValueError(f"Expected ',' at offset {pos}")
+                self._need_comma = False
+                pos += 1
+                continue
+
+            if not final and end - pos < self._retry_at:
+                break
+
+            try:
+                item, item_end = self._scan(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise ValueError("Malformed JSON array element")
+                self._retry_at = (end - pos) * 2
+                break
+
+            # A number is only complete once its delimiter has arrived ("1" of "1.5")
+            if not final and type(item) in (int, float):
+                if item_end == end or buf[item_end] not in _DELIMITERS:
+                    break
+
+            items.append(item)
+            pos = item_end
+            self._need_comma = True
+            self._retry_at = 0
+
+        self._buf = buf[pos:]
+        return items
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """
+    Decode the elements of a JSON array from an async stream of byte chunks.
+
+    Stops reading once the closing bracket is seen; breaking out early
+    leaves the rest of the stream unread.
+    """
+    splitter = JSONArraySplitter()
+
+    async for chunk in chunks:
+        for item in splitter.feed(chunk):
+            yield item
+        if splitter.done:
+            return
+
+    for item in splitter.close():
+        yield item
+
+
+class SharedArray:
+    """
+    Elements of one streamed array, readable by any number of consumers.
+
+    A single reader task append()s elements as they are decoded and
+    close()s the array at the end; every `async for` over it replays the
+    elements so far and then asks for more. The reader only reads the
+    next chunk once a consumer is waiting (wait_for_demand), so reading
+    never runs ahead of the consumers by more than a chunk, and stops
+    altogether when the owner cancels it after the last consumer left.
+    """
+
+    def __init__(self):
+        self.items: List[Any] = []
+        self.done = False
+        self.readers = 0  # Consumers iterating it (kept by the owner)
+        self.reader: Optional[asyncio.Task] = None  # Task filling it
+        self._wanted = 0
+        self._changed = asyncio.Event()
+        self._demand = asyncio.Event()
+
+    def extend(self, items: Iterable[Any]):
+        self.items.extend(items)
+        self._wake()
+
+    def close(self):
+        self.done = True
+        self._wake()
+
+    def _wake(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait_for_demand(self):
+        """Reader side: wait until a consumer wants more than has been decoded."""
+        while self._wanted <= len(self.items):
+            self._demand.clear()
+            await self._demand.wait()
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        i = 0
+        while True:
+            while i < len(self.items):
+                yield self.items[i]
+                i += 1
+            if self.done:
+                return
+            changed = self._changed
+            self._wanted = max(self._wanted, i + 1)
+            self._demand.set()
+            await changed.wait()
+
+
+def split_json_array(chunks: Iterable[bytes]):
+    """Synchronous counterpart of iter_json_array (benchmarks, snapshots)."""
+    splitter = JSONArraySplitter()
+
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+        if splitter.done:
+            return
+
+    yield from splitter.close()
@@ -0,0 +1,201 @@
+"""
+Market Parser
+
+One pass over a raw Gamma/CLOB market → its outcomes (name, token id,
+price). Handles both shapes the APIs return: a `tokens` list, or the
+string-encoded `outcomes` / `clobTokenIds` / `outcomePrices` triple.
+Decoded strings and whole outcome tuples are cached by raw value (for
+`tokens` markets, by each token's outcome/token_id/price), since the
+same market - and the same '["Yes", "No"]' - is parsed again on every
+browse. Built models are
+immutable, so build() also hands back the previous instance while a
+market's content is unchanged.
+"""
+
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+from core import json_codec
+from core.compact import intern_id
+
+DEFAULT_PRICE = 0.5
+
+
+class Outcome(NamedTuple):
+    """
+    One tradeable outcome of a market (e.g., Yes, No, Draw).
+
+    A NamedTuple rather than a frozen dataclass: markets have several
+    outcomes each, and tuple construction is several times cheaper.
+    """
+    name: str
+    token_id: str
+    price: float = DEFAULT_PRICE
+
+
+def _to_price(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _tokens_key(market: Dict, tokens) -> Tuple:
+    """Cache key for a `tokens` market: every field _from_tokens reads."""
+    return (
+        tuple((t.get('outcome'), t.get('token_id'), t.get('price')) for t in tokens),
+        market.get('outcomePrices')
+    )
+
+
+class MarketParser:
+    """Outcome extraction with a bounded cache of decoded JSON strings."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or Config.MARKET_PARSE_CACHE_SIZE
+        self._decoded: Dict[object, Tuple] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _store(self, key, value: Tuple) -> Tuple:
+        # Cheap bound: start over rather than track recency
+        if len(self._decoded) >= self.max_entries:
+            self._decoded.clear()
+        self._decoded[key] = value
+        return value
+
+    def decode_list(self, raw) -> Tuple:
+        """A JSON-array field (list or string-encoded list) as a tuple; () if invalid."""
+        if not raw:
+            return ()
+        if not isinstance(raw, str):
+            return tuple(raw) if isinstance(raw, (list, tuple)) else ()
+
+        decoded = self._decoded.get(raw)
+        if decoded is not None:
+            self.hits += 1
+            return decoded
+
+        self.misses += 1
+        try:
+            value = json_codec.loads(raw)
+        except ValueError:
+            value = ()
+        return self._store(raw, tuple(value) if isinstance(value, list) else ())
+
+    def outcomes(self, market: Dict) -> Tuple[Outcome, ...]:
+        """All outcomes of a raw market, in API order."""
+        tokens = market.get('tokens')
+        if tokens:
+            key = _tokens_key(market, tokens)
+            parse = lambda: self._from_tokens(market, tokens)
+        else:
+            key = (market.get('outcomes'), market.get('clobTokenIds'), market.get('outcomePrices'))
+            if not all(r is None or isinstance(r, str) for r in key):
+                return self._from_strings(*key)
+            parse = lambda: self._from_strings(*key)
+
+        try:
+            cached = self._decoded.get(key)
+        except TypeError:  # Unhashable token fields
+            return parse()
+        if cached is not None:
+            self.hits += 1
+            return cached
+        return self._store(key, parse())
+
+    def build(self, market: Dict, inputs: Tuple[Hashable, ...], factory: Callable[[Tuple[Outcome, ...]], Any]) -> Any:
+        """
+        factory(outcomes) for a raw market, memoized by content.
+
+        `inputs` must hold every other market field the factory reads, so
+        the key changes whenever the built object would. Markets with a
+        `tokens` list are keyed on each token's outcome/token_id/price.
+        """
+        tokens = market.get('tokens')
+        if tokens:
+            key = (_tokens_key(market, tokens), inputs)
+        else:
+            key = (market.get('outcomes'), market.get('clobTokenIds'), market.get('outcomePrices'), inputs)
+        try:
+            built = self._decoded.get(key)
+        except TypeError:  # Non-string (already decoded) fields
+            return factory(self.outcomes(market))
+        if built is not None:
+            self.hits += 1
+            return built
+        return self._store(key, factory(self.outcomes(market)))
+
+    def _from_tokens(self, market: Dict, tokens) -> Tuple[Outcome, ...]:
+        prices = None
+        result = []
+        for i, token in enumerate(tokens):
+            price = _to_price(token.get('price'))
+            # Tokens without a price fall back to outcomePrices
+            if price is None:
+                if prices is None:
+                    prices = self.decode_list(market.get('outcomePrices'))
+                if i < len(prices):
+                    price = _to_price(prices[i])
+            result.append(Outcome(
+                intern_id(token.get('outcome', '')),
+                intern_id(str(token.get('token_id', ''))),
+                DEFAULT_PRICE if price is None else price
+            ))
+        return tuple(result)
+
+    def _from_strings(self, raw_names, raw_token_ids, raw_prices) -> Tuple[Outcome, ...]:
+        names = self.decode_list(raw_names)
+        token_ids = self.decode_list(raw_token_ids)
+        prices = self.decode_list(raw_prices)
+
+        result = []
+        for i in range(max(len(names), len(token_ids))):
+            price = _to_price(prices[i]) if i < len(prices) else None
+            result.append(Outcome(
+                intern_id(str(names[i])) if i < len(names) else '',
+                intern_id(str(token_ids[i])) if i < len(token_ids) else '',
+                DEFAULT_PRICE if price is None else price
+            ))
+        return tuple(result)
+
+    def get_stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._decoded),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0
+        }
+
+
+def is_yes_no(outcomes: Tuple[Outcome, ...]) -> bool:
+    """
+    True if a market's outcomes are literally Yes/No (or unknown), so it
+    can be shown and traded as YES/NO. Anything else (Lakers/Celtics,
+    Home/Draw/Away) must be shown and traded by outcome name.
+    """
+    return all(o.name.lower() in ('yes', 'no') for o in outcomes)
+
+
+def yes_no(outcomes: Tuple[Outcome, ...]) -> Tuple[Optional[Outcome], Optional[Outcome]]:
+    """
+    The YES/NO pair of a market: outcomes named Yes/No, or the two sides
+    of any other binary market (e.g., Lakers/Celtics) for price summaries.
+    Markets with more than two named outcomes have no YES/NO pair. Check
+    is_yes_no() before trading a side as "YES"/"NO".
+    """
+    yes = no = None
+    for outcome in outcomes:
+        name = outcome.name.lower()
+        if name == 'yes':
+            yes = outcome
+        elif name == 'no':
+            no = outcome
+
+    if yes is None and no is None and len(outcomes) == 2:
+        yes, no = outcomes
+    return yes, no
@@ -0,0 +1,266 @@
+"""
+Local Order Books
+
+Per-token L2 books kept from WebSocket snapshots and deltas, so the 📖
+screen and quotes are served from memory. Each side is a sorted array of
+price levels plus a price → size map: size changes are a dict update,
+the best levels are the ends of the array, and adding or removing a
+level is a bisect plus an O(n) list shift. n is bounded by the price
+grid (at most 1000 levels at a 0.001 tick, usually a few dozen), so the
+shift is a short memmove rather than a tree or heap rebalance.
+
+A book stops being served when it can't be trusted (a sequence gap, a
+crossed book) until the next snapshot. Deltas older than the current
+snapshot are dropped rather than applied on top of it.
+"""
+
+import time
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Delta sides as sent by the CLOB feed
+BUY = 'BUY'
+SELL = 'SELL'
+
+
+def _level(level) -> Optional[Tuple[float, float]]:
+    """(price, size) from a {'price', 'size'} dict, an SDK OrderSummary or a [price, size] pair."""
+    try:
+        if isinstance(level, dict):
+            return float(level['price']), float(level['size'])
+        if hasattr(level, 'price'):
+            return float(level.price), float(level.size)
+        return float(level[0]), float(level[1])
+    except (TypeError, ValueError, KeyError, IndexError, AttributeError):
+        return None
+
+
+class BookSide:
+    """Price levels of one side, kept sorted ascending."""
+
+    __slots__ = ('prices', 'sizes')
+
+    def __init__(self):
+        self.prices: List[float] = []
+        self.sizes: Dict[float, float] = {}
+
+    def replace(self, levels: Iterable):
+        sizes = {}
+        for level in levels:
+            parsed = _level(level)
+            if parsed and parsed[1] > 0:
+                sizes[parsed[0]] = parsed[1]
+        self.sizes = sizes
+        self.prices = sorted(sizes)
+
+    def set(self, price: float, size: float):
+        """Set a level's size; size 0 removes it. O(1) for an existing level, O(n) to add or remove one."""
+        if size > 0:
+            if price not in self.sizes:
+                insort(self.prices, price)
+            self.sizes[price] = size
+        elif self.sizes.pop(price, None) is not None:
+            del self.prices[bisect_left(self.prices, price)]
+
+    def lowest(self, depth: int) -> List[Dict[str, float]]:
+        sizes = self.sizes
+        return [{'price': p, 'size': sizes[p]} for p in self.prices[:depth]]
+
+    def highest(self, depth: int) -> List[Dict[str, float]]:
+        sizes = self.sizes
+        return [{'price': p, 'size': sizes[p]} for p in reversed(self.prices[-depth:])] if depth > 0 else []
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+
+class OrderBook:
+    """L2 book for one token."""
+
+    __slots__ = ('token_id', 'bids', 'asks', 'seq', 'hash', 'timestamp', 'synced', 'updated_at')
+
+    def __init__(self, token_id: str):
+        self.token_id = token_id
+        self.bids = BookSide()
+        self.asks = BookSide()
+        self.seq: Optional[int] = None
+        self.hash: Optional[str] = None
+        self.timestamp = 0.0
+        self.synced = False
+        self.updated_at = 0.0
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        return self.bids.prices[-1] if self.bids.prices else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return self.asks.prices[0] if self.asks.prices else None
+
+    @property
+    def mid(self) -> Optional[float]:
+        bid, ask = self.best_bid, self.best_ask
+        return (bid + ask) / 2 if bid is not None and ask is not None else None
+
+    def is_crossed(self) -> bool:
+        bid, ask = self.best_bid, self.best_ask
+        return bid is not None and ask is not None and bid >= ask
+
+    def levels(self, depth: int = 10) -> Dict[str, Any]:
+        """Top levels in get_order_book() shape (bids high→low, asks low→high)."""
+        bid, ask = self.best_bid, self.best_ask
+        return {
+            'bids': self.bids.highest(depth),
+            'asks': self.asks.lowest(depth),
+            'spread': ask - bid if bid is not None and ask is not None else 0
+        }
+
+
+def _to_int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_timestamp(value) -> float:
+    try:
+        stamp = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return stamp / 1000 if stamp > 1e12 else stamp  # Milliseconds
+
+
+class OrderBookStore:
+    """
+    Books for every followed token.
+
+    snapshot() replaces a book and marks it in sync; delta() applies
+    level changes. Both take the feed's optional sequence number, hash
+    and timestamp: a sequence gap or a crossed book marks the book out
+    of sync, a delta stamped before the book's snapshot is dropped, and
+    a snapshot with the hash the book already has is skipped.
+    """
+
+    def __init__(self):
+        self._books: Dict[str, OrderBook] = {}
+        self.snapshots = 0
+        self.deltas = 0
+        self.dropped = 0
+        self.desyncs = 0
+
+    def get(self, token_id: str) -> Optional[OrderBook]:
+        """The token's book if it is in sync, else None."""
+        book = self._books.get(token_id)
+        return book if book is not None and book.synced else None
+
+    def levels(self, token_id: str, depth: int = 10) -> Optional[Dict[str, Any]]:
+        """Top levels of an in-sync book, or None (caller falls back to REST)."""
+        book = self.get(token_id)
+        return book.levels(depth) if book is not None else None
+
+    def snapshot(
+        self,
+        token_id: str,
+        bids: Iterable,
+        asks: Iterable,
+        seq=None,
+        hash: Optional[str] = None,
+        timestamp=None
+    ) -> OrderBook:
+        """Replace a token's book with a full snapshot."""
+        book = self._books.get(token_id)
+        if book is None:
+            book = self._books[token_id] = OrderBook(token_id)
+        elif hash and book.synced and hash == book.hash:
+            return book  # Same book re-sent
+
+        book.bids.replace(bids)
+        book.asks.replace(asks)
+        book.seq = _to_int(seq)
+        book.hash = hash
+        book.timestamp = _to_timestamp(timestamp)
+        book.updated_at = time.monotonic()
+        book.synced = not book.is_crossed()
+        self.snapshots += 1
+        if not book.synced:
+            self.desyncs += 1
+        return book
+
+    def delta(
+        self,
+        token_id: str,
+        changes: Iterable[Tuple[str, Any, Any]],
+        seq=None,
+        hash: Optional[str] = None,
+        timestamp=None
+    ) -> Optional[OrderBook]:
+        """
+        Apply (side, price, size) level changes; side is BUY (bids) or SELL
+        (asks) and size 0 removes the level. Returns the book if it is
+        still in sync.
+        """
+        book = self._books.get(token_id)
+        if book is None or not book.synced:
+            self.dropped += 1
+            return None
+
+        stamp = _to_timestamp(timestamp)
+        if stamp and stamp < book.timestamp:
+            self.dropped += 1  # Predates the snapshot
+            return book
+
+        seq = _to_int(seq)
+        if seq is not None and book.seq is not None:
+            if seq <= book.seq:
+                self.dropped += 1  # Replayed
+                return book
+            if seq != book.seq + 1:
+                return self._desync(book)
+
+        for side, price, size in changes:
+            try:
+                price, size = float(price), float(size)
+            except (TypeError, ValueError):
+                continue
+            (book.bids if str(side).upper() == BUY else book.asks).set(price, size)
+
+        if book.is_crossed():
+            return self._desync(book)
+
+        if seq is not None:
+            book.seq = seq
+        if hash:
+            book.hash = hash
+        if stamp:
+            book.timestamp = stamp
+        book.updated_at = time.monotonic()
+        self.deltas += 1
+        return book
+
+    def _desync(self, book: OrderBook) -> None:
+        book.synced = False
+        self.desyncs += 1
+        return None
+
+    def invalidate(self, token_ids: Optional[Iterable[str]] = None):
+        """Mark books out of sync (all, or token_ids), e.g. after a disconnect lost deltas."""
+        if token_ids is None:
+            books = self._books.values()
+        else:
+            books = [b for b in map(self._books.get, token_ids) if b is not None]
+        for book in books:
+            book.synced = False
+
+    def discard(self, token_id: str):
+        self._books.pop(token_id, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'books': len(self._books),
+            'synced': sum(1 for b in self._books.values() if b.synced),
+            'snapshots': self.snapshots,
+            'deltas': self.deltas,
+            'dropped': self.dropped,
+            'desyncs': self.desyncs
+        }
@@ -0,0 +1,178 @@
+"""
+Cursor Pagination
+
+Lazily loaded lists behind the events/markets keyboards. Items are
+fetched in cursor-sized batches as the user pages forward, and the page
+after the one on screen is loaded in the background so Next is instant.
+Open pagers live in a registry keyed by user and listing, not in
+user_data, and are closed (loads cancelled, cursor closed) when the
+listing is replaced or left.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+
+
+# fetch(cursor, limit) -> (items, next_cursor or None at the end)
+PageFetch = Callable[[Any, int], Awaitable[Tuple[List[Any], Optional[Any]]]]
+
+
+class StreamCursor:
+    """
+    Opaque cursor over an async iterator, for lists with no upstream
+    offset (e.g. events merged from several discovery sources). Each page
+    continues the same iterator, so earlier pages are never fetched again.
+    """
+
+    def __init__(self, items: AsyncIterator[Any]):
+        self._items = items
+        self._ahead: List[Any] = []
+
+    async def take(self, limit: int) -> Tuple[List[Any], Optional['StreamCursor']]:
+        """The next `limit` items, and this cursor (None once the iterator is exhausted)."""
+        page, self._ahead = self._ahead, []
+        # One extra item tells whether a next page exists
+        while len(page) <= limit:
+            try:
+                page.append(await anext(self._items))
+            except StopAsyncIteration:
+                return page, None
+        self._ahead = page[limit:]
+        return page[:limit], self
+
+    async def aclose(self):
+        """Close the underlying iterator (stops the requests feeding it)."""
+        self._ahead = []
+        aclose = getattr(self._items, 'aclose', None)
+        if aclose is not None:
+            await aclose()
+
+
+class Pager:
+    """
+    Cursor-paginated list that grows on demand.
+
+    `items` is the loaded prefix and only ever grows in place, so
+    handlers can keep indexing it (evt_/mkt_ callbacks) while more pages
+    load. Foreground loads and background prefetch share one in-flight
+    batch. close() cancels both and closes a cursor that holds resources
+    (a StreamCursor's open iterator).
+    """
+
+    def __init__(self, fetch: PageFetch, page_size: int, batch_size: Optional[int] = None, cursor: Any = 0):
+        self._fetch = fetch
+        self.page_size = page_size
+        self.batch_size = batch_size or max(page_size, Config.PAGINATION_BATCH_SIZE)
+        self.items: List[Any] = []
+        self.exhausted = False
+        self.closed = False
+        self._cursor = cursor
+        self._loading: Optional[asyncio.Task] = None
+        self._prefetch: Optional[asyncio.Task] = None
+
+    async def _load_batch(self) -> bool:
+        """Fetch the next batch; False if it failed."""
+        try:
+            items, cursor = await self._fetch(self._cursor, self.batch_size)
+        except Exception as e:
+            print(f"⚠️ Page fetch error: {e}")
+            return False
+
+        if self.closed:
+            return False
+        self.items.extend(items)
+        self._cursor = cursor
+        self.exhausted = cursor is None
+        return True
+
+    async def _ensure(self, count: int):
+        """Load until at least `count` items are available or the list ends."""
+        while len(self.items) < count and not self.exhausted and not self.closed:
+            if self._loading is None or self._loading.done():
+                self._loading = asyncio.ensure_future(self._load_batch())
+            try:
+                if not await asyncio.shield(self._loading):
+                    break
+            except asyncio.CancelledError:
+                if not self.closed:
+                    raise
+                break
+
+    async def page(self, page: int) -> List[Any]:
+        """Items on a page, loading it (plus one item to know if a next page exists)."""
+        end = (page + 1) * self.page_size
+        await self._ensure(end + 1)
+        return self.items[page * self.page_size:end]
+
+    def has_next(self, page: int) -> bool:
+        return len(self.items) > (page + 1) * self.page_size
+
+    def prefetch(self, page: int):
+        """Load the page after `page` in the background."""
+        if self.exhausted or self.closed or (self._prefetch is not None and not self._prefetch.done()):
+            return
+        self._prefetch = asyncio.ensure_future(self._ensure((page + 2) * self.page_size + 1))
+
+    async def close(self):
+        """Stop loading: cancel in-flight loads and close the cursor. Loaded items stay."""
+        if self.closed:
+            return
+        self.closed = True
+        tasks = [t for t in (self._prefetch, self._loading) if t is not None and not t.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loading = self._prefetch = None
+
+        aclose = getattr(self._cursor, 'aclose', None)
+        self._cursor = None
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception as e:
+                print(f"⚠️ Pager close error: {e}")
+
+    @property
+    def total_label(self) -> str:
+        """Loaded count, with '+' while more may follow (e.g. '25+')."""
+        return f"{len(self.items)}" if self.exhausted else f"{len(self.items)}+"
+
+
+class PagerRegistry:
+    """Open pagers by (owner, listing key). Opening a listing closes the one it replaces."""
+
+    def __init__(self):
+        self._pagers: Dict[Tuple[Hashable, str], Pager] = {}
+
+    def get(self, owner: Hashable, key: str) -> Optional[Pager]:
+        return self._pagers.get((owner, key))
+
+    async def open(self, owner: Hashable, key: str, pager: Pager) -> Pager:
+        await self.close(owner, key)
+        self._pagers[(owner, key)] = pager
+        return pager
+
+    async def close(self, owner: Hashable, key: Optional[str] = None):
+        """Close one listing's pager, or every pager of `owner` if key is None."""
+        keys = [k for k in self._pagers if k[0] == owner and (key is None or k[1] == key)]
+        for k in keys:
+            await self._pagers.pop(k).close()
+
+    def __len__(self) -> int:
+        return len(self._pagers)
+
+
+# Singleton instance
+_registry: Optional[PagerRegistry] = None
+
+def get_pager_registry() -> PagerRegistry:
+    """Get or create the pager registry singleton."""
+    global _registry
+    if _registry is None:
+        _registry = PagerRegistry()
+    return _registry
@@ -6,11 +6,13 @@ Supports sub-markets (toss winner, highest scorer, over/under).
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any
+import heapq
+import time
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import httpx
-import json
 
 try:
     from py_clob_client.client import ClobClient
@@ -27,9 +29,27 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import Config
+from core.http_pool import HTTPPool
+from core.singleflight import SingleFlight, request_key
+from core.response_cache import ResponseCache, gamma_cache_ttl, FRESH, STALE
+from core.rate_limiter import (
+    RateLimiter, parse_retry_after, PRIORITY_TRADING, PRIORITY_DISCOVERY
+)
+from core.hedging import LatencyTracker, hedged_race
+from core.circuit_breaker import BreakerRegistry, CLOSED
+from core.json_stream import JSONArraySplitter, SharedArray
+from core.catalog import MarketCatalog
+from core.pagination import StreamCursor
+from core.sport_matcher import SportMatcher, SportClassifier
+from core.compact import PackedText, intern_id, pack_text, unpack_text
+from core.market_parser import MarketParser, Outcome, yes_no, DEFAULT_PRICE
+from core.ws_client import get_ws_client
+from core.subscriptions import get_subscription_manager
+from core.order_book import OrderBook
+from core import json_codec
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Position:
     """Represents a trading position."""
     token_id: str
@@ -43,8 +63,12 @@ class Position:
     pnl: float
     pnl_percent: float
 
+    def __post_init__(self):
+        object.__setattr__(self, 'token_id', intern_id(self.token_id))
+        object.__setattr__(self, 'condition_id', intern_id(self.condition_id))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SubMarket:
     """Represents a sub-market within an event (e.g., toss winner, top scorer)."""
     condition_id: str
@@ -54,9 +78,17 @@ class SubMarket:
     yes_price: float
     no_price: float
     group_item_title: str = ""  # e.g., "Toss Winner", "Top Scorer"
+    outcomes: Tuple[Outcome, ...] = ()  # Every outcome, incl. multi-outcome markets
+
+    def __post_init__(self):
+        object.__setattr__(self, 'condition_id', intern_id(self.condition_id))
+        object.__setattr__(self, 'question', intern_id(self.question))
+        object.__setattr__(self, 'yes_token_id', intern_id(self.yes_token_id))
+        object.__setattr__(self, 'no_token_id', intern_id(self.no_token_id))
+        object.__setattr__(self, 'group_item_title', intern_id(self.group_item_title))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class League:
     """Represents a sports league/series (e.g., IPL, EPL, NBA)."""
     series_id: str
@@ -67,24 +99,40 @@ class League:
     event_count: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Event:
-    """Represents a sports event with multiple sub-markets."""
+    """
+    Represents a sports event with multiple sub-markets.
+    
+    Built with `_description=<text>`; it is kept packed and read back
+    through the `description` property.
+    """
     event_id: str
     title: str
-    description: str
     sport: str
     start_date: Optional[str] = None
     end_date: Optional[str] = None
-    markets: List[SubMarket] = field(default_factory=list)
+    markets: Tuple[SubMarket, ...] = ()
+    _description: PackedText = field(default='', repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'event_id', intern_id(self.event_id))
+        object.__setattr__(self, 'title', intern_id(self.title))
+        object.__setattr__(self, 'sport', intern_id(self.sport))
+        object.__setattr__(self, 'markets', tuple(self.markets))
+        object.__setattr__(self, '_description', pack_text(self._description))
 
+    @property
+    def description(self) -> str:
+        """Description text (decompressed on access)."""
+        return unpack_text(self._description)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Market:
-    """Legacy Market class for backward compatibility."""
+    """Legacy Market class for backward compatibility (description packed like Event's)."""
     condition_id: str
     question: str
-    description: str
     yes_token_id: str
     no_token_id: str
     yes_price: float
@@ -93,9 +141,38 @@ class Market:
     category: str
     sport: str = ""
     end_date: Optional[str] = None
+    outcomes: Tuple[Outcome, ...] = ()
+    _description: PackedText = field(default='', repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'condition_id', intern_id(self.condition_id))
+        object.__setattr__(self, 'question', intern_id(self.question))
+        object.__setattr__(self, 'yes_token_id', intern_id(self.yes_token_id))
+        object.__setattr__(self, 'no_token_id', intern_id(self.no_token_id))
+        object.__setattr__(self, 'category', intern_id(self.category))
+        object.__setattr__(self, 'sport', intern_id(self.sport))
+        object.__setattr__(self, '_description', pack_text(self._description))
+    
+    @property
+    def description(self) -> str:
+        """Description text (decompressed on access)."""
+        return unpack_text(self._description)
+    
+    def to_sub_market(self) -> SubMarket:
+        """This market as a standalone SubMarket (search results, favorites)."""
+        return SubMarket(
+            condition_id=self.condition_id,
+            question=self.question,
+            yes_token_id=self.yes_token_id,
+            no_token_id=self.no_token_id,
+            yes_price=self.yes_price,
+            no_price=self.no_price,
+            group_item_title='',
+            outcomes=self.outcomes
+        )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OrderResult:
     """Result of a trade execution."""
     success: bool
@@ -105,6 +182,46 @@ class OrderResult:
     error: Optional[str] = None
 
 
+@dataclass(frozen=True, slots=True)
+class Quote:
+    """Top of book and last trade for one token (None where unknown)."""
+    bid: Optional[float] = None
+    ask: Optional[float] = None
+    mid: Optional[float] = None
+    last: Optional[float] = None
+    
+    @property
+    def price(self) -> float:
+        """Mid, else last trade price, else 0.0."""
+        return self.mid or self.last or 0.0
+
+
+def _level_price(level) -> Optional[float]:
+    """Price of one book level ({'price', 'size'} dict or [price, size] pair)."""
+    try:
+        return float(level.get('price') if isinstance(level, dict) else level[0])
+    except (TypeError, ValueError, IndexError, KeyError):
+        return None
+
+
+def _book_quote(book: Dict, last: Optional[float] = None) -> Quote:
+    """Quote from a raw CLOB book; levels may arrive in any order."""
+    bids = [p for p in map(_level_price, book.get('bids') or ()) if p]
+    asks = [p for p in map(_level_price, book.get('asks') or ()) if p]
+    bid = max(bids) if bids else None
+    ask = min(asks) if asks else None
+    mid = (bid + ask) / 2 if bid is not None and ask is not None else None
+    return Quote(bid, ask, mid, last)
+
+
+def _trade_price(trade) -> Optional[float]:
+    try:
+        price = float(trade.get('price'))
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return price or None
+
+
 # ═══════════════════════════════════════════════════════════════════
 # SPORT KEYWORDS - for detection and filtering
 # ═══════════════════════════════════════════════════════════════════
@@ -175,19 +292,37 @@ SPORT_SEARCH_QUERIES = {
 }
 
 
-def detect_sport(text: str) -> str:
-    """Detect which sport a text belongs to."""
-    text_lower = text.lower()
-    for sport, keywords in SPORT_KEYWORDS.items():
-        if any(keyword in text_lower for keyword in keywords):
-            return sport
-    return ''
+# Compiled once - whole-word keyword matching in a single pass
+SPORT_MATCHER = SportMatcher(SPORT_KEYWORDS)
+
+# Shared by every discovery path - each event/market version is classified once
+SPORT_CLASSIFIER = SportClassifier(SPORT_MATCHER, Config.CLASSIFICATION_CACHE_SIZE)
+
+# Single outcome parser for all market shapes (caches decoded outcomePrices etc.)
+MARKET_PARSER = MarketParser()
+
+
+def detect_sport(text: str, key: str = '') -> str:
+    """Detect which sport a text belongs to (the sport with the most keyword hits)."""
+    return SPORT_CLASSIFIER.detect(text, key)
 
 
 def is_sports_market(question: str, description: str = '') -> bool:
     """Check if a market is sports-related."""
-    text = f"{question} {description}".lower()
-    return any(keyword in text for keyword in ALL_SPORT_KEYWORDS)
+    return SPORT_MATCHER.matches(f"{question} {description}")
+
+
+def matches_sport(text: str, sport: str = '', key: str = '') -> bool:
+    """
+    Check text against one sport's keywords (any sport if empty).
+
+    Pass the event/condition id as `key` to memoize the classification.
+    """
+    if not sport:
+        return SPORT_CLASSIFIER.matches(text, None, key)
+    if sport in SPORT_KEYWORDS:
+        return SPORT_CLASSIFIER.matches(text, sport, key)
+    return sport in text.lower()
 
 
 class PolymarketClient:
@@ -205,23 +340,57 @@ class PolymarketClient:
         self.clob_client = None
         self._paper_balance = 1000.0
         self._paper_positions: Dict[str, Dict] = {}
-        
-        if not self.is_paper and CLOB_AVAILABLE and Config.POLYGON_PRIVATE_KEY:
-            self._init_live_client()
-        else:
+        self._http = HTTPPool()
+        self._flights = SingleFlight()
+        self._cache = ResponseCache()
+        self._limiter = RateLimiter()
+        self._price_latency = LatencyTracker()
+        self._breakers = BreakerRegistry()
+        self._bulk_retry_at = 0.0  # Bulk quote endpoints skipped until then (monotonic)
+        self._background_tasks: set = set()
+        self._pages: Dict[tuple, SharedArray] = {}  # Streamed pages being read, shared by their consumers
+        self.catalog = MarketCatalog(self._fetch_catalog_page)
+        
+        # Live client setup (credential derivation) runs in the background
+        self._wants_live = not self.is_paper and CLOB_AVAILABLE and bool(Config.POLYGON_PRIVATE_KEY)
+        self._live_init: Optional[asyncio.Future] = None
+        self.startup_timings: Dict[str, float] = {}
+        
+        if not self._wants_live:
             print(f"📝 Paper trading mode")
     
+    def _start_live_init(self) -> Optional[asyncio.Future]:
+        """Start live client init on a worker thread (idempotent)."""
+        if self._wants_live and self._live_init is None:
+            started = time.perf_counter()
+            
+            def record(_):
+                self.startup_timings['live_client'] = time.perf_counter() - started
+                print(f"⏱️ Live client ready in {self.startup_timings['live_client']:.2f}s")
+            
+            self._live_init = asyncio.ensure_future(asyncio.to_thread(self._init_live_client))
+            self._live_init.add_done_callback(record)
+        return self._live_init
+    
+    async def _ensure_live_client(self):
+        """Wait for live client init before a call that needs clob_client."""
+        task = self._start_live_init()
+        if task is not None and not task.done():
+            await asyncio.shield(task)
+    
     def _init_live_client(self):
-        """Initialize live trading client."""
+        """Initialize live trading client (blocking - run via _start_live_init)."""
         try:
-            self.clob_client = ClobClient(
+            clob_client = ClobClient(
                 Config.POLYMARKET_CLOB_URL,
                 key=Config.POLYGON_PRIVATE_KEY,
                 chain_id=Config.POLYGON_CHAIN_ID,
                 signature_type=Config.SIGNATURE_TYPE,
                 funder=Config.FUNDER_ADDRESS if Config.FUNDER_ADDRESS else None
             )
-            self.clob_client.set_api_creds(self.clob_client.create_or_derive_api_creds())
+            clob_client.set_api_creds(clob_client.create_or_derive_api_creds())
+            # Publish only once credentials are set - other coroutines read this
+            self.clob_client = clob_client
             print("✅ Live Polymarket client initialized")
         except Exception as e:
             print(f"⚠️ Failed to init live client: {e}")
@@ -232,64 +401,295 @@ class PolymarketClient:
         url: str, 
         params: Optional[Dict] = None,
         max_retries: int = 3,
-        timeout: int = 30
+        timeout: int = 30,
+        priority: int = PRIORITY_DISCOVERY
     ) -> Optional[Dict]:
         """
         Fetch data from URL with exponential backoff retry logic.
         
+        Concurrent identical requests are coalesced into one round-trip
+        and one JSON decode; the decoded result is shared, so callers
+        must not mutate it.
+        
+        Gamma discovery endpoints are served from the response cache:
+        fresh entries return immediately, stale entries return immediately
+        and trigger a single background refresh.
+        
+        Every attempt passes through the shared per-host rate limiter,
+        which honors Retry-After and adapts its rate to 429 responses,
+        and through the endpoint family's circuit breaker. While a breaker
+        is open, calls fail fast and cacheable URLs fall back to the last
+        cached response, however old.
+        
         Args:
             url: The URL to fetch
             params: Query parameters
             max_retries: Max retry attempts (default 3)
             timeout: Request timeout in seconds
+            priority: PRIORITY_TRADING or PRIORITY_DISCOVERY
         
         Returns:
             JSON response as dict, or None if all retries failed
         """
-        import asyncio
+        key = request_key('GET', url, params)
+        ttl = gamma_cache_ttl(url)
+        
+        def fetch():
+            return self._flights.do(
+                key,
+                lambda: self._fetch_and_cache(key, ttl, url, params, max_retries, timeout, priority)
+            )
+        
+        if ttl:
+            cached, state = self._cache.get(key)
+            if state == FRESH:
+                return cached
+            if state == STALE:
+                self._spawn(fetch())
+                return cached
+        
+        data = await fetch()
+        
+        if data is None and ttl and self._breakers.for_url(url).state != CLOSED:
+            return self._cache.peek(key)
+        return data
+    
+    async def _fetch_and_cache(
+        self,
+        key: tuple,
+        ttl: float,
+        url: str,
+        params: Optional[Dict],
+        max_retries: int,
+        timeout: int,
+        priority: int
+    ) -> Optional[Dict]:
+        """Fetch and store successful responses for cacheable URLs."""
+        data = await self._fetch_uncoalesced(url, params, max_retries, timeout, priority)
+        if ttl and data is not None:
+            self._cache.set(key, data, ttl)
+        return data
+    
+    async def _fetch_catalog_page(self, url: str, params: Dict) -> Optional[List[Dict]]:
+        """Uncached, uncoalesced page fetch for catalog syncs."""
+        data = await self._fetch_uncoalesced(url, params, max_retries=2, timeout=60)
+        return data if isinstance(data, list) else None
+    
+    def _spawn(self, coro):
+        """Run a coroutine in the background, keeping a reference until done."""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    async def _fetch_uncoalesced(
+        self,
+        url: str,
+        params: Optional[Dict],
+        max_retries: int,
+        timeout: int,
+        priority: int = PRIORITY_DISCOVERY,
+        json_body: Any = None
+    ) -> Optional[Dict]:
+        """
+        Retry loop behind _fetch_with_retry (one call per coalesced key).
+        With json_body it POSTs the body instead (bulk CLOB reads).
+        """
+        breaker = self._breakers.for_url(url)
         
         for attempt in range(max_retries):
+            is_last = attempt == max_retries - 1
+            wait_time = 2 ** attempt  # Exponential backoff: 1, 2, 4 seconds
+            
+            # Fail fast while the upstream is known to be down
+            if not breaker.allow():
+                return None
+            
             try:
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    resp = await client.get(url, params=params)
-                    
-                    # Success
-                    if resp.status_code == 200:
-                        return resp.json()
-                    
-                    # Permanent errors - don't retry
-                    if resp.status_code in (400, 404):
-                        print(f"⚠️ Permanent error {resp.status_code} for {url}")
-                        return None
-                    
-                    # Rate limiting or server error - retry with backoff
-                    if resp.status_code in (429, 500, 502, 503):
-                        wait_time = 2 ** attempt  # Exponential backoff: 1, 2, 4 seconds
-                        print(f"⏳ Got {resp.status_code}, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    
-                    # Other error codes
-                    print(f"⚠️ Unexpected status {resp.status_code} for {url}")
+                await self._limiter.acquire(url, priority)
+                client = self._http.get(url)
+                if json_body is None:
+                    resp = await client.get(url, params=params, timeout=timeout)
+                else:
+                    resp = await client.post(
+                        url,
+                        content=json_codec.dumps(json_body),
+                        headers={'Content-Type': 'application/json'},
+                        timeout=timeout
+                    )
+                
+                # Only server errors count against the breaker
+                if resp.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                
+                # Success
+                if resp.status_code == 200:
+                    self._limiter.on_success(url)
+                    return json_codec.loads(resp.content)
+                
+                # Permanent errors - don't retry
+                if resp.status_code in (400, 404):
+                    print(f"⚠️ Permanent error {resp.status_code} for {url}")
                     return None
-                    
+                
+                # Throttled - slow down every caller of this host, honor Retry-After
+                retry_after = None
+                if resp.status_code in (429, 503):
+                    retry_after = parse_retry_after(resp.headers.get('Retry-After'))
+                    self._limiter.on_throttled(url, retry_after)
+                
+                # Rate limiting or server error - retry with backoff
+                if resp.status_code in (429, 500, 502, 503):
+                    if is_last:
+                        break
+                    if retry_after is not None:
+                        # The limiter pauses the host until then; acquire() does the waiting
+                        print(f"⏳ Got {resp.status_code}, retrying after Retry-After {retry_after:g}s (attempt {attempt + 1}/{max_retries})")
+                        continue
+                    print(f"⏳ Got {resp.status_code}, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
+                    continue
+                
+                # Other error codes
+                print(f"⚠️ Unexpected status {resp.status_code} for {url}")
+                return None
+                
             except httpx.TimeoutException:
-                wait_time = 2 ** attempt
+                breaker.record_failure()
+                if is_last:
+                    break
                 print(f"⏳ Timeout, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
                 await asyncio.sleep(wait_time)
                 
             except httpx.ConnectError:
-                wait_time = 2 ** attempt
+                breaker.record_failure()
+                if is_last:
+                    break
                 print(f"⏳ Connection error, retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})")
                 await asyncio.sleep(wait_time)
                 
             except Exception as e:
+                breaker.record_failure()
                 print(f"⚠️ Fetch error: {e}")
                 return None
         
         print(f"❌ All {max_retries} retries failed for {url}")
         return None
     
+    async def _stream_items(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        timeout: int = 30,
+        priority: int = PRIORITY_DISCOVERY
+    ) -> AsyncIterator[Any]:
+        """
+        Yield the elements of a JSON array response one at a time.
+        
+        Elements are decoded as the body arrives and only as fast as they
+        are consumed, so a caller that stops early (wrap the call in
+        contextlib.aclosing and break) stops the download and decode.
+        Concurrent streams for the same key share one read, which is
+        cancelled when the last of them stops; only a page read to the end
+        is cached, under the same key as _fetch_with_retry. Rate limiter
+        and circuit breaker behave as in _fetch_with_retry; streamed reads
+        are single attempt.
+        """
+        key = request_key('GET', url, params)
+        ttl = gamma_cache_ttl(url)
+        
+        if ttl:
+            cached, state = self._cache.get(key)
+            if state == STALE:
+                self._spawn(self._fetch_with_retry(
+                    url, params=params, max_retries=1, timeout=timeout, priority=priority
+                ))
+            if state in (FRESH, STALE):
+                for item in cached:
+                    yield item
+                return
+        
+        page = self._pages.get(key)
+        if page is None:
+            if not self._breakers.for_url(url).allow():
+                for item in (self._cache.peek(key) if ttl else None) or []:
+                    yield item
+                return
+            
+            page = self._pages[key] = SharedArray()
+            page.reader = self._spawn(self._read_page(key, ttl, url, params, timeout, priority, page))
+        
+        page.readers += 1
+        try:
+            async for item in page:
+                yield item
+        finally:
+            page.readers -= 1
+            if not page.readers and not page.done:
+                # Last consumer stopped early: stop reading, don't cache a partial page
+                page.reader.cancel()
+                if self._pages.get(key) is page:
+                    del self._pages[key]
+    
+    async def _read_page(
+        self,
+        key: tuple,
+        ttl: float,
+        url: str,
+        params: Optional[Dict],
+        timeout: int,
+        priority: int,
+        page: SharedArray
+    ):
+        """Read a JSON array into page chunk by chunk, as consumers ask for it; cache it if read to the end."""
+        breaker = self._breakers.for_url(url)
+        
+        try:
+            await self._limiter.acquire(url, priority)
+            client = self._http.get(url)
+            
+            async with client.stream('GET', url, params=params, timeout=timeout) as resp:
+                if resp.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                
+                if resp.status_code != 200:
+                    if resp.status_code in (429, 503):
+                        retry_after = parse_retry_after(resp.headers.get('Retry-After'))
+                        self._limiter.on_throttled(url, retry_after)
+                    print(f"⚠️ Unexpected status {resp.status_code} for {url}")
+                    return
+                
+                self._limiter.on_success(url)
+                
+                splitter = JSONArraySplitter()
+                async for chunk in resp.aiter_bytes():
+                    page.extend(splitter.feed(chunk))
+                    if splitter.done:
+                        break
+                    await page.wait_for_demand()
+                else:
+                    page.extend(splitter.close())
+            
+            if ttl:
+                self._cache.set(key, page.items, ttl)
+            
+        except (httpx.TimeoutException, httpx.ConnectError) as e:
+            breaker.record_failure()
+            print(f"⏳ Stream failed for {url}: {type(e).__name__}")
+            
+        except Exception as e:
+            breaker.record_failure()
+            print(f"⚠️ Stream error: {e}")
+        
+        finally:
+            page.close()
+            if self._pages.get(key) is page:
+                del self._pages[key]
+    
     # ═══════════════════════════════════════════════════════════════════
     # PAPER TRADING PERSISTENCE
     # ═══════════════════════════════════════════════════════════════════
@@ -431,6 +831,7 @@ class PolymarketClient:
     
     async def get_balance(self) -> float:
         """Get USDC balance."""
+        await self._ensure_live_client()
         if self.is_paper or not self.clob_client:
             return self._paper_balance
         
@@ -448,14 +849,15 @@ class PolymarketClient:
         try:
             funder = Config.FUNDER_ADDRESS
             if funder:
-                async with httpx.AsyncClient(timeout=15) as client:
-                    resp = await client.get(
-                        f"{Config.POLYMARKET_CLOB_URL}/data/balance",
-                        params={"address": funder}
-                    )
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        return float(data.get('balance', 0))
+                data = await self._fetch_with_retry(
+                    f"{Config.POLYMARKET_CLOB_URL}/data/balance",
+                    params={"address": funder},
+                    max_retries=1,
+                    timeout=15,
+                    priority=PRIORITY_TRADING
+                )
+                if data is not None:
+                    return float(data.get('balance', 0))
         except Exception as e:
             print(f"⚠️ REST balance fetch error: {e}")
         
@@ -463,6 +865,7 @@ class PolymarketClient:
     
     async def get_positions(self) -> List[Position]:
         """Get all open positions."""
+        await self._ensure_live_client()
         if self.is_paper or not self.clob_client:
             return self._get_paper_positions()
         
@@ -481,14 +884,15 @@ class PolymarketClient:
         try:
             funder = Config.FUNDER_ADDRESS
             if funder:
-                async with httpx.AsyncClient(timeout=15) as client:
-                    resp = await client.get(
-                        f"{Config.POLYMARKET_CLOB_URL}/data/positions",
-                        params={"address": funder}
-                    )
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        return self._parse_positions(data if isinstance(data, list) else [])
+                data = await self._fetch_with_retry(
+                    f"{Config.POLYMARKET_CLOB_URL}/data/positions",
+                    params={"address": funder},
+                    max_retries=1,
+                    timeout=15,
+                    priority=PRIORITY_TRADING
+                )
+                if data is not None:
+                    return self._parse_positions(data if isinstance(data, list) else [])
         except Exception as e:
             print(f"⚠️ REST positions fetch error: {e}")
         
@@ -570,7 +974,6 @@ class PolymarketClient:
         """
         leagues = []
         sport_lower = sport.lower()
-        sport_kws = SPORT_KEYWORDS.get(sport_lower, [sport_lower])
         
         try:
             data = await self._fetch_with_retry(
@@ -590,7 +993,7 @@ class PolymarketClient:
                 combined = f"{name} {slug}"
                 
                 # Match by sport keywords
-                if any(kw in combined for kw in sport_kws) or sport_lower in combined:
+                if matches_sport(combined, sport_lower) or sport_lower in combined:
                     leagues.append(League(
                         series_id=str(item.get('id', item.get('seriesId', ''))),
                         name=item.get('name', item.get('label', 'Unknown League')),
@@ -619,45 +1022,75 @@ class PolymarketClient:
         Returns:
             List of Event objects
         """
+        events, _ = await self.get_events_by_league_page(series_id, sport, limit)
+        return events
+    
+    async def get_events_by_league_page(
+        self,
+        series_id: str,
+        sport: str = '',
+        limit: int = 15,
+        cursor: int = 0
+    ) -> Tuple[List[Event], Optional[int]]:
+        """
+        Fetch one page of a league's events.
+        
+        The cursor is an offset into the series' raw event list (catalog
+        order, or Gamma's `offset`), so events rejected by keyword
+        validation don't shift later pages.
+        
+        Returns:
+            (events, next_cursor) - next_cursor is None on the last page
+        """
         events = []
         sport_kws = SPORT_KEYWORDS.get(sport.lower(), [sport.lower()]) if sport else []
         
         try:
-            data = await self._fetch_with_retry(
-                f"{Config.POLYMARKET_GAMMA_URL}/events",
-                params={
-                    'series_id': series_id,
-                    'active': True,
-                    'closed': False,
-                    'limit': limit * 2
-                },
-                timeout=30
-            )
-            
-            if not data:
-                return events
+            # Serve from the in-memory catalog when it knows this series
+            series = self.catalog.events_for_series(series_id) if self.catalog.is_fresh() else None
             
-            if not isinstance(data, list):
-                data = [data]
+            if series:
+                data = series[cursor:]
+                more = False
+            else:
+                batch = limit * 2
+                data = await self._fetch_with_retry(
+                    f"{Config.POLYMARKET_GAMMA_URL}/events",
+                    params={
+                        'series_id': series_id,
+                        'active': True,
+                        'closed': False,
+                        'limit': batch,
+                        'offset': cursor
+                    },
+                    timeout=30
+                )
+                if not data:
+                    return events, None
+                if not isinstance(data, list):
+                    data = [data]
+                more = len(data) >= batch
             
+            consumed = 0
             for item in data:
+                consumed += 1
                 # Light validation if we have sport keywords
-                if sport_kws:
-                    parsed = self._parse_event(item, sport.lower(), sport_kws)
-                else:
-                    parsed = self._parse_event(item, sport.lower(), [])
+                parsed = self._parse_event(item, sport.lower(), sport_kws)
                 
                 if parsed:
                     events.append(parsed)
                     if len(events) >= limit:
                         break
             
-            print(f"📊 Found {len(events)} events for series {series_id}")
+            print(f"📊 Found {len(events)} events for series {series_id} (cursor {cursor})")
+            
+            if consumed < len(data) or more:
+                return events, cursor + consumed
             
         except Exception as e:
             print(f"⚠️ League events fetch error: {e}")
         
-        return events
+        return events, None
     
     async def get_tags(self) -> List[Dict]:
         """
@@ -683,6 +1116,59 @@ class PolymarketClient:
     # EVENTS & SUB-MARKETS
     # ═══════════════════════════════════════════════════════════════════
     
+    async def _collect_source(self, label: str, url: str, params: Dict, convert, limit: Optional[int]) -> List[tuple]:
+        """Stream one discovery source into (dedupe key, Event or None) pairs (all of it if no limit)."""
+        results = []
+        found = 0
+        scanned = 0
+        
+        async with aclosing(self._stream_items(url, params=params)) as items:
+            async for item in items:
+                scanned += 1
+                key, event = convert(item)
+                if key is None:
+                    continue
+                results.append((key, event))
+                
+                # No source can contribute more than `limit` events
+                if event:
+                    found += 1
+                    if limit and found >= limit:
+                        break
+        
+        print(f"📡 {label}: scanned {scanned} items")
+        return results
+    
+    async def _fan_out(self, sources: List[tuple], limit: Optional[int]) -> AsyncIterator[List[tuple]]:
+        """
+        Run discovery sources concurrently (bounded by DISCOVERY_CONCURRENCY)
+        and yield each source's results in priority order.
+        
+        A slow high-priority source holds back faster lower-priority ones,
+        so merge order matches the old sequential loop. Whatever is still
+        running or queued is cancelled when the caller stops iterating;
+        a cancelled source closes its stream, which stops the page read.
+        """
+        semaphore = asyncio.Semaphore(Config.DISCOVERY_CONCURRENCY)
+        
+        async def run(label, url, params, convert):
+            async with semaphore:
+                return await self._collect_source(label, url, params, convert, limit)
+        
+        tasks = [asyncio.ensure_future(run(*source)) for source in sources]
+        try:
+            for (label, *_), task in zip(sources, tasks):
+                try:
+                    results = await task
+                except Exception as e:
+                    print(f"⚠️ {label} error: {e}")
+                    continue
+                yield results
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
     async def get_sports_events(self, sport: str, limit: int = 15) -> List[Event]:
         """
         Fetch sports EVENTS (matches) with their sub-markets.
@@ -691,140 +1177,131 @@ class PolymarketClient:
         1. Server-side: Use tag_slug parameter for known sport tags
         2. Server-side fallback: Use _q search query on /markets endpoint
         3. Client-side: Keyword validation as final safety net
+        
+        Tiers 1 and 2 fan out in parallel and outstanding requests are
+        cancelled once `limit` events are collected.
         """
         events = []
+        
+        try:
+            async with aclosing(self._iter_sports_events(sport, limit)) as merged:
+                async for event in merged:
+                    events.append(event)
+                    if len(events) >= limit:
+                        break
+        except Exception as e:
+            print(f"⚠️ Events fetch error: {e}")
+        
+        print(f"📊 Found {len(events)} {sport} events")
+        return events
+    
+    async def _iter_sports_events(self, sport: str, source_limit: Optional[int] = None) -> AsyncIterator[Event]:
+        """
+        Yield a sport's events, deduplicated, in merge order (tag_slug hits,
+        then _q hits, then the broad fetch if neither found anything).
+        
+        source_limit caps how many events each source is read for; without
+        it every source page is consumed in full.
+        """
         seen_ids = set()  # Deduplicate across multiple queries
         sport_lower = sport.lower()
         sport_kws = SPORT_KEYWORDS.get(sport_lower, [sport_lower])
         tag_slugs = SPORT_TAG_SLUGS.get(sport_lower, [sport_lower])
         search_queries = SPORT_SEARCH_QUERIES.get(sport_lower, [sport_lower])
+        found = 0
         
-        try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                # ═══════════════════════════════════════════════════════════
-                # APPROACH 1: Server-side filtering with tag_slug
-                # This is the most reliable method - asks API to filter for us
-                # ═══════════════════════════════════════════════════════════
-                for tag_slug in tag_slugs:
-                    if len(events) >= limit:
-                        break
-                    
-                    params = {
-                        "tag_slug": tag_slug,
-                        "active": True,
-                        "closed": False,
-                        "limit": 50
-                    }
-                    
-                    try:
-                        resp = await client.get(
-                            f"{Config.POLYMARKET_GAMMA_URL}/events",
-                            params=params
-                        )
-                        
-                        if resp.status_code == 200:
-                            data = resp.json()
-                            print(f"📡 tag_slug={tag_slug}: got {len(data)} events")
-                            
-                            for item in data:
-                                event_id = item.get('id', '')
-                                if event_id in seen_ids:
-                                    continue
-                                seen_ids.add(event_id)
-                                
-                                parsed = self._parse_event(item, sport_lower, sport_kws)
-                                if parsed:
-                                    events.append(parsed)
-                                    if len(events) >= limit:
-                                        break
-                    except Exception as e:
-                        print(f"⚠️ tag_slug {tag_slug} error: {e}")
+        def from_event(item):
+            return item.get('id', ''), self._parse_event(item, sport_lower, sport_kws)
+        
+        def from_market(item):
+            # Client-side validation - must match sport keywords
+            question = item.get('question', '')
+            description = item.get('description', '')
+            combined = f"{question} {description}"
+            
+            market_id = item.get('conditionId', item.get('id', ''))
+            if not matches_sport(combined, sport_lower, market_id):
+                return None, None
+            return market_id, self._market_to_event(item, sport_lower)
+        
+        # ═══════════════════════════════════════════════════════════
+        # APPROACH 1: Server-side filtering with tag_slug (most reliable)
+        # APPROACH 2: Server-side search with _q parameter on /markets
+        # Both tiers are fetched concurrently; results are merged in
+        # this order, so tag_slug hits always win over _q hits
+        # ═══════════════════════════════════════════════════════════
+        sources = [
+            (f"tag_slug={tag_slug}", f"{Config.POLYMARKET_GAMMA_URL}/events",
+             {"tag_slug": tag_slug, "active": True, "closed": False, "limit": 50}, from_event)
+            for tag_slug in tag_slugs
+        ] + [
+            (f"_q={query}", f"{Config.POLYMARKET_GAMMA_URL}/markets",
+             {"_q": query, "active": True, "closed": False, "limit": 30}, from_market)
+            for query in search_queries
+        ]
+        
+        async with aclosing(self._fan_out(sources, source_limit)) as batches:
+            async for results in batches:
+                for key, event in results:
+                    if key in seen_ids:
                         continue
-                
-                # ═══════════════════════════════════════════════════════════
-                # APPROACH 2: Server-side search with _q parameter on /markets
-                # Fallback if tag_slug returns insufficient results
-                # ═══════════════════════════════════════════════════════════
-                if len(events) < limit:
-                    for query in search_queries:
-                        if len(events) >= limit:
-                            break
-                        
-                        params = {
-                            "_q": query,
-                            "active": True,
-                            "closed": False,
-                            "limit": 30
-                        }
-                        
-                        try:
-                            resp = await client.get(
-                                f"{Config.POLYMARKET_GAMMA_URL}/markets",
-                                params=params
-                            )
-                            
-                            if resp.status_code == 200:
-                                data = resp.json()
-                                print(f"📡 _q={query}: got {len(data)} markets")
-                                
-                                for item in data:
-                                    market_id = item.get('conditionId', item.get('id', ''))
-                                    if market_id in seen_ids:
-                                        continue
-                                    
-                                    # Client-side validation - must match sport keywords
-                                    question = item.get('question', '')
-                                    description = item.get('description', '')
-                                    combined = f"{question} {description}".lower()
-                                    
-                                    if any(kw in combined for kw in sport_kws):
-                                        seen_ids.add(market_id)
-                                        event = self._market_to_event(item, sport_lower)
-                                        if event:
-                                            events.append(event)
-                                            if len(events) >= limit:
-                                                break
-                        except Exception as e:
-                            print(f"⚠️ _q={query} error: {e}")
-                            continue
-                
-                # ═══════════════════════════════════════════════════════════
-                # APPROACH 3: Broad fetch with strict client-side filtering
-                # Last resort - only if approaches 1 & 2 return nothing
-                # ═══════════════════════════════════════════════════════════
-                if not events:
-                    print(f"⚠️ No results from server-side filtering, trying broad fetch")
-                    params = {
-                        "active": True,
-                        "closed": False,
-                        "limit": 100
-                    }
-                    
-                    resp = await client.get(
-                        f"{Config.POLYMARKET_GAMMA_URL}/events",
-                        params=params
-                    )
+                    seen_ids.add(key)
                     
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        
-                        for item in data:
-                            event_id = item.get('id', '')
-                            if event_id in seen_ids:
-                                continue
-                            
-                            parsed = self._parse_event(item, sport_lower, sport_kws)
-                            if parsed:
-                                seen_ids.add(event_id)
-                                events.append(parsed)
-                                if len(events) >= limit:
-                                    break
+                    if event:
+                        found += 1
+                        yield event
+        
+        # ═══════════════════════════════════════════════════════════
+        # APPROACH 3: Broad fetch with strict client-side filtering
+        # Last resort - only if approaches 1 & 2 return nothing
+        # ═══════════════════════════════════════════════════════════
+        if not found:
+            print(f"⚠️ No results from server-side filtering, trying broad fetch")
+            params = {
+                "active": True,
+                "closed": False,
+                "limit": 100
+            }
+            
+            stream = self._stream_items(f"{Config.POLYMARKET_GAMMA_URL}/events", params=params)
+            
+            async with aclosing(stream) as items:
+                async for item in items:
+                    event_id = item.get('id', '')
+                    if event_id in seen_ids:
+                        continue
                     
+                    parsed = self._parse_event(item, sport_lower, sport_kws)
+                    if parsed:
+                        seen_ids.add(event_id)
+                        yield parsed
+    
+    async def get_sports_events_page(
+        self,
+        sport: str,
+        limit: int = 5,
+        cursor: Optional[StreamCursor] = None
+    ) -> Tuple[List[Event], Optional[StreamCursor]]:
+        """
+        Fetch one page of a sport's events.
+        
+        Discovery merges several tag_slug/_q sources, so there is no single
+        upstream offset to resume from. The cursor is opaque: it keeps the
+        merged discovery open, so each page continues where the previous
+        one stopped instead of re-running discovery. Pass None (or 0) for
+        the first page.
+        
+        Returns:
+            (events, next_cursor) - next_cursor is None on the last page
+        """
+        if not isinstance(cursor, StreamCursor):
+            cursor = StreamCursor(self._iter_sports_events(sport))
+        
+        try:
+            return await cursor.take(limit)
         except Exception as e:
             print(f"⚠️ Events fetch error: {e}")
-        
-        print(f"📊 Found {len(events)} {sport} events")
-        return events
+            return [], None
     
     def _parse_event(self, item: Dict, sport: str, sport_kws: List[str]) -> Optional[Event]:
         """Parse an event from API response with keyword validation."""
@@ -833,108 +1310,88 @@ class PolymarketClient:
         combined = f"{title} {description}".lower()
         
         # If sport keywords provided, validate (skip for league-fetched events)
-        if sport_kws and not any(kw in combined for kw in sport_kws):
+        if sport_kws and not matches_sport(combined, sport, f"event:{item.get('id', '')}"):
             return None
         
         # Parse sub-markets
-        sub_markets = []
-        raw_markets = item.get('markets', [])
-        
-        for m in raw_markets:
-            tokens = m.get('tokens', [])
-            yes_token = next((t for t in tokens if t.get('outcome', '').lower() == 'yes'), {})
-            no_token = next((t for t in tokens if t.get('outcome', '').lower() == 'no'), {})
-            
-            # Try to get prices from outcomePrices if tokens don't have them
-            yes_price = float(yes_token.get('price', 0.5))
-            no_price = float(no_token.get('price', 0.5))
-            
-            outcome_prices = m.get('outcomePrices')
-            if outcome_prices and (yes_price == 0.5 or no_price == 0.5):
-                try:
-                    import json
-                    prices = json.loads(outcome_prices) if isinstance(outcome_prices, str) else outcome_prices
-                    if len(prices) >= 2:
-                        yes_price = float(prices[0])
-                        no_price = float(prices[1])
-                except:
-                    pass
-            
-            sub_markets.append(SubMarket(
-                condition_id=m.get('conditionId', m.get('id', '')),
-                question=m.get('question', m.get('groupItemTitle', 'Unknown')),
-                yes_token_id=yes_token.get('token_id', ''),
-                no_token_id=no_token.get('token_id', ''),
-                yes_price=yes_price,
-                no_price=no_price,
-                group_item_title=m.get('groupItemTitle', '')
-            ))
+        sub_markets = [
+            self._build_sub_market(m, m.get('question', m.get('groupItemTitle', 'Unknown')), m.get('groupItemTitle', ''))
+            for m in item.get('markets', [])
+        ]
         
         # If no sub-markets, create one from event itself
         if not sub_markets:
-            tokens = item.get('tokens', [])
-            yes_token = next((t for t in tokens if t.get('outcome', '').lower() == 'yes'), {})
-            no_token = next((t for t in tokens if t.get('outcome', '').lower() == 'no'), {})
-            
-            sub_markets.append(SubMarket(
-                condition_id=item.get('conditionId', item.get('id', '')),
-                question=title,
-                yes_token_id=yes_token.get('token_id', ''),
-                no_token_id=no_token.get('token_id', ''),
-                yes_price=float(yes_token.get('price', 0.5)),
-                no_price=float(no_token.get('price', 0.5)),
-                group_item_title='Match Winner'
-            ))
+            sub_markets.append(self._build_sub_market(item, title, 'Match Winner'))
         
         return Event(
             event_id=item.get('id', ''),
             title=title,
-            description=description,
             sport=sport,
             start_date=item.get('startDate'),
             end_date=item.get('endDate'),
-            markets=sub_markets
+            markets=tuple(sub_markets),
+            _description=description
         )
     
+    def _build_sub_market(self, m: Dict, question: str, group_item_title: str) -> SubMarket:
+        """Build a SubMarket from a raw market (shared while the market is unchanged)."""
+        condition_id = m.get('conditionId', m.get('id', ''))
+        
+        def build(outcomes):
+            yes, no = yes_no(outcomes)
+            return SubMarket(
+                condition_id=condition_id,
+                question=question,
+                yes_token_id=yes.token_id if yes else '',
+                no_token_id=no.token_id if no else '',
+                yes_price=yes.price if yes else DEFAULT_PRICE,
+                no_price=no.price if no else DEFAULT_PRICE,
+                group_item_title=group_item_title,
+                outcomes=outcomes
+            )
+        
+        return MARKET_PARSER.build(m, ('sub', condition_id, question, group_item_title), build)
+    
+    def _build_market(self, item: Dict, question: str, category: str, sport: str) -> Market:
+        """Build a Market from a raw market (shared while the market is unchanged)."""
+        condition_id = item.get('conditionId', item.get('id', ''))
+        description = item.get('description', '')
+        volume = item.get('volume')
+        category = item.get('category', category)
+        end_date = item.get('endDate')
+        
+        def build(outcomes):
+            yes, no = yes_no(outcomes)
+            return Market(
+                condition_id=condition_id,
+                question=question,
+                yes_token_id=yes.token_id if yes else '',
+                no_token_id=no.token_id if no else '',
+                yes_price=yes.price if yes else DEFAULT_PRICE,
+                no_price=no.price if no else DEFAULT_PRICE,
+                volume=float(volume or 0),
+                category=category,
+                sport=sport,
+                end_date=end_date,
+                outcomes=outcomes,
+                _description=description
+            )
+        
+        inputs = ('market', condition_id, question, description, volume, category, sport, end_date)
+        return MARKET_PARSER.build(item, inputs, build)
+    
     def _market_to_event(self, item: Dict, sport: str) -> Optional[Event]:
         """Convert a market to an Event with a single sub-market."""
         question = item.get('question', '')
-        tokens = item.get('tokens', [])
-        yes_token = next((t for t in tokens if t.get('outcome', '').lower() == 'yes'), {})
-        no_token = next((t for t in tokens if t.get('outcome', '').lower() == 'no'), {})
-        
-        # Try outcomePrices if prices are default
-        yes_price = float(yes_token.get('price', 0.5))
-        no_price = float(no_token.get('price', 0.5))
-        
-        outcome_prices = item.get('outcomePrices')
-        if outcome_prices and (yes_price == 0.5 or no_price == 0.5):
-            try:
-                import json
-                prices = json.loads(outcome_prices) if isinstance(outcome_prices, str) else outcome_prices
-                if len(prices) >= 2:
-                    yes_price = float(prices[0])
-                    no_price = float(prices[1])
-            except:
-                pass
-        
-        sub_market = SubMarket(
-            condition_id=item.get('conditionId', item.get('id', '')),
-            question=question,
-            yes_token_id=yes_token.get('token_id', ''),
-            no_token_id=no_token.get('token_id', ''),
-            yes_price=yes_price,
-            no_price=no_price,
-            group_item_title='Market'
-        )
+        sub_market = self._build_sub_market(item, question, 'Market')
         
         return Event(
             event_id=item.get('conditionId', item.get('id', '')),
             title=question,
-            description=item.get('description', ''),
             sport=sport,
             end_date=item.get('endDate'),
-            markets=[sub_market]
+            markets=(sub_market,),
+            _description=item.get('description', '')
         )
     
     async def get_sports_markets(
@@ -950,88 +1407,70 @@ class PolymarketClient:
         all_markets = []
         seen_ids = set()
         sport_lower = sport.lower() if sport else ''
-        sport_kws = SPORT_KEYWORDS.get(sport_lower, [sport_lower]) if sport_lower else ALL_SPORT_KEYWORDS
         search_queries = SPORT_SEARCH_QUERIES.get(sport_lower, [sport_lower]) if sport_lower else ['']
         
+        # Same client-side filter over the in-memory catalog, highest volume first
+        if self.catalog.is_fresh():
+            def volume(item):
+                try:
+                    return float(item.get('volume') or 0)
+                except (TypeError, ValueError):
+                    return 0.0
+            
+            matches = (
+                item for item in self.catalog.iter_markets()
+                if matches_sport(
+                    f"{item.get('question', '')} {item.get('description', '')}",
+                    sport_lower, item.get('conditionId', '')
+                )
+            )
+            return [self._to_sports_market(item, sport_lower) for item in heapq.nlargest(limit, matches, key=volume)]
+        
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                # ═══════════════════════════════════════════════════════════
-                # Server-side search with _q parameter
-                # ═══════════════════════════════════════════════════════════
-                for query in search_queries:
-                    if len(all_markets) >= limit:
-                        break
-                    
-                    params = {
-                        "limit": 50,
-                        "active": True,
-                        "closed": False
-                    }
-                    
-                    # Add search query for server-side filtering
-                    if query:
-                        params["_q"] = query
+            # ═══════════════════════════════════════════════════════════
+            # Server-side search with _q parameter
+            # ═══════════════════════════════════════════════════════════
+            for query in search_queries:
+                if len(all_markets) >= limit:
+                    break
+                
+                params = {
+                    "limit": 50,
+                    "active": True,
+                    "closed": False
+                }
+                
+                # Add search query for server-side filtering
+                if query:
+                    params["_q"] = query
+                
+                try:
+                    scanned = 0
+                    stream = self._stream_items(f"{Config.POLYMARKET_GAMMA_URL}/markets", params=params)
                     
-                    try:
-                        resp = await client.get(
-                            f"{Config.POLYMARKET_GAMMA_URL}/markets",
-                            params=params
-                        )
-                        
-                        if resp.status_code == 200:
-                            data = resp.json()
-                            print(f"📡 markets _q={query or 'none'}: got {len(data)} results")
+                    async with aclosing(stream) as items:
+                        async for item in items:
+                            scanned += 1
+                            market_id = item.get('conditionId', item.get('id', ''))
+                            if market_id in seen_ids:
+                                continue
                             
-                            for item in data:
-                                market_id = item.get('conditionId', item.get('id', ''))
-                                if market_id in seen_ids:
-                                    continue
-                                
-                                question = item.get('question', '')
-                                description = item.get('description', '')
-                                combined = f"{question} {description}".lower()
+                            question = item.get('question', '')
+                            description = item.get('description', '')
+                            combined = f"{question} {description}"
+                            
+                            # Client-side validation - STRICT filtering
+                            if matches_sport(combined, sport_lower, market_id):
+                                seen_ids.add(market_id)
+                                all_markets.append(self._to_sports_market(item, sport_lower))
                                 
-                                # Client-side validation - STRICT filtering
-                                if any(kw in combined for kw in sport_kws):
-                                    seen_ids.add(market_id)
-                                    tokens = item.get('tokens', [])
-                                    yes_token = next((t for t in tokens if t.get('outcome', '').lower() == 'yes'), {})
-                                    no_token = next((t for t in tokens if t.get('outcome', '').lower() == 'no'), {})
-                                    
-                                    # Try outcomePrices if default prices
-                                    yes_price = float(yes_token.get('price', 0.5))
-                                    no_price = float(no_token.get('price', 0.5))
-                                    
-                                    outcome_prices = item.get('outcomePrices')
-                                    if outcome_prices and (yes_price == 0.5 or no_price == 0.5):
-                                        try:
-                                            import json
-                                            prices = json.loads(outcome_prices) if isinstance(outcome_prices, str) else outcome_prices
-                                            if len(prices) >= 2:
-                                                yes_price = float(prices[0])
-                                                no_price = float(prices[1])
-                                        except:
-                                            pass
-                                    
-                                    all_markets.append(Market(
-                                        condition_id=market_id,
-                                        question=question,
-                                        description=description,
-                                        yes_token_id=yes_token.get('token_id', ''),
-                                        no_token_id=no_token.get('token_id', ''),
-                                        yes_price=yes_price,
-                                        no_price=no_price,
-                                        volume=float(item.get('volume', 0)),
-                                        category=item.get('category', 'Sports'),
-                                        sport=sport_lower or detect_sport(question),
-                                        end_date=item.get('endDate')
-                                    ))
-                                    
-                                    if len(all_markets) >= limit:
-                                        break
-                    except Exception as e:
-                        print(f"⚠️ _q={query} error: {e}")
-                        continue
+                                if len(all_markets) >= limit:
+                                    break
+                    
+                    print(f"📡 markets _q={query or 'none'}: scanned {scanned} results")
+                except Exception as e:
+                    print(f"⚠️ _q={query} error: {e}")
+                    continue
                                 
         except Exception as e:
             print(f"⚠️ Markets fetch error: {e}")
@@ -1039,6 +1478,14 @@ class PolymarketClient:
         print(f"📊 Found {len(all_markets)} {sport or 'sports'} markets")
         return all_markets
     
+    def _to_sports_market(self, item: Dict, sport_lower: str) -> Market:
+        """Build a Market from a raw Gamma market that passed the sport filter."""
+        question = item.get('question', '')
+        sport = sport_lower or detect_sport(
+            f"{question} {item.get('description', '')}", item.get('conditionId', '')
+        )
+        return self._build_market(item, question, 'Sports', sport)
+    
     async def search_markets(
         self, 
         query: str,
@@ -1046,41 +1493,91 @@ class PolymarketClient:
         active_only: bool = True
     ) -> List[Market]:
         """Search for markets by keyword."""
+        if active_only and self.catalog.is_fresh():
+            return self._parse_markets(self.catalog.search(query, limit))
+        
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                params = {
-                    "limit": limit * 2,
-                    "active": active_only,
+            params = {
+                "limit": limit * 2,
+                "active": active_only,
+                "closed": False,
+                "_q": query
+            }
+            
+            data = await self._fetch_with_retry(
+                f"{Config.POLYMARKET_GAMMA_URL}/markets",
+                params=params,
+                max_retries=1,
+                timeout=30
+            )
+            
+            if data is not None:
+                return self._parse_markets(data)[:limit]
+                    
+        except Exception as e:
+            print(f"⚠️ Search error: {e}")
+        
+        return []
+    
+    async def search_markets_page(
+        self,
+        query: str,
+        limit: int = 8,
+        cursor: int = 0
+    ) -> Tuple[List[Market], Optional[int]]:
+        """
+        Fetch one page of active search results.
+        
+        Returns:
+            (markets, next_cursor) - next_cursor is None on the last page
+        """
+        if self.catalog.is_fresh():
+            # Ranked locally - ask for one extra hit to know if there is a next page
+            hits = self.catalog.search(query, cursor + limit + 1)
+            markets = self._parse_markets(hits[cursor:cursor + limit])
+            return markets, (cursor + limit if len(hits) > cursor + limit else None)
+        
+        try:
+            data = await self._fetch_with_retry(
+                f"{Config.POLYMARKET_GAMMA_URL}/markets",
+                params={
+                    "limit": limit,
+                    "offset": cursor,
+                    "active": True,
                     "closed": False,
                     "_q": query
-                }
-                
-                resp = await client.get(
-                    f"{Config.POLYMARKET_GAMMA_URL}/markets",
-                    params=params
-                )
-                
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return self._parse_markets(data)[:limit]
+                },
+                max_retries=1,
+                timeout=30
+            )
+            
+            if data:
+                return self._parse_markets(data), (cursor + len(data) if len(data) >= limit else None)
                     
         except Exception as e:
             print(f"⚠️ Search error: {e}")
         
-        return []
+        return [], None
     
     async def get_market_details(self, condition_id: str) -> Optional[Market]:
         """Get detailed info for a specific market."""
+        if self.catalog.is_fresh():
+            data = self.catalog.market(condition_id)
+            if data is not None:
+                markets = self._parse_markets([data])
+                if markets:
+                    return markets[0]
+        
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.get(
-                    f"{Config.POLYMARKET_GAMMA_URL}/markets/{condition_id}"
-                )
-                
-                if resp.status_code == 200:
-                    data = resp.json()
-                    markets = self._parse_markets([data])
-                    return markets[0] if markets else None
+            data = await self._fetch_with_retry(
+                f"{Config.POLYMARKET_GAMMA_URL}/markets/{condition_id}",
+                max_retries=1,
+                timeout=30
+            )
+            
+            if data is not None:
+                markets = self._parse_markets([data])
+                return markets[0] if markets else None
         except Exception as e:
             print(f"⚠️ Market details error: {e}")
         
@@ -1092,26 +1589,9 @@ class PolymarketClient:
         
         for item in data:
             try:
-                tokens = item.get('tokens', [])
-                yes_token = next((t for t in tokens if t.get('outcome', '').lower() == 'yes'), {})
-                no_token = next((t for t in tokens if t.get('outcome', '').lower() == 'no'), {})
-                
                 question = item.get('question', 'Unknown')
-                description = item.get('description', '')
-                
-                markets.append(Market(
-                    condition_id=item.get('conditionId', item.get('id', '')),
-                    question=question,
-                    description=description,
-                    yes_token_id=yes_token.get('token_id', ''),
-                    no_token_id=no_token.get('token_id', ''),
-                    yes_price=float(yes_token.get('price', 0.5)),
-                    no_price=float(no_token.get('price', 0.5)),
-                    volume=float(item.get('volume', 0)),
-                    category=item.get('category', 'Other'),
-                    sport=detect_sport(f"{question} {description}"),
-                    end_date=item.get('endDate')
-                ))
+                sport = detect_sport(f"{question} {item.get('description', '')}", item.get('conditionId', ''))
+                markets.append(self._build_market(item, question, 'Other', sport))
             except Exception as e:
                 print(f"⚠️ Market parse error: {e}")
         
@@ -1125,6 +1605,17 @@ class PolymarketClient:
         """
         Get current price for a token.
         
+        A WebSocket tick newer than WS_PRICE_MAX_AGE is returned without a
+        request. Otherwise the feed is asked to follow the token for a
+        while, so later reads are served from it, and REST is used.
+        
+        REST sources are raced in preference order (SDK midpoint, REST
+        /price, REST /midpoint): if one hasn't answered within its recent
+        p95 latency, the next is started as a hedge. The first valid price wins,
+        losing REST requests are cancelled (they bypass single-flight for
+        that reason; a losing SDK call finishes in its thread and is
+        ignored), and the whole read is bounded by PRICE_DEADLINE.
+        
         Args:
             token_id: The token ID to get price for
             refresh_from_clob: If True, skip any cached values and fetch from CLOB
@@ -1132,63 +1623,168 @@ class PolymarketClient:
         Returns:
             Price as float (0.0 to 1.0), or 0.0 if unavailable
         """
-        # Try py-clob-client midpoint first
+        if not refresh_from_clob and Config.WS_PRICES_ENABLED:
+            feed = get_ws_client()
+            if feed.is_running:
+                price = feed.get_fresh_price(token_id)
+                if price:
+                    return price
+                self._follow(token_id)
+        
+        sources = []
         if self.clob_client and not refresh_from_clob:
-            try:
-                midpoint = self.clob_client.get_midpoint(token_id)
-                if midpoint and float(midpoint) > 0:
-                    return float(midpoint)
-            except:
-                pass
-        
-        # Try CLOB REST API with buy side price
-        try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                resp = await client.get(
-                    f"{Config.POLYMARKET_CLOB_URL}/price",
-                    params={"token_id": token_id, "side": "buy"}
-                )
-                if resp.status_code == 200:
-                    price = resp.json().get('price', 0)
-                    if price and float(price) > 0:
-                        return float(price)
-        except Exception as e:
-            print(f"⚠️ CLOB price fetch error: {e}")
-        
-        # Try midpoint endpoint as fallback
-        try:
-            async with httpx.AsyncClient(timeout=15) as client:
-                resp = await client.get(
-                    f"{Config.POLYMARKET_CLOB_URL}/midpoint",
-                    params={"token_id": token_id}
-                )
-                if resp.status_code == 200:
-                    mid = resp.json().get('mid', 0)
-                    if mid and float(mid) > 0:
-                        return float(mid)
-        except:
-            pass
-        
-        return 0.0
+            sources.append(('sdk_midpoint', lambda: self._price_from_sdk(token_id)))
+        sources.append(('rest_price', lambda: self._price_from_rest(token_id, 'price', 'price', {"side": "buy"})))
+        sources.append(('rest_midpoint', lambda: self._price_from_rest(token_id, 'midpoint', 'mid')))
+        
+        _, price = await hedged_race(
+            sources,
+            is_valid=lambda p: bool(p) and p > 0,
+            tracker=self._price_latency,
+            deadline=Config.PRICE_DEADLINE,
+            hedge=Config.PRICE_HEDGING
+        )
+        return price or 0.0
+    
+    def _follow(self, token_id: str):
+        """Have the price feed follow a token that was just read (released after WS_VIEW_TTL)."""
+        self._spawn(get_subscription_manager().hold(('read', token_id), (token_id,), ttl=Config.WS_VIEW_TTL))
+    
+    async def _price_from_sdk(self, token_id: str) -> Optional[float]:
+        """Midpoint via py-clob-client (blocking SDK call, run in a thread)."""
+        await self._limiter.acquire(Config.POLYMARKET_CLOB_URL, PRIORITY_TRADING)
+        midpoint = await asyncio.to_thread(self.clob_client.get_midpoint, token_id)
+        if isinstance(midpoint, dict):
+            midpoint = midpoint.get('mid')
+        return float(midpoint) if midpoint else None
+    
+    async def _price_from_rest(
+        self,
+        token_id: str,
+        endpoint: str,
+        field_name: str,
+        extra_params: Optional[Dict] = None
+    ) -> Optional[float]:
+        """
+        Price from a CLOB REST endpoint (/price or /midpoint).
+        Uncoalesced, so a hedged race can cancel the request it lost.
+        """
+        data = await self._fetch_uncoalesced(
+            f"{Config.POLYMARKET_CLOB_URL}/{endpoint}",
+            params={"token_id": token_id, **(extra_params or {})},
+            max_retries=1,
+            timeout=Config.PRICE_DEADLINE,
+            priority=PRIORITY_TRADING
+        )
+        value = data.get(field_name) if isinstance(data, dict) else None
+        return float(value) if value else None
     
     async def refresh_prices(self, token_ids: List[str]) -> Dict[str, float]:
         """
         Refresh prices for multiple tokens from CLOB.
         Useful when Gamma API returns default 50¢ values.
         
+        One get_quotes() batch; each price is the book mid, or the last
+        trade price for one-sided books.
+        
         Args:
             token_ids: List of token IDs to refresh
         
         Returns:
             Dict mapping token_id to current price
         """
-        prices = {}
-        for token_id in token_ids:
-            if token_id:
-                price = await self.get_price(token_id, refresh_from_clob=True)
-                if price > 0:
-                    prices[token_id] = price
-        return prices
+        quotes = await self.get_quotes(token_ids)
+        return {token_id: quote.price for token_id, quote in quotes.items() if quote.price > 0}
+    
+    async def get_quotes(self, token_ids: List[str]) -> Dict[str, Quote]:
+        """
+        Bid, ask, mid and last trade price for many tokens in one call.
+        
+        Tokens go to the bulk CLOB endpoints (POST /books and POST
+        /last-trades-prices) in PRICE_BATCH_SIZE chunks, all chunks in
+        parallel. Tokens the bulk calls didn't cover - endpoint down or
+        token missing from the reply - fall back to one GET /book per
+        token, at most PRICE_CONCURRENCY at a time. When the bulk
+        endpoints fail outright they are skipped for PRICE_BULK_RETRY
+        seconds, so refreshes don't pay for the failed POSTs every time.
+        
+        Args:
+            token_ids: Token IDs to quote (duplicates and blanks ignored)
+        
+        Returns:
+            Dict mapping token_id to Quote; tokens with no data are omitted
+        """
+        ids = list(dict.fromkeys(t for t in token_ids if t))
+        if not ids:
+            return {}
+        
+        size = max(1, Config.PRICE_BATCH_SIZE)
+        quotes: Dict[str, Quote] = {}
+        if time.monotonic() >= self._bulk_retry_at:
+            for chunk in await asyncio.gather(*(
+                self._bulk_quotes(ids[i:i + size]) for i in range(0, len(ids), size)
+            )):
+                quotes.update(chunk)
+        
+        missing = [t for t in ids if t not in quotes]
+        if missing:
+            slots = asyncio.Semaphore(max(1, Config.PRICE_CONCURRENCY))
+            
+            async def one(token_id):
+                async with slots:
+                    return token_id, await self._single_quote(token_id)
+            
+            for token_id, quote in await asyncio.gather(*(one(t) for t in missing)):
+                if quote is not None:
+                    quotes[token_id] = quote
+        return quotes
+    
+    async def _bulk_quotes(self, token_ids: List[str]) -> Dict[str, Quote]:
+        """
+        Quotes for one chunk from the bulk endpoints (tokens without a book
+        are left out). If /books fails, bulk is skipped for PRICE_BULK_RETRY.
+        """
+        body = [{"token_id": t} for t in token_ids]
+        books, trades = await asyncio.gather(*(
+            self._fetch_uncoalesced(
+                f"{Config.POLYMARKET_CLOB_URL}/{endpoint}",
+                None,
+                max_retries=1,
+                timeout=Config.PRICE_DEADLINE,
+                priority=PRIORITY_TRADING,
+                json_body=body
+            )
+            for endpoint in ('books', 'last-trades-prices')
+        ))
+        
+        if books is None:
+            self._bulk_retry_at = time.monotonic() + Config.PRICE_BULK_RETRY
+            print(f"⚠️ Bulk quotes unavailable - per-token /book for {Config.PRICE_BULK_RETRY:.0f}s")
+        
+        last = {}
+        for trade in trades if isinstance(trades, list) else ():
+            if isinstance(trade, dict) and trade.get('token_id'):
+                last[str(trade['token_id'])] = _trade_price(trade)
+        
+        quotes = {}
+        for book in books if isinstance(books, list) else ():
+            if isinstance(book, dict) and book.get('asset_id'):
+                token_id = str(book['asset_id'])
+                quotes[token_id] = _book_quote(book, last.get(token_id))
+        return quotes
+    
+    async def _single_quote(self, token_id: str) -> Optional[Quote]:
+        """Quote for one token from a single GET /book (last trade from its last_trade_price)."""
+        book = await self._fetch_with_retry(
+            f"{Config.POLYMARKET_CLOB_URL}/book",
+            params={"token_id": token_id},
+            max_retries=1,
+            timeout=Config.PRICE_DEADLINE,
+            priority=PRIORITY_TRADING
+        )
+        if not isinstance(book, dict):
+            return None
+        return _book_quote(book, _trade_price({'price': book.get('last_trade_price')}))
     
     async def buy_market(
         self, 
@@ -1216,6 +1812,7 @@ class PolymarketClient:
         if amount_usd > Config.MAX_TRADE_USD:
             return OrderResult(success=False, error=f"Max trade: ${Config.MAX_TRADE_USD}")
         
+        await self._ensure_live_client()
         if self.is_paper or not self.clob_client:
             return await self._paper_buy(token_id, amount_usd, market_info)
         
@@ -1236,6 +1833,7 @@ class PolymarketClient:
             
             # Use the correct method signature - create order then post with FOK
             signed = self.clob_client.create_market_order(order)
+            await self._limiter.acquire(Config.POLYMARKET_CLOB_URL, PRIORITY_TRADING)
             resp = self.clob_client.post_order(signed, OrderType.FOK)
             
             # Handle response - could be dict or object with attributes
@@ -1288,6 +1886,7 @@ class PolymarketClient:
         if cost < Config.MIN_TRADE_USD:
             return OrderResult(success=False, error=f"Min trade value: ${Config.MIN_TRADE_USD}")
         
+        await self._ensure_live_client()
         if self.is_paper or not self.clob_client:
             return await self._paper_limit_order(token_id, price, size, 'buy')
         
@@ -1303,6 +1902,7 @@ class PolymarketClient:
             signed = self.clob_client.create_order(order_args)
             
             # Post as GTC (Good 'Til Cancelled)
+            await self._limiter.acquire(Config.POLYMARKET_CLOB_URL, PRIORITY_TRADING)
             resp = self.clob_client.post_order(signed, OrderType.GTC)
             
             success = resp.get('success', False) if isinstance(resp, dict) else getattr(resp, 'success', False)
@@ -1347,6 +1947,7 @@ class PolymarketClient:
         if size <= 0:
             return OrderResult(success=False, error="Size must be positive")
         
+        await self._ensure_live_client()
         if self.is_paper or not self.clob_client:
             return await self._paper_limit_order(token_id, price, size, 'sell')
         
@@ -1359,6 +1960,7 @@ class PolymarketClient:
             )
             
             signed = self.clob_client.create_order(order_args)
+            await self._limiter.acquire(Config.POLYMARKET_CLOB_URL, PRIORITY_TRADING)
             resp = self.clob_client.post_order(signed, OrderType.GTC)
             
             success = resp.get('success', False) if isinstance(resp, dict) else getattr(resp, 'success', False)
@@ -1405,6 +2007,11 @@ class PolymarketClient:
         """
         Get order book for a token.
         
+        Served from the WebSocket feed's local book when the token is
+        followed and its book is in sync - no network call. Otherwise the
+        book is fetched (SDK, then REST) and the feed is asked to follow
+        the token, so its snapshot serves the next request.
+        
         Args:
             token_id: Token to get order book for
             depth: Number of price levels to fetch (default 10)
@@ -1412,52 +2019,37 @@ class PolymarketClient:
         Returns:
             Dict with 'bids' and 'asks' lists, each containing [price, size] pairs
         """
+        feed = get_ws_client()
+        if feed.is_live(token_id):
+            local = feed.books.levels(token_id, depth)
+            if local is not None:
+                return local
+        if feed.is_running:
+            self._follow(token_id)
+        
         try:
             if self.clob_client:
-                # Use py-clob-client's get_order_book
+                # Use py-clob-client's get_order_book (blocking, run in a thread)
                 params = BookParams(token_id=token_id)
-                book = self.clob_client.get_order_book(params)
-                
-                # Parse response
-                bids = []
-                asks = []
-                
-                if isinstance(book, dict):
-                    raw_bids = book.get('bids', [])
-                    raw_asks = book.get('asks', [])
-                else:
-                    raw_bids = getattr(book, 'bids', [])
-                    raw_asks = getattr(book, 'asks', [])
-                
-                for bid in raw_bids[:depth]:
-                    price = bid.get('price', bid[0]) if isinstance(bid, dict) else bid[0]
-                    size = bid.get('size', bid[1]) if isinstance(bid, dict) else bid[1]
-                    bids.append({'price': float(price), 'size': float(size)})
-                
-                for ask in raw_asks[:depth]:
-                    price = ask.get('price', ask[0]) if isinstance(ask, dict) else ask[0]
-                    size = ask.get('size', ask[1]) if isinstance(ask, dict) else ask[1]
-                    asks.append({'price': float(price), 'size': float(size)})
-                
-                return {
-                    'bids': sorted(bids, key=lambda x: x['price'], reverse=True),
-                    'asks': sorted(asks, key=lambda x: x['price']),
-                    'spread': asks[0]['price'] - bids[0]['price'] if bids and asks else 0
-                }
-            
-            # Fallback to REST API
-            async with httpx.AsyncClient(timeout=15) as client:
-                resp = await client.get(
+                await self._limiter.acquire(Config.POLYMARKET_CLOB_URL, PRIORITY_TRADING)
+                data = await asyncio.to_thread(self.clob_client.get_order_book, params)
+                if not isinstance(data, dict):
+                    data = {'bids': getattr(data, 'bids', None), 'asks': getattr(data, 'asks', None)}
+            else:
+                # Fallback to REST API
+                data = await self._fetch_with_retry(
                     f"{Config.POLYMARKET_CLOB_URL}/book",
-                    params={"token_id": token_id}
+                    params={"token_id": token_id},
+                    max_retries=1,
+                    timeout=15,
+                    priority=PRIORITY_TRADING
                 )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return {
-                        'bids': data.get('bids', [])[:depth],
-                        'asks': data.get('asks', [])[:depth],
-                        'spread': 0
-                    }
+            if data is not None:
+                # Same shape as the local book: float levels, best first
+                book = OrderBook(token_id)
+                book.bids.replace(data.get('bids') or ())
+                book.asks.replace(data.get('asks') or ())
+                return book.levels(depth)
                     
         except Exception as e:
             print(f"⚠️ Order book fetch error: {e}")
@@ -1474,6 +2066,7 @@ class PolymarketClient:
         Returns:
             List of open orders with order_id, token_id, side, price, size, status
         """
+        await self._ensure_live_client()
         if self.is_paper or not self.clob_client:
             # Paper mode - no persistent open orders
             return []
@@ -1526,10 +2119,12 @@ class PolymarketClient:
         Returns:
             True if successful, False otherwise
         """
+        await self._ensure_live_client()
         if self.is_paper or not self.clob_client:
             return True  # Paper mode - always succeeds
         
         try:
+            await self._limiter.acquire(Config.POLYMARKET_CLOB_URL, PRIORITY_TRADING)
             resp = self.clob_client.cancel(order_id)
             
             if isinstance(resp, dict):
@@ -1550,10 +2145,12 @@ class PolymarketClient:
         Returns:
             Number of orders cancelled
         """
+        await self._ensure_live_client()
         if self.is_paper or not self.clob_client:
             return 0
         
         try:
+            await self._limiter.acquire(Config.POLYMARKET_CLOB_URL, PRIORITY_TRADING)
             if market_id:
                 resp = self.clob_client.cancel_market_orders(market_id)
             else:
@@ -1620,6 +2217,7 @@ class PolymarketClient:
         percent: float = 100
     ) -> OrderResult:
         """Execute a market sell order."""
+        await self._ensure_live_client()
         if self.is_paper or not self.clob_client:
             return await self._paper_sell(token_id, shares, percent)
         
@@ -1640,6 +2238,7 @@ class PolymarketClient:
             
             # Create and post the sell order
             signed = self.clob_client.create_market_order(order)
+            await self._limiter.acquire(Config.POLYMARKET_CLOB_URL, PRIORITY_TRADING)
             resp = self.clob_client.post_order(signed, OrderType.FOK)
             
             # Handle response - could be dict or object with attributes
@@ -1705,9 +2304,71 @@ class PolymarketClient:
         """
         Async initialization - load paper positions from database.
         Call this after creating the client to restore persisted state.
+        
+        In live mode this also kicks off live client init in the background;
+        trading calls wait for it, so nothing silently falls back to paper.
         """
+        self._start_live_init()
+        
         if self.is_paper:
+            started = time.perf_counter()
             await self._load_paper_positions()
+            self.startup_timings['paper_positions'] = time.perf_counter() - started
+    
+    async def prewarm(self) -> Dict[str, float]:
+        """
+        Pay DNS + TCP + TLS setup for Gamma and CLOB before the first user
+        action. The Gamma leg fetches /sports, which also seeds the cache
+        that get_sports_leagues reads.
+        
+        Returns:
+            Seconds per warmed upstream ('gamma', 'clob')
+        """
+        async def timed(name, coro):
+            started = time.perf_counter()
+            await coro
+            self.startup_timings[f"prewarm_{name}"] = time.perf_counter() - started
+        
+        await asyncio.gather(
+            timed('gamma', self._fetch_with_retry(
+                f"{Config.POLYMARKET_GAMMA_URL}/sports", params={}, max_retries=1, timeout=10
+            )),
+            timed('clob', self._http.prewarm(f"{Config.POLYMARKET_CLOB_URL}/time", timeout=10)),
+            return_exceptions=True
+        )
+        return {
+            name: self.startup_timings[f"prewarm_{name}"]
+            for name in ('gamma', 'clob') if f"prewarm_{name}" in self.startup_timings
+        }
+    
+    def get_transport_stats(self) -> Dict[str, Any]:
+        """Transport counters (coalescing, cache, rate limits, price latency, price feed) for monitoring."""
+        return {
+            'singleflight': self._flights.get_stats(),
+            'cache': self._cache.get_stats(),
+            'rate_limits': self._limiter.get_stats(),
+            'price_sources': self._price_latency.get_stats(),
+            'breakers': self._breakers.get_stats(),
+            'catalog': self.catalog.get_stats(),
+            'classification': SPORT_CLASSIFIER.get_stats(),
+            'market_parser': MARKET_PARSER.get_stats(),
+            'price_feed': get_ws_client().get_stats(),
+            'subscriptions': get_subscription_manager().get_stats(),
+            'startup': dict(self.startup_timings)
+        }
+    
+    def is_degraded(self, upstream: str = 'gamma') -> bool:
+        """True if any circuit breaker for 'gamma' or 'clob' is open or probing."""
+        return self._breakers.is_degraded(upstream)
+    
+    async def close(self):
+        """Close pooled HTTP connections. Call this on bot shutdown."""
+        if self._live_init is not None and not self._live_init.done():
+            self._live_init.cancel()
+        await self.catalog.stop()
+        for task in list(self._background_tasks):
+            task.cancel()
+        await self._http.close()
 
 
 # Singleton instance
@@ -1733,3 +2394,11 @@ async def init_polymarket_client() -> PolymarketClient:
         await _client.async_init()
         _initialized = True
     return _client
+
+async def close_polymarket_client():
+    """Close the Polymarket client's pooled connections on shutdown."""
+    global _client, _initialized
+    if _client is not None:
+        await _client.close()
+    _client = None
+    _initialized = False
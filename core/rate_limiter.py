@@ -0,0 +1,160 @@
+"""
+Adaptive Rate Limiter
+
+Shared per-host token buckets with AIMD rate control and Retry-After
+support. Trading calls (price, book, order) get priority over discovery.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+
+
+# Request priorities (lower = more urgent)
+PRIORITY_TRADING = 0
+PRIORITY_DISCOVERY = 1
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostBucket:
+    """
+    Token bucket for one host.
+
+    The refill rate follows AIMD: it grows additively on every success up
+    to max_rate and is cut multiplicatively on each throttle response.
+    Discovery requests leave a small token reserve untouched while trading
+    requests are waiting, so a burst of browsing can't delay a buy.
+    """
+
+    def __init__(self, host: str, rate: float, burst: float):
+        self.host = host
+        self.rate = rate
+        self.max_rate = rate * Config.RATE_LIMIT_MAX_MULTIPLIER
+        self.min_rate = Config.RATE_LIMIT_MIN_RPS
+        self.burst = burst
+        self.tokens = burst
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+        self._waiting = {PRIORITY_TRADING: 0, PRIORITY_DISCOVERY: 0}
+
+        self.throttled = 0
+        self.waits = 0
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._updated = now
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+
+    def _needed(self, priority: int) -> float:
+        """Tokens that must be available before this priority may proceed."""
+        if priority > PRIORITY_TRADING and self._waiting[PRIORITY_TRADING]:
+            return 1 + Config.RATE_LIMIT_TRADING_RESERVE
+        return 1
+
+    async def acquire(self, priority: int = PRIORITY_DISCOVERY):
+        """Wait until a request to this host may be sent."""
+        self._waiting[priority] += 1
+        waited = False
+        try:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self.blocked_until:
+                    delay = self.blocked_until - now
+                else:
+                    needed = self._needed(priority)
+                    if self.tokens >= needed:
+                        self.tokens -= 1
+                        return
+                    delay = (needed - self.tokens) / self.rate
+
+                if not waited:
+                    self.waits += 1
+                    waited = True
+                await asyncio.sleep(delay)
+        finally:
+            self._waiting[priority] -= 1
+
+    def on_success(self):
+        """Additive increase."""
+        self.rate = min(self.max_rate, self.rate + Config.RATE_LIMIT_INCREASE)
+
+    def on_throttled(self, retry_after: Optional[float] = None):
+        """Multiplicative decrease, and pause the host for Retry-After seconds."""
+        self.throttled += 1
+        self.rate = max(self.min_rate, self.rate * Config.RATE_LIMIT_DECREASE)
+        self.tokens = 0.0
+
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'rate': round(self.rate, 2),
+            'tokens': round(self.tokens, 2),
+            'blocked_for': round(max(0.0, self.blocked_until - time.monotonic()), 2),
+            'throttled': self.throttled,
+            'waits': self.waits
+        }
+
+
+class RateLimiter:
+    """Registry of per-host buckets shared by every caller."""
+
+    def __init__(self):
+        self._buckets: Dict[str, HostBucket] = {}
+
+    def bucket(self, url: str) -> HostBucket:
+        """Get (or create) the bucket for a URL's host."""
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+
+        if bucket is None:
+            if url.startswith(Config.POLYMARKET_CLOB_URL):
+                rate = Config.RATE_LIMIT_CLOB_RPS
+            else:
+                rate = Config.RATE_LIMIT_GAMMA_RPS
+            bucket = HostBucket(host, rate, Config.RATE_LIMIT_BURST)
+            self._buckets[host] = bucket
+
+        return bucket
+
+    async def acquire(self, url: str, priority: int = PRIORITY_DISCOVERY):
+        await self.bucket(url).acquire(priority)
+
+    def on_success(self, url: str):
+        self.bucket(url).on_success()
+
+    def on_throttled(self, url: str, retry_after: Optional[float] = None):
+        self.bucket(url).on_throttled(retry_after)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {host: bucket.get_stats() for host, bucket in self._buckets.items()}
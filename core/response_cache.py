@@ -0,0 +1,134 @@
+"""
+Response Cache
+
+In-process TTL cache with stale-while-revalidate and LRU eviction for
+Gamma discovery responses (/sports, /tags, /events, /markets).
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+from urllib.parse import urlsplit
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+
+
+# Cache lookup states
+FRESH = 'fresh'
+STALE = 'stale'
+MISS = 'miss'
+
+
+@dataclass
+class CacheEntry:
+    """A cached response with its freshness window."""
+    value: Any
+    stored_at: float
+    ttl: float
+    stale_ttl: float
+
+    def age(self, now: float) -> float:
+        return now - self.stored_at
+
+
+def gamma_cache_ttl(url: str) -> float:
+    """
+    TTL in seconds for a Gamma discovery URL, or 0 if it shouldn't be cached.
+
+    Only GETs against POLYMARKET_GAMMA_URL are cached; CLOB prices are
+    never served from here.
+    """
+    if not url.startswith(Config.POLYMARKET_GAMMA_URL):
+        return 0
+
+    root = '/' + urlsplit(url).path.lstrip('/').split('/', 1)[0]
+    return Config.CACHE_TTLS.get(root, 0)
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache with per-entry TTL.
+
+    Entries are FRESH for `ttl` seconds and then STALE for a further
+    `stale_ttl` seconds, during which they can still be served while the
+    caller refreshes them in the background.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or Config.CACHE_MAX_ENTRIES
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Tuple[Any, str]:
+        """
+        Look up a key.
+
+        Returns:
+            (value, state) where state is FRESH, STALE or MISS
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None, MISS
+
+        age = entry.age(time.monotonic())
+        if age <= entry.ttl:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value, FRESH
+
+        if age <= entry.ttl + entry.stale_ttl:
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+            return entry.value, STALE
+
+        # Too old to serve normally - kept (until LRU eviction) as a last-resort fallback
+        self.misses += 1
+        return None, MISS
+
+    def peek(self, key: Hashable) -> Any:
+        """Return a value regardless of age (for outage fallback), or None."""
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def set(self, key: Hashable, value: Any, ttl: float, stale_ttl: Optional[float] = None):
+        """Store a value, evicting least-recently-used entries when full."""
+        if stale_ttl is None:
+            stale_ttl = Config.CACHE_STALE_TTL
+
+        self._entries[key] = CacheEntry(value, time.monotonic(), ttl, stale_ttl)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        """Remove a single entry."""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': (self.hits + self.stale_hits) / lookups if lookups else 0.0
+        }
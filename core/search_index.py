@@ -0,0 +1,262 @@
+"""
+Market Search Index
+
+Local inverted index over market questions, group item titles, event
+titles and descriptions. Supports prefix matching and single-edit typo
+tolerance, and ranks by relevance blended with volume. Updated
+incrementally as the catalog adds and removes markets.
+"""
+
+import heapq
+import math
+import re
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+_ALPHABET = 'abcdefghijklmnopqrstuvwxyz0123456789'
+
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'if', 'in', 'is',
+    'it', 'of', 'on', 'or', 'the', 'this', 'to', 'will', 'with'
+})
+
+# Field and match-kind weights
+TITLE_WEIGHT = 1.0     # question, group item title, event title
+BODY_WEIGHT = 0.3      # description
+EXACT = 1.0
+PREFIX = 0.8
+FUZZY = 0.6
+
+MAX_EXPANSIONS = 50    # Vocabulary terms tried per prefix/typo
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def _edits1(term: str) -> set:
+    """All strings one delete, transpose, replace or insert away."""
+    splits = [(term[:i], term[i:]) for i in range(len(term) + 1)]
+    deletes = [l + r[1:] for l, r in splits if r]
+    transposes = [l + r[1] + r[0] + r[2:] for l, r in splits if len(r) > 1]
+    replaces = [l + c + r[1:] for l, r in splits if r for c in _ALPHABET]
+    inserts = [l + c + r for l, r in splits for c in _ALPHABET]
+    return set(deletes + transposes + replaces + inserts)
+
+
+class SearchIndex:
+    """
+    Inverted index with compact postings.
+
+    Each term maps to two sorted arrays of internal doc ids (title hits,
+    body hits). Doc ids only grow, so adds append in order; removals are
+    tombstones that a periodic compaction drops. Keys are caller ids
+    (condition ids); search() returns them best first.
+    """
+
+    def __init__(self):
+        self._keys: List[Optional[str]] = []       # doc id -> key, None once removed
+        self._boost = array('d')                    # Volume multiplier per doc
+        self._doc_of: Dict[str, int] = {}           # key -> live doc id
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._vocab: List[str] = []                 # Sorted terms, for prefix lookup
+        self._new_terms: List[str] = []
+        self._dead = 0
+
+        self.queries = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_of)
+
+    # ═══════════════════════════════════════════════════════════════════
+    # UPDATES
+    # ═══════════════════════════════════════════════════════════════════
+
+    def add(self, key: str, titles: Iterable[str], body: str = '', volume: float = 0.0):
+        """Index (or re-index) a document."""
+        if key in self._doc_of:
+            self.remove(key)
+
+        doc = len(self._keys)
+        self._keys.append(key)
+        self._boost.append(1 + Config.SEARCH_VOLUME_WEIGHT * math.log10(1 + max(0.0, volume)))
+        self._doc_of[key] = doc
+
+        title_terms = set()
+        for text in titles:
+            if text:
+                title_terms.update(tokenize(text))
+        body_terms = set(tokenize(body)) - title_terms if body else ()
+
+        for terms, slot in ((title_terms, 0), (body_terms, 1)):
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array('i'), array('i'))
+                    self._new_terms.append(term)
+                postings[slot].append(doc)
+
+    def remove(self, key: str):
+        doc = self._doc_of.pop(key, None)
+        if doc is None:
+            return
+        self._keys[doc] = None
+        self._dead += 1
+
+        if self._dead > max(1000, len(self._keys) // 4):
+            self.compact()
+
+    def compact(self):
+        """Drop removed docs from every posting list and renumber."""
+        remap = array('i', [-1]) * len(self._keys)
+        keys, boost = [], array('d')
+
+        for doc, key in enumerate(self._keys):
+            if key is not None:
+                remap[doc] = len(keys)
+                keys.append(key)
+                boost.append(self._boost[doc])
+
+        postings = {}
+        for term, lists in self._postings.items():
+            title = array('i', (remap[d] for d in lists[0] if remap[d] >= 0))
+            body = array('i', (remap[d] for d in lists[1] if remap[d] >= 0))
+            if title or body:
+                postings[term] = (title, body)
+
+        self._keys, self._boost, self._postings = keys, boost, postings
+        self._doc_of = {key: doc for doc, key in enumerate(keys)}
+        self._vocab = sorted(postings)
+        self._new_terms = []
+        self._dead = 0
+
+    def _sync_vocab(self):
+        if not self._new_terms:
+            return
+        if len(self._new_terms) > 64:
+            self._vocab = sorted(self._postings)
+        else:
+            for term in self._new_terms:
+                insort(self._vocab, term)
+        self._new_terms = []
+
+    # ═══════════════════════════════════════════════════════════════════
+    # QUERIES
+    # ═══════════════════════════════════════════════════════════════════
+
+    def _expand(self, term: str) -> List[Tuple[str, float]]:
+        """Vocabulary terms a query term may match, with match weight."""
+        matches = []
+        if term in self._postings:
+            matches.append((term, EXACT))
+
+        if len(term) >= 2:
+            i = bisect_left(self._vocab, term)
+            while i < len(self._vocab) and len(matches) < MAX_EXPANSIONS:
+                candidate = self._vocab[i]
+                if not candidate.startswith(term):
+                    break
+                if candidate != term:
+                    matches.append((candidate, PREFIX))
+                i += 1
+
+        # Typo tolerance only when the term is unknown as typed
+        if not matches and len(term) >= 4:
+            for candidate in _edits1(term):
+                if candidate in self._postings:
+                    matches.append((candidate, FUZZY))
+                    if len(matches) >= MAX_EXPANSIONS:
+                        break
+
+        return matches
+
+    def _term_scores(self, matches, live: int, candidates: Optional[Dict[int, float]]) -> Dict[int, float]:
+        """Best per-doc score for one query term (restricted to candidates if given)."""
+        weighted = []
+        for term, match_weight in matches:
+            title, body = self._postings[term]
+            idf = math.log(1 + live / (len(title) + len(body)))
+            if title:
+                weighted.append((match_weight * TITLE_WEIGHT * idf, title))
+            if body:
+                weighted.append((match_weight * BODY_WEIGHT * idf, body))
+
+        # Apply lowest weights first so each doc ends up with its best one
+        weighted.sort(key=lambda wd: wd[0])
+        scores: Dict[int, float] = {}
+
+        for weight, docs in weighted:
+            if candidates is None:
+                scores.update(dict.fromkeys(docs, weight))
+            elif len(docs) <= 8 * len(candidates):
+                scores.update(dict.fromkeys(candidates.keys() & docs, weight))
+            else:
+                n = len(docs)
+                for doc in candidates:
+                    i = bisect_left(docs, doc)
+                    if i < n and docs[i] == doc:
+                        scores[doc] = weight
+
+        return scores
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """Keys of the best matches for a query, best first."""
+        self.queries += 1
+        self._sync_vocab()
+
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._doc_of:
+            return []
+
+        live = len(self._doc_of)
+        expanded = [self._expand(t) for t in terms]
+        expanded = [m for m in expanded if m]
+        if not expanded:
+            return []
+
+        totals: Optional[Dict[int, float]] = None
+
+        # AND: every query term must match; rarest term first keeps the candidate set small
+        if len(expanded) == len(terms):
+            expanded.sort(key=lambda ms: sum(
+                len(self._postings[t][0]) + len(self._postings[t][1]) for t, _ in ms
+            ))
+            for matches in expanded:
+                scores = self._term_scores(matches, live, totals)
+                totals = scores if totals is None else {doc: totals[doc] + s for doc, s in scores.items()}
+                if not totals:
+                    break
+
+        # OR fallback when no document matches every term
+        if not totals:
+            totals = {}
+            for matches in expanded:
+                for doc, s in self._term_scores(matches, live, None).items():
+                    totals[doc] = totals.get(doc, 0) + s
+
+        keys = self._keys
+        boost = self._boost
+        ranked = heapq.nlargest(
+            limit,
+            (doc for doc in totals if keys[doc] is not None),
+            key=lambda doc: totals[doc] * boost[doc]
+        )
+        return [keys[doc] for doc in ranked]
+
+    def get_stats(self) -> Dict[str, int]:
+        postings = sum(len(t) + len(b) for t, b in self._postings.values())
+        return {
+            'docs': len(self._doc_of),
+            'terms': len(self._postings),
+            'postings': postings,
+            'dead': self._dead,
+            'queries': self.queries
+        }
@@ -0,0 +1,60 @@
+"""
+Single-Flight Request Coalescing
+
+Concurrent identical requests share one in-flight call, so a burst of
+users opening the same sport costs one round-trip and one JSON decode.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+def request_key(method: str, url: str, params: Optional[Dict] = None) -> tuple:
+    """Build a hashable key for a request (params are order-independent)."""
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return (method.upper(), url, items)
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls that share a key.
+
+    The first caller (leader) starts the call as its own task; callers that
+    arrive while it is running await the same task. The task is shielded,
+    so a cancelled caller never cancels the shared call for the others.
+    Results are shared by reference - treat them as read-only.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.deduplicated = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn() once per key at a time and share its result."""
+        task = self._inflight.get(key)
+
+        if task is not None:
+            self.deduplicated += 1
+        else:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self._inflight.pop(k, None))
+
+        return await asyncio.shield(task)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._inflight)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        total = self.calls + self.deduplicated
+        return {
+            'calls': self.calls,
+            'deduplicated': self.deduplicated,
+            'in_flight': self.in_flight,
+            'dedup_ratio': self.deduplicated / total if total else 0.0
+        }
@@ -0,0 +1,160 @@
+"""
+Sport Keyword Matcher
+
+Finds every sport keyword in a text in one left-to-right pass. The
+keywords are compiled once into a trie, and the trie is emitted as a
+single regex, so the scan runs in the C regex engine. At each position
+only the branches for the next character are tried, which is the same
+work an Aho-Corasick goto table does. Optional word boundaries stop
+'heat' matching 'wheat' and 'ipl' matching 'triple'.
+
+SportClassifier memoizes the per-sport counts for each event or market
+version, so a market is only scanned once while its text is unchanged.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Build a factored regex alternation (longest branches first) from a word list."""
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = True
+
+    def emit(node: Dict) -> str:
+        terminal = '' in node
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if terminal:
+            # Greedy optional suffix keeps the longest keyword
+            return body + '?' if len(branches) == 1 and len(branches[0]) == 1 else '(?:' + body + ')?'
+        return body
+
+    return emit(trie)
+
+
+class SportMatcher:
+    """
+    Multi-keyword matcher over {sport: [keywords]}.
+
+    With word_boundary=True a keyword must not be glued to other letters
+    or digits (a trailing plural 's' is allowed). counts() returns hits
+    per sport for one text.
+    """
+
+    def __init__(self, keywords: Dict[str, List[str]], word_boundary: bool = True):
+        self.sports = list(keywords)
+        self._sports_for: Dict[str, List[str]] = {}
+        for sport, words in keywords.items():
+            for word in words:
+                sports = self._sports_for.setdefault(word.lower(), [])
+                if sport not in sports:
+                    sports.append(sport)
+
+        pattern = _trie_pattern(self._sports_for)
+        if word_boundary:
+            pattern = rf"(?<![a-z0-9])({pattern})s?(?![a-z0-9])"
+        else:
+            pattern = f"({pattern})"
+        self._regex = re.compile(pattern)
+        self.word_boundary = word_boundary
+
+    def keywords(self, text: str) -> List[str]:
+        """Every keyword occurrence in text (lower-cased input expected)."""
+        return self._regex.findall(text)
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Keyword hits per sport, e.g. {'nba': 2, 'nfl': 1}."""
+        counts: Dict[str, int] = {}
+        for word in self._regex.findall(text.lower()):
+            for sport in self._sports_for[word]:
+                counts[sport] = counts.get(sport, 0) + 1
+        return counts
+
+    def detect(self, text: str) -> str:
+        """Sport with the most hits ('' if none); ties go to the earlier sport."""
+        counts = self.counts(text)
+        if not counts:
+            return ''
+        return max(self.sports, key=lambda s: counts.get(s, 0))
+
+    def matches(self, text: str, sport: Optional[str] = None) -> bool:
+        """True if text has a keyword for `sport` (or for any sport if None)."""
+        lowered = text.lower()
+        if sport is None:
+            return self._regex.search(lowered) is not None
+        for match in self._regex.finditer(lowered):
+            if sport in self._sports_for[match.group(1)]:
+                return True
+        return False
+
+
+class SportClassifier:
+    """
+    Bounded LRU memo of SportMatcher.counts().
+
+    Keyed by (id, hash of the classified text), so an edited question or
+    description is a new entry and the old version simply ages out.
+    Calls without an id are not cached.
+    """
+
+    def __init__(self, matcher: SportMatcher, max_entries: int = 20000):
+        self.matcher = matcher
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Hashable, int], Dict[str, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def counts(self, text: str, key: Hashable = None) -> Dict[str, int]:
+        """Per-sport keyword hits for text, memoized under key. Treat as read-only."""
+        if not key or self.max_entries <= 0:
+            return self.matcher.counts(text)
+
+        entry_key = (key, hash(text))
+        counts = self._entries.get(entry_key)
+        if counts is not None:
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            return counts
+
+        self.misses += 1
+        counts = self.matcher.counts(text)
+        self._entries[entry_key] = counts
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return counts
+
+    def detect(self, text: str, key: Hashable = None) -> str:
+        """Sport with the most hits ('' if none); ties go to the earlier sport."""
+        counts = self.counts(text, key)
+        if not counts:
+            return ''
+        return max(self.matcher.sports, key=lambda s: counts.get(s, 0))
+
+    def matches(self, text: str, sport: Optional[str] = None, key: Hashable = None) -> bool:
+        """True if text has a keyword for `sport` (or for any sport if None)."""
+        counts = self.counts(text, key)
+        return bool(counts) if sport is None else sport in counts
+
+    def clear(self):
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Hit/miss counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': self.hits / lookups if lookups else 0.0
+        }
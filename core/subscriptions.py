@@ -0,0 +1,164 @@
+"""
+Subscription Manager
+
+Decides which tokens the WebSocket price feed follows. Interest is
+ref-counted per holder - open positions, active alerts, favorites, and
+what each user currently has on screen - so a token is subscribed when
+its first holder appears and unsubscribed once the last one has been
+gone for WS_UNSUBSCRIBE_GRACE seconds. Paging back and forth between
+screens therefore doesn't churn subscriptions.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Set
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+from core.ws_client import PriceWebSocketClient, get_ws_client
+
+# fetch() -> token ids a source currently needs (e.g., open positions)
+TokenSource = Callable[[], Awaitable[Iterable[str]]]
+
+# How often idle tokens and expired views are swept
+SWEEP_INTERVAL = 5
+
+
+class SubscriptionManager:
+    """
+    Ref-counted token interest driving a PriceWebSocketClient.
+
+    Each holder (any hashable key, e.g. ('view', user_id)) has one token
+    set; hold() replaces it and the difference is applied to the feed.
+    Holders given a ttl are released automatically when it runs out.
+    Registered sources are polled every WS_SUBSCRIPTION_REFRESH seconds
+    and hold their tokens as ('source', name).
+    """
+
+    def __init__(self, feed: PriceWebSocketClient):
+        self.feed = feed
+        self._tokens_of: Dict[Hashable, Set[str]] = {}
+        self._holders_of: Dict[str, Set[Hashable]] = {}
+        self._expires: Dict[Hashable, float] = {}  # holder -> monotonic expiry
+        self._idle_since: Dict[str, float] = {}  # Still subscribed, no holders
+        self._sources: Dict[str, TokenSource] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.subscribes = 0
+        self.unsubscribes = 0
+
+    async def hold(self, holder: Hashable, token_ids: Iterable[str], ttl: Optional[float] = None):
+        """Set holder's interest to exactly token_ids (empty releases it)."""
+        new = {t for t in token_ids if t}
+        old = self._tokens_of.get(holder, set())
+        now = time.monotonic()
+
+        if new:
+            self._tokens_of[holder] = new
+            if ttl:
+                self._expires[holder] = now + ttl
+            else:
+                self._expires.pop(holder, None)
+        else:
+            self._tokens_of.pop(holder, None)
+            self._expires.pop(holder, None)
+
+        added: List[str] = []
+        for token_id in new - old:
+            holders = self._holders_of.setdefault(token_id, set())
+            # First holder: subscribe, unless it's still subscribed from before
+            if not holders and self._idle_since.pop(token_id, None) is None:
+                added.append(token_id)
+            holders.add(holder)
+
+        for token_id in old - new:
+            holders = self._holders_of.get(token_id)
+            if holders is None:
+                continue
+            holders.discard(holder)
+            if not holders:
+                del self._holders_of[token_id]
+                self._idle_since[token_id] = now
+
+        if added:
+            self.subscribes += len(added)
+            await self.feed.subscribe_many(added)
+
+    async def release(self, holder: Hashable):
+        await self.hold(holder, ())
+
+    def add_source(self, name: str, fetch: TokenSource):
+        """Register a token source polled by the background loop."""
+        self._sources[name] = fetch
+
+    async def refresh_sources(self):
+        """Re-read every source; a failing source keeps its previous tokens."""
+        for name, fetch in self._sources.items():
+            try:
+                token_ids = await fetch()
+            except Exception as e:
+                print(f"⚠️ Subscription source '{name}' failed: {e}")
+                continue
+            await self.hold(('source', name), token_ids)
+
+    async def sweep(self):
+        """Release expired holders, then unsubscribe tokens idle past the grace period."""
+        now = time.monotonic()
+        for holder in [h for h, expires in self._expires.items() if expires <= now]:
+            await self.release(holder)
+
+        cutoff = now - Config.WS_UNSUBSCRIBE_GRACE
+        idle = [t for t, since in self._idle_since.items() if since <= cutoff]
+        if idle:
+            for token_id in idle:
+                del self._idle_since[token_id]
+            self.unsubscribes += len(idle)
+            await self.feed.unsubscribe_many(idle)
+
+    async def _run(self):
+        next_refresh = 0.0
+        while True:
+            try:
+                if time.monotonic() >= next_refresh:
+                    await self.refresh_sources()
+                    next_refresh = time.monotonic() + Config.WS_SUBSCRIPTION_REFRESH
+                await self.sweep()
+            except Exception as e:
+                print(f"⚠️ Subscription manager error: {e}")
+            await asyncio.sleep(SWEEP_INTERVAL)
+
+    def start(self):
+        """Start polling sources and sweeping in the background (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'tokens': len(self._holders_of) + len(self._idle_since),
+            'held': len(self._holders_of),
+            'idle': len(self._idle_since),
+            'holders': len(self._tokens_of),
+            'subscribes': self.subscribes,
+            'unsubscribes': self.unsubscribes
+        }
+
+
+# Singleton instance
+_manager: Optional[SubscriptionManager] = None
+
+def get_subscription_manager() -> SubscriptionManager:
+    """Get the SubscriptionManager singleton (bound to the WS client singleton)."""
+    global _manager
+    if _manager is None:
+        _manager = SubscriptionManager(get_ws_client())
+    return _manager
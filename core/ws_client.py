@@ -2,11 +2,21 @@
 WebSocket Client for Polymarket CLOB
 
 Real-time price updates via WebSocket connection.
+
+Every tick is stamped on arrival so readers can ask for a price no older
+than a staleness bound (get_fresh_price) and fall back to REST otherwise.
+Book snapshots and deltas maintain a local L2 book per token (`books`).
+Subscription changes are collected for WS_SUBSCRIBE_DEBOUNCE and sent as
+multi-asset frames. Tokens are sharded over WS_SHARDS connections. Price
+callbacks run in their own tasks behind latest-value queues, so the
+receive loop never waits on them.
 """
 
 import asyncio
-import json
-from typing import Dict, Callable, Optional, Set
+import time
+import zlib
+from bisect import bisect_right
+from typing import Any, Awaitable, Dict, Callable, Iterable, List, Optional, Set
 from datetime import datetime
 
 try:
@@ -20,167 +30,539 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import Config
+from core import json_codec
+from core.hedging import LatencyTracker
+from core.order_book import OrderBook, OrderBookStore
 
 
-class PriceWebSocketClient:
+class PriceConsumer:
     """
-    WebSocket client for real-time price updates from Polymarket CLOB.
+    One price callback with its own task and a bounded pending map.
+    
+    offer() never blocks the receive loop: a newer price for a token that
+    is still pending replaces the old one (coalesced), and when
+    `max_pending` tokens are waiting the oldest is dropped.
     """
     
-    # Polymarket CLOB WebSocket endpoint
-    WS_URL = "wss://clob.polymarket.com/ws"
+    def __init__(self, callback: Callable[[str, float], Awaitable[None]], name: str, max_pending: int):
+        self.callback = callback
+        self.name = name
+        self.max_pending = max(1, max_pending)
+        self._pending: Dict[str, float] = {}  # Insertion order = delivery order
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+    
+    def offer(self, token_id: str, price: float):
+        pending = self._pending
+        if token_id in pending:
+            self.coalesced += 1
+        elif len(pending) >= self.max_pending:
+            del pending[next(iter(pending))]
+            self.dropped += 1
+        pending[token_id] = price
+        self.max_depth = max(self.max_depth, len(pending))
+        
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        self._wakeup.set()
+    
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                token_id = next(iter(self._pending))
+                price = self._pending.pop(token_id)
+                try:
+                    await self.callback(token_id, price)
+                except Exception as e:
+                    self.errors += 1
+                    print(f"⚠️ Callback error ({self.name}): {e}")
+                self.delivered += 1
     
-    def __init__(self):
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+    
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'depth': len(self._pending),
+            'max_depth': self.max_depth,
+            'delivered': self.delivered,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped,
+            'errors': self.errors
+        }
+
+
+class HashRing:
+    """Consistent token → shard mapping (crc32 ring with virtual nodes)."""
+    
+    def __init__(self, shards: int, replicas: int = 64):
+        points = sorted(
+            (zlib.crc32(f"shard-{i}-{r}".encode()), i)
+            for i in range(shards) for r in range(replicas)
+        )
+        self._keys = [key for key, _ in points]
+        self._shards = [shard for _, shard in points]
+    
+    def shard_for(self, token_id: str) -> int:
+        idx = bisect_right(self._keys, zlib.crc32(token_id.encode()))
+        return self._shards[idx % len(self._shards)]
+
+
+class WebSocketShard:
+    """
+    One connection of the pool: its own socket, subscription set, pending
+    (un)subscribe batch and reconnect backoff. Received messages are
+    handed to the owning client, which keeps the merged state.
+    """
+    
+    def __init__(self, owner: 'PriceWebSocketClient', index: int):
+        self.owner = owner
+        self.index = index
         self._ws = None
-        self._running = False
-        self._subscribed_tokens: Set[str] = set()
-        self._price_cache: Dict[str, float] = {}
-        self._callbacks: list = []
+        self.subscribed: Set[str] = set()
+        self.resyncing: Set[str] = set()  # Tokens awaiting a fresh book snapshot
+        self._pending_subscribe: Set[str] = set()
+        self._pending_unsubscribe: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
         self._reconnect_delay = 1
-        self._max_reconnect_delay = 60
+        self.frames_sent = 0
+        self.messages = 0
+        self.reconnects = 0
+    
+    @property
+    def label(self) -> str:
+        return f"shard {self.index}" if len(self.owner._shards) > 1 else "WebSocket"
     
     @property
     def is_connected(self) -> bool:
-        return self._ws is not None and self._ws.open
+        # _ws is only set while the connection is open
+        return self._ws is not None
     
-    def get_cached_price(self, token_id: str) -> Optional[float]:
-        """Get cached price for a token."""
-        return self._price_cache.get(token_id)
+    def subscribe_many(self, token_ids: Iterable[str]):
+        for token_id in token_ids:
+            if token_id not in self.subscribed:
+                self.subscribed.add(token_id)
+                # A pending unsubscribe is cancelled rather than sent
+                if token_id in self._pending_unsubscribe:
+                    self._pending_unsubscribe.discard(token_id)
+                else:
+                    self._pending_subscribe.add(token_id)
+        self._schedule_flush()
     
-    def add_price_callback(self, callback: Callable[[str, float], None]):
-        """Add callback to be called on price updates."""
-        self._callbacks.append(callback)
+    def unsubscribe_many(self, token_ids: Iterable[str]):
+        for token_id in token_ids:
+            if token_id in self.subscribed:
+                self.subscribed.discard(token_id)
+                self.resyncing.discard(token_id)
+                if token_id in self._pending_subscribe:
+                    self._pending_subscribe.discard(token_id)
+                else:
+                    self._pending_unsubscribe.add(token_id)
+        self._schedule_flush()
     
-    async def subscribe(self, token_id: str):
-        """Subscribe to price updates for a token."""
-        self._subscribed_tokens.add(token_id)
-        
-        if self.is_connected:
-            await self._send_subscribe(token_id)
+    def _schedule_flush(self):
+        """Send pending (un)subscribes once WS_SUBSCRIBE_DEBOUNCE has collected them."""
+        if not (self._pending_subscribe or self._pending_unsubscribe):
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush_later())
     
-    async def unsubscribe(self, token_id: str):
-        """Unsubscribe from price updates for a token."""
-        self._subscribed_tokens.discard(token_id)
-        
-        if self.is_connected:
-            await self._send_unsubscribe(token_id)
+    async def _flush_later(self):
+        await asyncio.sleep(Config.WS_SUBSCRIBE_DEBOUNCE)
+        await self.flush()
     
-    async def _send_subscribe(self, token_id: str):
-        """Send subscribe message to WebSocket."""
-        if not self._ws:
+    async def flush(self):
+        """Send pending subscribe/unsubscribe requests now."""
+        subscribe, self._pending_subscribe = self._pending_subscribe, set()
+        unsubscribe, self._pending_unsubscribe = self._pending_unsubscribe, set()
+        # Books go only now: an unsubscribe cancelled within the debounce
+        # window keeps its book, which the server keeps updating
+        self._drop_books(unsubscribe)
+        # While disconnected, the resubscribe on connect covers everything
+        if not self.is_connected:
             return
         
-        try:
-            msg = {
-                "type": "subscribe",
-                "channel": "price",
-                "assets": [token_id]
-            }
-            await self._ws.send(json.dumps(msg))
-            print(f"📡 Subscribed to price updates for {token_id[:12]}...")
-        except Exception as e:
-            print(f"⚠️ Subscribe error: {e}")
+        if unsubscribe:
+            await self.send_frames('unsubscribe', list(unsubscribe))
+        if subscribe:
+            await self.send_frames('subscribe', list(subscribe))
+            print(f"📡 Subscribed to price updates for {len(subscribe)} token(s) on {self.label}")
     
-    async def _send_unsubscribe(self, token_id: str):
-        """Send unsubscribe message to WebSocket."""
+    def _drop_books(self, token_ids: Iterable[str]):
+        for token_id in token_ids:
+            self.owner.books.discard(token_id)
+    
+    async def send_frames(self, msg_type: str, token_ids: List[str]) -> int:
+        """Send a (un)subscribe as multi-asset frames of WS_SUBSCRIBE_CHUNK tokens; returns frames sent."""
         if not self._ws:
-            return
+            return 0
         
+        chunk = max(1, Config.WS_SUBSCRIBE_CHUNK)
+        sent = 0
         try:
-            msg = {
-                "type": "unsubscribe",
-                "channel": "price",
-                "assets": [token_id]
-            }
-            await self._ws.send(json.dumps(msg))
+            for i in range(0, len(token_ids), chunk):
+                msg = {
+                    "type": msg_type,
+                    "channel": "price",
+                    "assets": token_ids[i:i + chunk]
+                }
+                await self._ws.send(json_codec.dumps(msg))
+                sent += 1
         except Exception as e:
-            print(f"⚠️ Unsubscribe error: {e}")
+            print(f"⚠️ {msg_type.capitalize()} error: {e}")
+        self.frames_sent += sent
+        return sent
     
-    async def connect(self):
-        """Connect to WebSocket and start receiving messages."""
-        if not WEBSOCKETS_AVAILABLE:
-            print("❌ WebSocket not available - websockets package not installed")
-            return
-        
-        self._running = True
-        
-        while self._running:
+    async def run(self):
+        """Connect and receive until the owner stops, reconnecting with backoff."""
+        owner = self.owner
+        while owner._running:
             try:
-                async with websockets.connect(self.WS_URL) as ws:
+                async with websockets.connect(owner.WS_URL) as ws:
                     self._ws = ws
                     self._reconnect_delay = 1
-                    print("✅ WebSocket connected to Polymarket CLOB")
+                    print(f"✅ {self.label} connected to Polymarket CLOB")
                     
-                    # Resubscribe to all tokens
-                    for token_id in self._subscribed_tokens:
-                        await self._send_subscribe(token_id)
+                    # Resubscribe to all tokens in bulk; this covers anything pending
+                    self._pending_subscribe.clear()
+                    self._drop_books(self._pending_unsubscribe)
+                    self._pending_unsubscribe.clear()
+                    if self.subscribed:
+                        started = time.perf_counter()
+                        frames = await self.send_frames('subscribe', list(self.subscribed))
+                        print(f"📡 Resubscribed {len(self.subscribed)} tokens in {frames} frame(s) "
+                              f"on {self.label} ({(time.perf_counter() - started) * 1000:.0f}ms)")
                     
                     # Message loop
                     async for message in ws:
-                        await self._handle_message(message)
+                        self.messages += 1
+                        await owner._handle_message(message)
                         
             except websockets.ConnectionClosed as e:
-                print(f"⚠️ WebSocket connection closed: {e}")
+                print(f"⚠️ {self.label} connection closed: {e}")
             except Exception as e:
-                print(f"⚠️ WebSocket error: {e}")
+                print(f"⚠️ {self.label} error: {e}")
             
             self._ws = None
+            # Deltas were missed; resubscribing resends snapshots
+            owner.books.invalidate(self.subscribed)
+            self.resyncing.clear()
             
-            if self._running:
-                print(f"⏳ Reconnecting in {self._reconnect_delay}s...")
+            if owner._running:
+                self.reconnects += 1
+                print(f"⏳ Reconnecting {self.label} in {self._reconnect_delay}s...")
                 await asyncio.sleep(self._reconnect_delay)
-                self._reconnect_delay = min(self._reconnect_delay * 2, self._max_reconnect_delay)
+                self._reconnect_delay = min(self._reconnect_delay * 2, owner._max_reconnect_delay)
+    
+    async def close(self):
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        if self._ws:
+            await self._ws.close()
+            self._ws = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'connected': self.is_connected,
+            'subscribed': len(self.subscribed),
+            'messages': self.messages,
+            'reconnects': self.reconnects
+        }
+
+
+class PriceWebSocketClient:
+    """
+    WebSocket client for real-time price updates from Polymarket CLOB.
+    
+    Tokens are spread over WS_SHARDS connections by consistent hashing;
+    each shard reconnects on its own, so one dropped socket only stalls
+    its share of tokens. Prices, books and callbacks are shared by all
+    shards, so the public API looks like a single connection.
+    """
+    
+    # Polymarket CLOB WebSocket endpoint
+    WS_URL = "wss://clob.polymarket.com/ws"
+    
+    def __init__(self, shards: Optional[int] = None):
+        self._running = False
+        self._shards = [WebSocketShard(self, i) for i in range(max(1, shards or Config.WS_SHARDS))]
+        self._ring = HashRing(len(self._shards))
+        self._price_cache: Dict[str, float] = {}
+        self._tick_at: Dict[str, float] = {}  # token -> monotonic receive time
+        self.books = OrderBookStore()
+        self._consumers: List[PriceConsumer] = []
+        self._max_reconnect_delay = 60
+        self._alerts_registered = False
+        
+        # Freshness metrics: reads served / stale / missing, tick ages, feed lag
+        self._ages = LatencyTracker(window=500)
+        self.hits = 0
+        self.stale = 0
+        self.misses = 0
+    
+    def _shard(self, token_id: str) -> WebSocketShard:
+        return self._shards[self._ring.shard_for(token_id)]
+    
+    @property
+    def is_connected(self) -> bool:
+        """True while every shard is connected."""
+        return all(shard.is_connected for shard in self._shards)
+    
+    @property
+    def is_running(self) -> bool:
+        return self._running
+    
+    def is_subscribed(self, token_id: str) -> bool:
+        return token_id in self._shard(token_id).subscribed
+    
+    def is_live(self, token_id: str) -> bool:
+        """True if the token is subscribed and its shard is connected."""
+        shard = self._shard(token_id)
+        return shard.is_connected and token_id in shard.subscribed
+    
+    def get_cached_price(self, token_id: str) -> Optional[float]:
+        """Get cached price for a token."""
+        return self._price_cache.get(token_id)
+    
+    def tick_age(self, token_id: str) -> Optional[float]:
+        """Seconds since the last tick for a token, or None if never seen."""
+        received = self._tick_at.get(token_id)
+        return None if received is None else time.monotonic() - received
+    
+    def get_fresh_price(self, token_id: str, max_age: Optional[float] = None) -> Optional[float]:
+        """
+        Cached price if its last tick is at most max_age seconds old
+        (default WS_PRICE_MAX_AGE), else None so the caller goes to REST.
+        """
+        age = self.tick_age(token_id)
+        if age is None:
+            self.misses += 1
+            return None
+        if age > (Config.WS_PRICE_MAX_AGE if max_age is None else max_age):
+            self.stale += 1
+            return None
+        
+        self.hits += 1
+        self._ages.record('tick_age', age)
+        return self._price_cache.get(token_id)
+    
+    def add_price_callback(
+        self,
+        callback: Callable[[str, float], Awaitable[None]],
+        name: Optional[str] = None,
+        max_pending: Optional[int] = None
+    ) -> PriceConsumer:
+        """
+        Add callback to be called on price updates.
+        
+        Each callback runs in its own task, fed through a PriceConsumer
+        holding at most max_pending (default WS_CALLBACK_QUEUE_SIZE)
+        tokens, so a slow callback only ever sees the latest price.
+        Names are made unique ('check_alerts#2') so stats don't collide.
+        """
+        base = name or getattr(callback, '__name__', 'callback')
+        taken = {c.name for c in self._consumers}
+        name, n = base, 1
+        while name in taken:
+            n += 1
+            name = f"{base}#{n}"
+        
+        consumer = PriceConsumer(
+            callback,
+            name,
+            Config.WS_CALLBACK_QUEUE_SIZE if max_pending is None else max_pending
+        )
+        self._consumers.append(consumer)
+        return consumer
+    
+    async def subscribe(self, token_id: str):
+        """Subscribe to price updates for a token (sent with the next batch)."""
+        await self.subscribe_many((token_id,))
+    
+    async def unsubscribe(self, token_id: str):
+        """Unsubscribe from price updates for a token (sent with the next batch)."""
+        await self.unsubscribe_many((token_id,))
+    
+    async def subscribe_many(self, token_ids: Iterable[str]):
+        """Subscribe to several tokens; only new ones are sent, each on its shard."""
+        for shard, tokens in self._by_shard(token_ids).items():
+            shard.subscribe_many(tokens)
+    
+    async def unsubscribe_many(self, token_ids: Iterable[str]):
+        """Unsubscribe from several tokens."""
+        for shard, tokens in self._by_shard(token_ids).items():
+            shard.unsubscribe_many(tokens)
+    
+    def _by_shard(self, token_ids: Iterable[str]) -> Dict[WebSocketShard, List[str]]:
+        groups: Dict[WebSocketShard, List[str]] = {}
+        for token_id in token_ids:
+            if token_id:
+                groups.setdefault(self._shard(token_id), []).append(token_id)
+        return groups
+    
+    async def flush(self):
+        """Send every shard's pending subscribe/unsubscribe requests now."""
+        await asyncio.gather(*(shard.flush() for shard in self._shards))
+    
+    async def connect(self):
+        """Connect every shard and receive messages until disconnect()."""
+        if not WEBSOCKETS_AVAILABLE:
+            print("❌ WebSocket not available - websockets package not installed")
+            return
+        
+        self._running = True
+        tasks = [asyncio.ensure_future(shard.run()) for shard in self._shards]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
     
     async def _handle_message(self, message: str):
-        """Handle incoming WebSocket message."""
+        """Handle incoming WebSocket message (one event or a list of events)."""
         try:
-            data = json.loads(message)
-            
-            msg_type = data.get('type', '')
-            
-            if msg_type == 'price_update' or 'price' in data:
-                token_id = data.get('asset_id', data.get('token_id', ''))
-                price = data.get('price', data.get('mid', 0))
-                
-                if token_id and price:
-                    self._price_cache[token_id] = float(price)
-                    
-                    # Call callbacks
-                    for callback in self._callbacks:
-                        try:
-                            await callback(token_id, float(price))
-                        except Exception as e:
-                            print(f"⚠️ Callback error: {e}")
-            
-            elif msg_type == 'book_update':
-                # Order book update
-                token_id = data.get('asset_id', '')
-                bids = data.get('bids', [])
-                asks = data.get('asks', [])
-                
-                # Calculate midpoint from order book
-                if bids and asks:
-                    best_bid = float(bids[0]['price']) if isinstance(bids[0], dict) else float(bids[0][0])
-                    best_ask = float(asks[0]['price']) if isinstance(asks[0], dict) else float(asks[0][0])
-                    mid = (best_bid + best_ask) / 2
-                    self._price_cache[token_id] = mid
-                    
-        except json.JSONDecodeError:
+            data = json_codec.loads(message)
+            for event in data if isinstance(data, list) else (data,):
+                if isinstance(event, dict):
+                    await self._handle_event(event)
+        except json_codec.JSONDecodeError:
             pass
         except Exception as e:
             print(f"⚠️ Message handling error: {e}")
     
+    async def _handle_event(self, data: Dict):
+        msg_type = data.get('type') or data.get('event_type', '')
+        
+        if msg_type in ('book_update', 'book'):
+            # Full book for one token
+            token_id = data.get('asset_id', '')
+            if token_id:
+                book = self.books.snapshot(
+                    token_id,
+                    data.get('bids') or data.get('buys') or (),
+                    data.get('asks') or data.get('sells') or (),
+                    seq=data.get('seq', data.get('sequence')),
+                    hash=data.get('hash'),
+                    timestamp=data.get('timestamp')
+                )
+                self._shard(token_id).resyncing.discard(token_id)
+                self._record_book_tick(book, data)
+        
+        elif msg_type == 'price_change':
+            # Level deltas: per-event `changes`, or `price_changes` spanning tokens
+            changes: Dict[str, list] = {}
+            hashes: Dict[str, Any] = {}
+            if 'changes' in data:
+                changes[data.get('asset_id', '')] = data['changes']
+                hashes[data.get('asset_id', '')] = data.get('hash')
+            for change in data.get('price_changes') or ():
+                changes.setdefault(change.get('asset_id', ''), []).append(change)
+                hashes[change.get('asset_id', '')] = change.get('hash')
+            
+            for token_id, levels in changes.items():
+                if not token_id:
+                    continue
+                book = self.books.delta(
+                    token_id,
+                    [(c.get('side'), c.get('price'), c.get('size')) for c in levels],
+                    seq=data.get('seq', data.get('sequence')),
+                    hash=hashes.get(token_id),
+                    timestamp=data.get('timestamp')
+                )
+                if book is None:
+                    await self._resync(token_id)
+                self._record_book_tick(book, data)
+        
+        elif msg_type == 'price_update' or 'price' in data:
+            token_id = data.get('asset_id', data.get('token_id', ''))
+            price = data.get('price', data.get('mid', 0))
+            
+            if token_id and price:
+                self._record_tick(token_id, float(price), data)
+                
+                # Hand off to consumers - never awaited here
+                for consumer in self._consumers:
+                    consumer.offer(token_id, float(price))
+    
+    async def _resync(self, token_id: str):
+        """Ask for a fresh snapshot of an out-of-sync book (once until it arrives)."""
+        shard = self._shard(token_id)
+        if token_id in shard.subscribed and token_id not in shard.resyncing:
+            shard.resyncing.add(token_id)
+            await shard.send_frames('subscribe', [token_id])
+    
+    def _record_book_tick(self, book: Optional[OrderBook], data: Dict):
+        """Cache the mid of an in-sync two-sided book as the token's price."""
+        if book is not None and book.synced:
+            mid = book.mid
+            if mid is not None:
+                self._record_tick(book.token_id, mid, data)
+    
+    def _record_tick(self, token_id: str, price: float, data: Dict):
+        """Cache a price with its arrival time; track server-to-bot lag when stamped."""
+        self._price_cache[token_id] = price
+        self._tick_at[token_id] = time.monotonic()
+        
+        stamp = data.get('timestamp')
+        if stamp:
+            try:
+                sent = float(stamp)
+            except (TypeError, ValueError):
+                return
+            if sent > 1e12:  # Milliseconds
+                sent /= 1000
+            self._ages.record('feed_lag', max(0.0, time.time() - sent))
+    
     async def disconnect(self):
         """Disconnect from WebSocket."""
         self._running = False
-        if self._ws:
-            await self._ws.close()
-            self._ws = None
+        for consumer in self._consumers:
+            consumer.stop()
+        for shard in self._shards:
+            await shard.close()
         print("🔌 WebSocket disconnected")
     
     def get_all_cached_prices(self) -> Dict[str, float]:
         """Get all cached prices."""
         return self._price_cache.copy()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Connection state, WS hit ratio and tick freshness for monitoring."""
+        reads = self.hits + self.stale + self.misses
+        
+        def ms(source, pct):
+            value = self._ages.percentile(source, pct)
+            return None if value is None else round(value * 1000, 1)
+        
+        return {
+            'running': self._running,
+            'connected': self.is_connected,
+            'connected_shards': sum(1 for shard in self._shards if shard.is_connected),
+            'shards': [shard.get_stats() for shard in self._shards],
+            'subscribed': sum(len(shard.subscribed) for shard in self._shards),
+            'pending': sum(len(shard._pending_subscribe) + len(shard._pending_unsubscribe) for shard in self._shards),
+            'frames_sent': sum(shard.frames_sent for shard in self._shards),
+            'cached': len(self._price_cache),
+            'hits': self.hits,
+            'stale': self.stale,
+            'misses': self.misses,
+            'hit_ratio': self.hits / reads if reads else 0.0,
+            'tick_age_p50_ms': ms('tick_age', 50),
+            'tick_age_p95_ms': ms('tick_age', 95),
+            'feed_lag_p50_ms': ms('feed_lag', 50),
+            'feed_lag_p95_ms': ms('feed_lag', 95),
+            'books': self.books.get_stats(),
+            'consumers': {c.name: c.get_stats() for c in self._consumers}
+        }
 
 
 # Singleton instance
@@ -198,10 +580,14 @@ async def start_price_monitor(bot=None):
     """
     Start the WebSocket price monitor.
     Optionally pass bot instance for notifications.
+    
+    Meant to run as a background task: connect() handles reconnects, and
+    if the receive loop itself crashes it is restarted after a backoff.
+    Returns once disconnect() is called (or websockets is missing).
     """
     client = get_ws_client()
     
-    if bot:
+    if bot and not client._alerts_registered:
         # Add callback to check alerts on price updates
         async def check_alerts(token_id: str, price: float):
             from core.alerts import get_alert_manager
@@ -224,5 +610,22 @@ async def start_price_monitor(bot=None):
                     print(f"🔔 Alert triggered! {alert.market_question} @ {price*100:.0f}¢")
         
         client.add_price_callback(check_alerts)
+        client._alerts_registered = True
     
-    await client.connect()
+    delay = 1
+    while True:
+        try:
+            await client.connect()
+            return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            for shard in client._shards:
+                shard._ws = None
+            if not client._running:
+                return
+            print(f"⚠️ Price monitor crashed: {e} - restarting in {delay}s")
+            await asyncio.sleep(delay)
+            if not client._running:
+                return
+            delay = min(delay * 2, client._max_reconnect_delay)